@@ -0,0 +1,101 @@
+"""
+Season reload into a local DuckDB file: row-by-row inserts vs. Arrow upserts.
+
+Builds synthetic normalized player splits (36 players x 94 minutes per match) and
+loads them with:
+  - row inserts:    executemany INSERT of every row (the to_sql-style path),
+                    timed on --sample matches and extrapolated to the season
+  - write_match:    DuckDBSink.write_match per match (what export_season does)
+  - season upsert:  one DuckDBSink.upsert of the whole season frame
+
+Every DuckDBSink load is run twice to show re-runs stay idempotent (same row count).
+
+Usage:
+    python benchmarks/bench_duckdb_sink.py [--matches 380] [--sample 5]
+"""
+from __future__ import annotations
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import polars as pl
+
+from tidy_dvms.schemas import PERIODS
+from tidy_dvms.sinks import DuckDBSink
+
+METRICS = [
+    "TotalDistance", "WalkingDistance", "JoggingDistance", "LowSpeedRunningDistance",
+    "HighSpeedRunningDistance", "SprintingDistance", "WalkingCount", "JoggingCount",
+    "LowSpeedRunningCount", "HighSpeedRunningCount", "SprintingCount",
+]
+
+
+def make_match(match_id: int, players: int = 36) -> pl.DataFrame:
+    minutes = list(range(1, 48)) + list(range(46, 93))
+    periods = ["1"] * 47 + ["2"] * 47
+    n = players * len(minutes)
+    rng = np.random.default_rng(match_id)
+    return pl.DataFrame(
+        {
+            "OptaMatchId": [match_id] * n,
+            "OptaPlayerId": [str(100000 + p) for p in range(players) for _ in minutes],
+            "OptaTeamId": [str(1 + p % 2) for p in range(players) for _ in minutes],
+            "Minute": pl.Series(minutes * players, dtype=pl.Int16),
+            "AddedMinute": pl.Series([0] * n, dtype=pl.Int16),
+            "Period": pl.Series(periods * players, dtype=PERIODS),
+            **{name: rng.random(n, dtype=np.float32) * 100 for name in METRICS},
+        }
+    )
+
+
+def row_inserts(path: Path, frames: list[pl.DataFrame]) -> None:
+    con = duckdb.connect(str(path))
+    columns = frames[0].columns
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS players_splits ("
+        + ", ".join(f'"{c}" VARCHAR' if frames[0][c].dtype in (pl.Utf8, PERIODS) else f'"{c}" DOUBLE' for c in columns)
+        + ")"
+    )
+    sql = f"INSERT INTO players_splits VALUES ({', '.join('?' for _ in columns)})"
+    for frame in frames:
+        con.executemany(sql, frame.rows())
+    con.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--matches", type=int, default=380)
+    parser.add_argument("--sample", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = [make_match(2561000 + i) for i in range(args.matches)]
+    season = pl.concat(frames)
+    print(f"season: {args.matches} matches, {season.height:,} rows")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        row_inserts(Path(tmp) / "rows.duckdb", frames[:args.sample])
+        per_match = (time.perf_counter() - start) / args.sample
+        print(f"{'row inserts':<16} {per_match * args.matches:8.2f} s (extrapolated from {args.sample} matches)")
+
+        with DuckDBSink(Path(tmp) / "matches.duckdb") as sink:
+            for run in (1, 2):
+                start = time.perf_counter()
+                for frame in frames:
+                    sink.write_match("8", 2025, str(frame["OptaMatchId"][0]), {"players_splits": frame.to_arrow()})
+                rows = sink.pl("SELECT COUNT(*) AS n FROM players_splits")["n"].item()
+                print(f"{'write_match':<16} {time.perf_counter() - start:8.2f} s  run {run}, {rows:,} rows stored")
+
+        with DuckDBSink(Path(tmp) / "season.duckdb") as sink:
+            for run in (1, 2):
+                start = time.perf_counter()
+                sink.upsert("players_splits", season)
+                rows = sink.pl("SELECT COUNT(*) AS n FROM players_splits")["n"].item()
+                print(f"{'season upsert':<16} {time.perf_counter() - start:8.2f} s  run {run}, {rows:,} rows stored")
+
+
+if __name__ == "__main__":
+    main()
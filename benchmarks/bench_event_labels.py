@@ -0,0 +1,102 @@
+"""
+Event labelling: DuckDB LEFT JOIN on event definitions vs. a positional take.
+
+Labels a synthetic F24-style match (type / outcome names, lineup player names,
+ordering) with
+  - sql:  the previous path, definitions rebuilt per client, registered on DuckDB and
+          joined with TRY_CAST(type_id AS INTEGER) on every row (also timed on a warm
+          engine that already holds the definitions)
+  - take: DVMS._join_events_with_type_labels (process-wide definitions table + gather)
+Both start from the same parsed Arrow events and return the same pandas frame.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_event_labels.py [--events 3000] [--repeat 50]
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import polars as pl
+
+from tidy_dvms import DVMS
+from tidy_dvms.engine import DuckDBEngine
+
+from bench_events_columnar import make_events_xml
+
+LEGACY_SQL = """
+WITH lineup_players AS (
+    SELECT DISTINCT opta_match_id, player_id, player_name
+    FROM lineups_raw
+    WHERE player_id IS NOT NULL
+)
+SELECT
+    COALESCE(NULLIF(e.player_name, ''), l.player_name) AS player_name,
+    e.team_name, e.min, e.sec, e.x, e.y, e.timestamp,
+    COALESCE(d.event_type_name, CONCAT('Unknown ', e.type_id)) AS event_type_name,
+    COALESCE(
+        CASE
+            WHEN e.outcome_code = '0' THEN d.outcome_0
+            WHEN e.outcome_code = '1' THEN d.outcome_1
+            ELSE NULL
+        END,
+        e.outcome_code
+    ) AS outcome,
+    e.fixture, e.game_date
+FROM events_raw e
+LEFT JOIN lineup_players l ON e.opta_match_id = l.opta_match_id AND e.player_id = l.player_id
+LEFT JOIN event_defs d ON TRY_CAST(e.type_id AS INTEGER) = d.type_id
+ORDER BY
+    TRY_CAST(e.min AS INTEGER) NULLS LAST,
+    TRY_CAST(e.sec AS INTEGER) NULLS LAST,
+    TRY_CAST(e.event_id AS BIGINT) NULLS LAST
+"""
+
+
+def make_lineups(n_players: int = 22):
+    return pl.DataFrame(
+        {
+            "opta_match_id": ["12345"] * n_players,
+            "player_id": [str(1000 + i) for i in range(n_players)],
+            "player_name": [f"Player {i}" for i in range(n_players)],
+        }
+    ).to_arrow()
+
+
+def run(n_events: int, repeat: int) -> None:
+    client = DVMS()
+    events = client._parse_events_xml(make_events_xml(n_events), opta_match_id="12345")
+    lineups = make_lineups()
+
+    def sql():
+        # One engine per client: the definitions were rebuilt and registered for each.
+        with DuckDBEngine() as engine:
+            engine.register_static("event_defs", pl.DataFrame(DVMS._build_event_definitions_rows()).to_arrow())
+            return engine.df(LEGACY_SQL, tables={"events_raw": events, "lineups_raw": lineups})
+
+    warm = DuckDBEngine()
+    warm.register_static("event_defs", pl.DataFrame(DVMS._build_event_definitions_rows()).to_arrow())
+
+    def sql_warm():
+        return warm.df(LEGACY_SQL, tables={"events_raw": events, "lineups_raw": lineups})
+
+    def take():
+        return client._join_events_with_type_labels(events, lineups_table=lineups)
+
+    assert sql().equals(take())
+    print(f"{n_events} events, {repeat} matches")
+    for name, fn in (("sql join (new client)", sql), ("sql join (warm engine)", sql_warm), ("take", take)):
+        fn()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        print(f"{name:23s} {(time.perf_counter() - start) / repeat * 1000:8.2f} ms/match")
+    warm.close()
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.events, args.repeat)
@@ -0,0 +1,99 @@
+"""
+Events parsing: per-row dicts vs. direct-to-Arrow column buffers.
+
+Builds a synthetic 3,000-event F24-style match and compares
+  - legacy:   ET.fromstring -> list[dict] -> pl.DataFrame -> Arrow
+  - columnar: DVMS._parse_events_xml (pull parser -> column buffers -> Arrow)
+on wall time and peak traced allocations (tracemalloc).
+
+Usage:
+    python benchmarks/bench_events_columnar.py [--events 3000] [--repeat 20]
+"""
+from __future__ import annotations
+import argparse
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import polars as pl
+
+from tidy_dvms import DVMS
+
+
+def make_events_xml(n_events: int) -> str:
+    events = "".join(
+        f'<Event id="{i}" event_id="{i}" type_id="{(1, 4, 7, 16, 44)[i % 5]}" period_id="{1 + i // 1500}" '
+        f'min="{i // 33}" sec="{i % 60}" team_id="{(100, 200)[i % 2]}" outcome="{i % 2}" '
+        f'x="{i % 100}.0" y="{i % 68}.0" timestamp="2026-03-29T15:{i // 60 % 60:02d}:{i % 60:02d}.000" '
+        f'player_id="p{1000 + i % 22}">'
+        + "".join(f'<Q id="{i}{q}" qualifier_id="{q}" value="{q}"/>' for q in range(6))
+        + "</Event>"
+        for i in range(n_events)
+    )
+    return (
+        '<Games><Game id="12345" home_team_id="100" away_team_id="200" '
+        'home_team_name="Home FC" away_team_name="Away FC" game_date="2026-03-29T15:00:00">'
+        f"{events}</Game></Games>"
+    )
+
+
+def legacy_parse(xml_text: str):
+    """The previous implementation: full tree + one dict per event."""
+    root = ET.fromstring(xml_text)
+    rows = []
+    for game in root.findall(".//Game"):
+        for event in game.findall("Event"):
+            rows.append(
+                {
+                    "opta_match_id": "12345",
+                    "event_id": event.get("id"),
+                    "player_id": (event.get("player_id") or "")[1:] or None,
+                    "type_id": event.get("type_id"),
+                    "outcome_code": event.get("outcome"),
+                    "player_name": event.get("player_name"),
+                    "team_name": event.get("team_name"),
+                    "min": event.get("min"),
+                    "sec": event.get("sec"),
+                    "x": event.get("x"),
+                    "y": event.get("y"),
+                    "timestamp": event.get("timestamp"),
+                    "fixture": "Home FC - Away FC",
+                    "game_date": game.get("game_date"),
+                }
+            )
+    return pl.DataFrame(rows).to_arrow()
+
+
+def measure(fn, xml_text: str, repeat: int) -> tuple[float, float]:
+    fn(xml_text)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(xml_text)
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+
+    tracemalloc.start()
+    fn(xml_text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 2**20
+
+
+def run(n_events: int, repeat: int) -> None:
+    xml_text = make_events_xml(n_events)
+    client = DVMS()
+
+    def columnar(text: str):
+        return client._parse_events_xml(text, opta_match_id="12345")
+
+    print(f"payload: {len(xml_text) / 2**20:.1f} MiB, {n_events} events")
+    for name, fn in (("legacy (rows)", legacy_parse), ("columnar", columnar)):
+        ms, peak = measure(fn, xml_text, repeat)
+        print(f"{name:14s} {ms:8.1f} ms/match   peak {peak:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.events, args.repeat)
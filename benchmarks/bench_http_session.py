@@ -0,0 +1,72 @@
+"""
+Requests/sec for asset downloads against a local stand-in DVMS server.
+
+Compares the old per-call ``requests.get`` path (new TCP connection per
+download) with the pooled keep-alive session owned by ``DVMS``.
+
+Usage:
+    python benchmarks/bench_http_session.py [--requests 500] [--payload-kb 32]
+"""
+from __future__ import annotations
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from tidy_dvms import DVMS
+
+
+def make_server(payload: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(n_requests: int, payload_kb: int) -> None:
+    server = make_server(b"x" * (payload_kb * 1024))
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    url = f"{base_url}/dvms/8/fixtures/fixture-1/download/asset-1"
+
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        r = requests.get(url, timeout=30)
+        r.raise_for_status()
+        r.text
+    unpooled = n_requests / (time.perf_counter() - start)
+
+    client = DVMS()
+    client.BASE_URL = base_url
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        client._download_asset_text("8", "fixture-1", "asset-1")
+    pooled = n_requests / (time.perf_counter() - start)
+    client.close()
+    server.shutdown()
+
+    print(f"requests.get (no pool): {unpooled:8.1f} req/s")
+    print(f"DVMS pooled session:    {pooled:8.1f} req/s")
+    print(f"speed-up:               {pooled / unpooled:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--payload-kb", type=int, default=32)
+    args = parser.parse_args()
+    run(args.requests, args.payload_kb)
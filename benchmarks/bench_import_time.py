@@ -0,0 +1,82 @@
+"""
+Start-up cost of tidy_dvms: wall time of fresh interpreters importing the package.
+
+Each statement runs in a new subprocess (no warm module cache), repeated and reported
+as the median; the interpreter's own start-up is measured the same way and subtracted.
+The heavy dependencies each statement left in sys.modules are listed, and
+--max-ms makes the script exit non-zero when `import tidy_dvms` exceeds the budget.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import_time.py [--repeat 7] [--max-ms 50]
+"""
+from __future__ import annotations
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY = ("polars", "pandas", "duckdb", "pyarrow", "requests", "sqlalchemy", "numpy")
+
+STATEMENTS = {
+    "python (baseline)": "pass",
+    "import tidy_dvms": "import tidy_dvms",
+    "import tidy_dvms.cli": "import tidy_dvms.cli",
+    "from tidy_dvms import DVMS": "from tidy_dvms import DVMS",
+    "DVMS()": "from tidy_dvms import DVMS; DVMS().close()",
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str, repeat: int) -> tuple[float, float, list[str]]:
+    """(median in-process import seconds, median process wall seconds, heavy modules loaded)."""
+    inner, outer, loaded = [], [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        outer.append(time.perf_counter() - start)
+        result = json.loads(out.strip().splitlines()[-1])
+        inner.append(result["seconds"])
+        loaded = result["loaded"]
+    return statistics.median(inner), statistics.median(outer), loaded
+
+
+def run(repeat: int, max_ms: float | None) -> int:
+    baseline = None
+    package_ms = 0.0
+    print(f"{'statement':<28} {'import':>9} {'process':>9}  heavy modules loaded")
+    for label, statement in STATEMENTS.items():
+        inner, outer, loaded = measure(statement, repeat)
+        if baseline is None:
+            baseline = outer
+        if label == "import tidy_dvms":
+            package_ms = inner * 1000
+        print(
+            f"{label:<28} {inner * 1000:7.1f}ms {(outer - baseline) * 1000:+7.1f}ms  "
+            f"{', '.join(loaded) or '-'}"
+        )
+    if max_ms is not None and package_ms > max_ms:
+        print(f"import tidy_dvms took {package_ms:.1f} ms, budget {max_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail when `import tidy_dvms` is slower")
+    args = parser.parse_args()
+    sys.exit(run(args.repeat, args.max_ms))
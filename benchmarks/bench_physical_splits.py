@@ -0,0 +1,97 @@
+"""
+Physical splits blocks: per-block rescans vs. a single per-file pre-pass.
+
+Builds a synthetic splits file (36 players + 2 team blocks, 2 x 47 minutes) and
+compares, per file:
+  - legacy:    the original PhysicalSplit.transform_dataframe, called once per block
+               (re-filters 'Minute Splits', recomputes halves / fixture / date,
+               transposes a pandas frame every time)
+  - one pass:  parse_split_blocks (SplitsLayout pre-pass, all blocks in a single reshape)
+
+Usage:
+    python benchmarks/bench_physical_splits.py [--players 36] [--repeat 50]
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import pandas as pd
+
+from tidy_dvms.physical_splits.blocks import parse_split_blocks
+from tidy_dvms.transformers import get_halves
+
+METRICS = [
+    "Total Distance", "Walking Distance", "Jogging Distance", "Low Speed Running Distance",
+    "High Speed Running Distance", "Sprinting Distance", "Walking Count", "Jogging Count",
+    "Low Speed Running Count", "High Speed Running Count", "Sprinting Count",
+]
+
+
+def make_splits_rows(n_blocks: int) -> list[list[str]]:
+    minutes = [str(m) for m in range(1, 48)] + [""] + [str(m) for m in range(46, 93)]
+    rows = [["Physical Splits"], ["Home FC v Away FC : 2026-03-29"], ["2561923"]]
+    rows += [[f"info {i}"] for i in range(6)]
+    rows.append(["Minute Splits", *minutes])
+    for b in range(n_blocks):
+        rows.append([f"Player {b} ({100000 + b})"])
+        for m, metric in enumerate(METRICS):
+            rows.append([metric, *("" if not h else f"{(b + m + int(h)) % 97}.5" for h in minutes)])
+    return rows
+
+
+def legacy_transform_dataframe(data_list, row_1, row_2, player_inx, file_name):
+    """The previous implementation, verbatim apart from `self`."""
+    min_headers = data_list[9][1:]
+    data_list = [row for row in data_list if 'Minute Splits' not in row]
+    data = data_list[row_1:row_2]
+    match_id = data_list[2][0]
+    fixture = data_list[1][0].split(' : ')[0]
+    match_date = data_list[1][0].split(' : ')[1]
+    df = pd.DataFrame(data).transpose()
+    df.columns = df.iloc[0]
+    df = df.iloc[1:]
+    half = get_halves(min_headers)
+    min_headers = [x for x in min_headers if x.strip()]
+    df = df[df['Total Distance'] != '']
+    df['Period'] = half
+    df['Minute'] = min_headers
+    player_info = data_list[player_inx][0].split('(')
+    player_id = player_info[1].replace(')', '')
+    df['Player ID'] = player_id
+    df['Fixture ID'] = file_name
+    df['Fixture'] = fixture
+    df['Match Date'] = match_date
+    return df
+
+
+def timed(fn, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=36)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    n_blocks = args.players + 2
+    rows = make_splits_rows(n_blocks)
+    spans = [(10 + 12 * i, 21 + 12 * i, 9 + 12 * i) for i in range(n_blocks)]
+
+    def legacy():
+        return pd.concat(legacy_transform_dataframe(rows, r1, r2, pi, "2561923") for r1, r2, pi in spans)
+
+    def one_pass():
+        return parse_split_blocks(rows, "2561923")
+
+    print(f"splits file: {len(rows)} rows, {n_blocks} blocks")
+    for label, fn in (("legacy (per block)", legacy), ("one pass", one_pass)):
+        print(f"{label:<22} {timed(fn, args.repeat) * 1000:8.2f} ms/file")
+
+
+if __name__ == "__main__":
+    main()
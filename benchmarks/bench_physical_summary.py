@@ -0,0 +1,209 @@
+"""
+Physical summary: pandas + DuckDB views vs. a pure Polars pipeline.
+
+Builds a synthetic 40-player summary CSV and compares, per match:
+  - legacy:  pandas DataFrame -> four chained DuckDB views -> .pl() -> .to_pandas()
+  - polars:  transform_physical_total (Polars joins, returns pl.DataFrame)
+on wall time, peak RSS growth and peak traced Python allocations.
+
+Usage:
+    python benchmarks/bench_physical_summary.py [--players 40] [--repeat 50]
+"""
+from __future__ import annotations
+import argparse
+import resource
+import time
+import tracemalloc
+
+import duckdb
+import pandas as pd
+import polars as pl
+
+from tidy_dvms.physical_total.transform_physical_total import TOTAL_COLUMNS, transform_physical_total
+
+
+def make_inputs(n_players: int):
+    rows = [[""] * 5 for _ in range(10)]
+    rows[1] = ["Home FC v Away FC", "Match ID: 2561923"]
+    rows[4] = ["Game Time", "", "97:10", "48:05", "49:05"]
+    rows[6] = ["Home EPT", "", "55:00", "27:30", "27:30"]
+    rows[7] = ["Away EPT", "", "54:00", "27:00", "27:00"]
+    rows[9] = ["ID", "Player", *TOTAL_COLUMNS]
+    for p in range(n_players):
+        rows.append([str(p), f"Player {p}", *(f"{(p * 7 + i) % 97}.5" for i in range(len(TOTAL_COLUMNS)))])
+    lineups = pl.DataFrame(
+        {
+            "optaId": [str(p) for p in range(n_players)],
+            "ssiId": [f"ssi-{p}" for p in range(n_players)],
+            "optaTeamId": ["10" if p % 2 else "20" for p in range(n_players)],
+        }
+    )
+    fixtures = pd.DataFrame(
+        {
+            "fixtureId": [f"fx-{i}" for i in range(380)],
+            "optaMatchId": [str(2561923 + i) for i in range(380)],
+            "optaHomeTeamId": ["10"] + ["30"] * 379,
+            "optaAwayTeamId": ["20"] + ["40"] * 379,
+            "homeTeamName": ["Home FC"] * 380,
+            "awayTeamName": ["Away FC"] * 380,
+        }
+    )
+    return rows, fixtures, lineups
+
+
+def legacy_transform_physical_total(cleaned_data, df_fixtures, df_matchlineups, opta_matchid):
+    """The previous implementation: pandas frame -> DuckDB views -> .pl() -> .to_pandas()."""
+
+    data = cleaned_data[10:]
+
+    # Get headers   
+    headers = cleaned_data[9]
+
+    if len(headers) == 24:
+
+        # Get Totals
+        # Game Time
+        game_time_row = cleaned_data[4]
+
+        total_game_time = game_time_row[2]
+        first_half_time = game_time_row[3]
+        second_half_time = game_time_row[4]
+
+        # Home EPT Time
+        home_ept_row = cleaned_data[6]
+        
+        home_ept_total = home_ept_row[2]
+        home_ept_fh = home_ept_row[3]
+        home_ept_sh = home_ept_row[4]
+
+        # Away EPT Time
+        away_ept_row = cleaned_data[7]
+        
+        away_ept_total = away_ept_row[2]
+        away_ept_fh = away_ept_row[3]
+        away_ept_sh = away_ept_row[4]
+
+
+        # Execute the SQL query to select all data from the view
+        df = pd.DataFrame(data=data, columns=headers)
+        df = df[df['Player'] != 'Player']
+
+        # Create a DuckDB connection and register the DataFrame as a view
+        conn = duckdb.connect()
+
+        # Register DataFrames as a view
+        conn.register('physical_total', df)
+        conn.register('fixtures', df_fixtures)
+        conn.register('matchlineups', df_matchlineups)
+
+        # Get PlayerId (identify Opta or SS Player Id)
+        match_id = cleaned_data[1][1].split(': ')[1]
+        player_id = "ssiId" if len(match_id) > 10 else "OptaPlayerId"
+
+        # Join with Lineups view to get OptaTeamIds
+        conn.execute(f''' 
+            CREATE VIEW physical_total_1 AS
+            SELECT 
+                {opta_matchid} AS OptaMatchId,      
+                ml.OptaPlayerId, "Player", "Minutes", "Distance", "Walking",
+                "Jogging", "Running", "High Speed Running", "Sprinting",
+                "No. of High Intensity Runs", "Top Speed", "Average Speed",
+                "Distance TIP", "HSR Distance TIP", "Sprint Distance TIP",
+                "No. of High Intensity Runs TIP", "Distance OTIP", "HSR Distance OTIP",
+                "Sprint Distance OTIP", "No. of High Intensity Runs OTIP",
+                "Distance BOP", "HSR Distance BOP", "Sprint Distance BOP",
+                "No. of High Intensity Runs BOP"
+                ,ml.OptaTeamId
+            FROM physical_total pt
+            JOIN (SELECT OptaId AS OptaPlayerId, ssiId, optaTeamId FROM matchlineups) AS ml ON pt.ID = ml.{player_id}
+            ''') 
+
+        # Create Home/Away side
+        conn.execute(f'''
+            CREATE VIEW physical_total_2 AS
+            SELECT 
+                pt."OptaMatchId", OptaPlayerId, "OptaTeamId" AS OptaTeamId, f."Side", 
+                "Minutes", "Distance", "Walking", "Jogging", "Running", "High Speed Running" AS HighSpeedRunning, 
+                "Sprinting", "No. of High Intensity Runs" AS HighIntensityRuns, "Top Speed" AS TopSpeed, 
+                "Average Speed" AS AverageSpeed, "Distance TIP" AS DistanceTIP, "HSR Distance TIP" AS HSRDistanceTIP, 
+                "Sprint Distance TIP" AS SprintDistanceTIP, "No. of High Intensity Runs TIP" AS HighIntensityRunsTIP, 
+                "Distance OTIP" AS DistanceOTIP, "HSR Distance OTIP" AS HSRDistanceOTIP, "Sprint Distance OTIP" AS SprintDistanceOTIP, 
+                "No. of High Intensity Runs OTIP" AS HighIntensityRunsOTIP, "Distance BOP" AS DistanceBOP, 
+                "HSR Distance BOP" AS HSRDistanceBOP, "Sprint Distance BOP" AS SprintDistanceBOP, 
+                "No. of High Intensity Runs BOP" AS HighIntensityRunsBOP
+            FROM physical_total_1 pt
+            JOIN 
+            (
+                SELECT fixtureId, OptaMatchId, OptaHomeTeamId AS TeamId, 'Home' AS Side
+                FROM fixtures WHERE OptaMatchId = {opta_matchid}
+                UNION
+                SELECT fixtureId, OptaMatchId, OptaAwayTeamId AS TeamId, 'Away' AS Side
+                FROM fixtures WHERE OptaMatchId = {opta_matchid}
+            ) AS f ON f.OptaMatchId = pt.OptaMatchId AND pt.OptaTeamId=f.TeamId
+            ''')
+        
+        # Combine Home + Away team
+        conn.execute(f'''
+            CREATE VIEW final_table AS
+            SELECT 
+                *, '{home_ept_fh}' AS EPTFirstHalf, '{home_ept_sh}' AS EPTSecondHalf, '{home_ept_total}' AS EPTTotal
+                FROM physical_total_2
+                WHERE Side = 'Home'
+                UNION
+                SELECT *, '{away_ept_fh}' AS EPTFirstHalf, '{away_ept_sh}' AS EPTSecondHalf, '{away_ept_total}' AS EPTTotal
+            FROM physical_total_2
+            WHERE Side = 'Away'
+            ''')
+
+        # final df
+        final_df = conn.execute(f'''
+            SELECT  
+                OptaMatchId, REPLACE("OptaPlayerId", 'Unknown opta', '0') AS "OptaPlayerId", 
+                OptaTeamId, Minutes, Distance, Walking, Jogging, Running, HighSpeedRunning, 
+                Sprinting, HighIntensityRuns, TopSpeed, AverageSpeed, DistanceTIP, HSRDistanceTIP, 
+                SprintDistanceTIP, HighIntensityRunsTIP, DistanceOTIP, HSRDistanceOTIP, 
+                SprintDistanceOTIP, HighIntensityRunsOTIP, DistanceBOP, HSRDistanceBOP, 
+                SprintDistanceBOP, HighIntensityRunsBOP, EPTFirstHalf, EPTSecondHalf, EPTTotal,
+                '{first_half_time}' AS FHTime, '{second_half_time}' AS SHTime, '{total_game_time}' AS TotalGameTime
+            FROM final_table
+            ''').pl()
+
+        final_df = final_df.to_pandas()
+
+        return final_df
+
+
+def measure(fn, repeat: int) -> tuple[float, float, float]:
+    fn()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    return elapsed, peak / 2**20, rss_growth / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows, fixtures, lineups = make_inputs(args.players)
+    lineups_pd = lineups.to_pandas()
+
+    # Polars first: ru_maxrss only grows, so the legacy run cannot hide behind it.
+    for label, fn in (
+        ("polars", lambda: transform_physical_total(rows, fixtures, lineups, "2561923")),
+        ("legacy (duckdb)", lambda: legacy_transform_physical_total(rows, fixtures, lineups_pd, 2561923)),
+    ):
+        elapsed, traced, rss = measure(fn, args.repeat)
+        print(f"{label:<16} {elapsed * 1000:8.2f} ms/match   traced peak {traced:6.2f} MiB   max RSS +{rss:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
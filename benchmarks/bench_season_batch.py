@@ -0,0 +1,95 @@
+"""
+Season splits: one transform per match vs. one batch over every match.
+
+Builds N synthetic matches (2 teams + 18 players each, 2 x 47 minutes) and compares
+  - per match:  PhysicalSplit.transform_physical_splits, once per match
+  - batch:      transform_physical_splits_batch over all matches (4 queries in total)
+on the shared DuckDB engine.
+
+Usage:
+    python benchmarks/bench_season_batch.py [--matches 380]
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import pandas as pd
+
+from tidy_dvms.engine import DuckDBEngine
+from tidy_dvms.physical_splits.transform_physical_splits import PhysicalSplit, transform_physical_splits_batch
+
+METRICS = [
+    "Total Distance", "Walking Distance", "Jogging Distance", "Low Speed Running Distance",
+    "High Speed Running Distance", "Sprinting Distance", "Walking Count", "Jogging Count",
+    "Low Speed Running Count", "High Speed Running Count", "Sprinting Count",
+]
+PLAYERS_PER_TEAM = 9
+
+
+def make_match(match_id: int):
+    home, away = str(match_id * 10), str(match_id * 10 + 1)
+    players = {home: [f"{match_id}{p:02d}" for p in range(PLAYERS_PER_TEAM)],
+               away: [f"{match_id}{p:02d}" for p in range(PLAYERS_PER_TEAM, 2 * PLAYERS_PER_TEAM)]}
+    minutes = [str(m) for m in range(1, 48)] + [""] + [str(m) for m in range(46, 93)]
+    rows = [["Physical Splits"], ["Home v Away : 2026-03-29"], [str(match_id)]]
+    rows += [[f"info {i}"] for i in range(6)]
+    rows.append(["Minute Splits", *minutes])
+    for team, ids in players.items():
+        for block_id in (team, *ids):
+            rows.append([f"Name ({block_id})"])
+            for m, metric in enumerate(METRICS):
+                rows.append([metric, *("" if not h else f"{(m + int(h)) % 97}.5" for h in minutes)])
+    lineups = pd.DataFrame(
+        {
+            "OptaId": [p for ids in players.values() for p in ids],
+            "ssiId": [f"ssi-{p}" for ids in players.values() for p in ids],
+            "optaTeamId": [team for team, ids in players.items() for _ in ids],
+            "name": [f"Player {p}" for ids in players.values() for p in ids],
+            "number": list(range(2 * PLAYERS_PER_TEAM)),
+            "position": ["MF"] * (2 * PLAYERS_PER_TEAM),
+            "homeOptaId": [home] * (2 * PLAYERS_PER_TEAM),
+            "awayOptaId": [away] * (2 * PLAYERS_PER_TEAM),
+        }
+    )
+    return str(match_id), rows, lineups, (home, away)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--matches", type=int, default=380)
+    args = parser.parse_args()
+
+    matches = [make_match(100000 + i) for i in range(args.matches)]
+    fixtures = pd.DataFrame(
+        {
+            "fixtureId": [f"fx-{mid}" for mid, *_ in matches],
+            "OptaMatchId": [mid for mid, *_ in matches],
+            "OptaHomeTeamId": [teams[0] for *_, teams in matches],
+            "OptaAwayTeamId": [teams[1] for *_, teams in matches],
+            "homeTeamName": ["Home FC"] * len(matches),
+            "awayTeamName": ["Away FC"] * len(matches),
+        }
+    )
+    engine = DuckDBEngine()
+    engine.register_static("fixtures", fixtures)
+
+    start = time.perf_counter()
+    per_match_rows = 0
+    for mid, rows, lineups, _ in matches:
+        split = PhysicalSplit(None, 2025, 8, mid, lineups, fixtures, engine=engine)
+        per_match_rows += len(split.transform_physical_splits(rows, mid)[1])
+    per_match = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_rows = len(
+        transform_physical_splits_batch([(mid, rows, lineups) for mid, rows, lineups, _ in matches], fixtures, engine=engine)[1]
+    )
+    batch = time.perf_counter() - start
+
+    print(f"{args.matches} matches, {batch_rows} normalized player rows (per match: {per_match_rows})")
+    print(f"per match   {per_match:8.2f} s   ({per_match / args.matches * 1000:.1f} ms/match)")
+    print(f"batch       {batch:8.2f} s   ({batch / args.matches * 1000:.1f} ms/match)")
+
+
+if __name__ == "__main__":
+    main()
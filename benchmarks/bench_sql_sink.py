@@ -0,0 +1,60 @@
+"""
+Loading season splits into SQLite: pandas to_sql vs. SQLSink.
+
+Synthetic normalized player splits (36 players x 94 minutes per match) are loaded
+into a fresh SQLite file with:
+  - to_sql:          players.to_pandas().to_sql(..., if_exists="append") as in the README
+  - to_sql multi:    the same with method="multi" (multi-row VALUES, chunks sized
+                     under SQLite's bound-parameter limit)
+  - SQLSink.load:    typed table + one DBAPI executemany of tuples per batch
+
+Usage:
+    python benchmarks/bench_sql_sink.py [--matches 100] [--batch-size 10000]
+"""
+from __future__ import annotations
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+import sqlalchemy as sa
+
+from bench_duckdb_sink import make_match
+from tidy_dvms.sinks import SQLSink
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    season = pl.concat([make_match(2561000 + i) for i in range(args.matches)])
+    print(f"{args.matches} matches, {season.height:,} rows")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def engine(name: str) -> sa.Engine:
+            return sa.create_engine(f"sqlite:///{Path(tmp) / name}.sqlite")
+
+        loads = {
+            "to_sql": lambda: season.to_pandas().to_sql(
+                "players_splits", engine("to_sql"), if_exists="append", index=False
+            ),
+            "to_sql multi": lambda: season.to_pandas().to_sql(
+                "players_splits", engine("multi"), if_exists="append", index=False,
+                method="multi", chunksize=32_000 // season.width,
+            ),
+            "SQLSink.load": lambda: SQLSink(engine("sink"), batch_size=args.batch_size).load(
+                "players_splits", season
+            ),
+        }
+        for label, load in loads.items():
+            start = time.perf_counter()
+            load()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<14} {elapsed:7.2f} s  {season.height / elapsed:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
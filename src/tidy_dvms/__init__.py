@@ -1,3 +1,21 @@
-from .client import DVMS
+from __future__ import annotations
+import typing as t
 
-__all__ = ["DVMS"]
+from tidy_dvms import _lazy
+
+if t.TYPE_CHECKING:
+    from .async_client import AsyncDVMS
+    from .client import DVMS
+
+__all__ = ["DVMS", "AsyncDVMS"]
+
+# Public name -> module that defines it. Modules are imported on first attribute
+# access, so `import tidy_dvms` (and the CLI) does not load polars, pyarrow,
+# requests or duckdb until a client is actually used.
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "DVMS": ".client",
+        "AsyncDVMS": ".async_client",
+    },
+)
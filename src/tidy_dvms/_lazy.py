@@ -0,0 +1,34 @@
+from __future__ import annotations
+import importlib
+import sys
+import typing as t
+
+
+def attach(
+    module_name: str,
+    names: t.Mapping[str, str],
+) -> tuple[t.Callable[[str], t.Any], t.Callable[[], list[str]]]:
+    """
+    Module-level __getattr__ and __dir__ that import public names on first access.
+
+    Args:
+        module_name: __name__ of the module exposing the names
+        names: public name -> module defining it (relative to module_name, or absolute)
+
+    Usage:
+        __getattr__, __dir__ = _lazy.attach(__name__, {"DVMS": ".client"})
+    """
+
+    def __getattr__(name: str) -> t.Any:
+        if name not in names:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(names[name], module_name), name)
+        # Cache on the module so later lookups skip __getattr__.
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        module = sys.modules[module_name]
+        return sorted({*vars(module), *getattr(module, "__all__", names)})
+
+    return __getattr__, __dir__
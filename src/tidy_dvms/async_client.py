@@ -0,0 +1,585 @@
+from __future__ import annotations
+import asyncio
+import json
+import os
+import typing as t
+
+import pyarrow as pa
+
+from tidy_dvms.catalog import CatalogSnapshot
+from tidy_dvms.client import DVMS
+from tidy_dvms.sync import SyncEngine
+
+if t.TYPE_CHECKING:
+    from tidy_dvms.sinks.base import Sink
+
+
+def _require_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "AsyncDVMS requires aiohttp. Install it with: pip install 'tidy_dvms[async]'"
+        ) from e
+    return aiohttp
+
+
+class AsyncDVMS:
+    """
+    asyncio-native DVMS client.
+
+    Offers fixtures, splits, summary, events, lineups, fetch_many, download_season,
+    splits_many, summary_many and export_season of DVMS, each as a coroutine. HTTP goes
+    through one aiohttp.ClientSession and at most `max_concurrency` requests are in
+    flight at once.
+
+    The client wraps a DVMS that holds the authentication, fixtures context, caches and
+    DuckDB engine; its parsing and transforms run in worker threads so the event loop
+    keeps downloading while a match is being transformed. Streaming tracking data and
+    lazy match bundles are DVMS-only.
+
+    Usage:
+        async with AsyncDVMS(max_concurrency=64) as client:
+            players = await client.splits(opta_match_id=..., competition=..., season=..., creds=...)
+    """
+
+    SUBTYPE_TRACKING = DVMS.SUBTYPE_TRACKING
+    SUBTYPE_EVENTS = DVMS.SUBTYPE_EVENTS
+    SUBTYPE_LINEUPS = DVMS.SUBTYPE_LINEUPS
+    SUBTYPE_METADATA = DVMS.SUBTYPE_METADATA
+    SUBTYPE_SPLITS = DVMS.SUBTYPE_SPLITS
+    SUBTYPE_SUMMARY = DVMS.SUBTYPE_SUMMARY
+    BULK_SUB_TYPES = DVMS.BULK_SUB_TYPES
+
+    def __init__(
+        self,
+        season: int | None = None,
+        competition_name: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        request_timeout: int = 30,
+        request_retries: int = 3,
+        sleep_between_retries: float = 1.0,
+        max_concurrency: int = 32,
+        limit_per_host: int = 32,
+        cache_dir: str | os.PathLike | None = None,
+        cache_max_bytes: int | None = None,
+        fixtures_page_size: int = 100,
+        catalog_dir: str | os.PathLike | None = None,
+        catalog_ttl: float = 3600.0,
+        duckdb_threads: int | None = None,
+        duckdb_memory_limit: str | None = None,
+    ) -> None:
+        self._dvms = DVMS(
+            season,
+            competition_name,
+            request_timeout=request_timeout,
+            request_retries=request_retries,
+            sleep_between_retries=sleep_between_retries,
+            pool_maxsize=max_concurrency,
+            cache_dir=cache_dir,
+            cache_max_bytes=cache_max_bytes,
+            fixtures_page_size=fixtures_page_size,
+            catalog_dir=catalog_dir,
+            catalog_ttl=catalog_ttl,
+            duckdb_threads=duckdb_threads,
+            duckdb_memory_limit=duckdb_memory_limit,
+        )
+        # Authentication is deferred to the first awaited call.
+        if username is not None or password is not None:
+            if not username or not password:
+                raise ValueError("Provide both username and password when initializing AsyncDVMS.")
+            self._dvms._default_creds = {"username": username, "password": password}
+
+        self._max_concurrency = max_concurrency
+        self._limit_per_host = limit_per_host
+        self._semaphore: asyncio.Semaphore | None = None
+        self._http = None
+
+    async def __aenter__(self) -> "AsyncDVMS":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session and the underlying requests session."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        self._dvms.close()
+
+    # ============================
+    # Public API
+    # ============================
+
+    async def fixtures(
+        self,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        format: str = "dataframe",
+    ):
+        """Async counterpart of DVMS.fixtures()."""
+        resolved_competition, resolved_season, resolved_creds = self._dvms._resolve_runtime_context(
+            competition=competition,
+            season=season,
+            creds=creds,
+        )
+        await self._aauthenticate(resolved_creds)
+        await self._aload_fixtures_context(resolved_competition, resolved_season)
+        self._dvms._fixtures_context = self._dvms._build_context_key(
+            resolved_competition,
+            resolved_season,
+            resolved_creds,
+        )
+
+        fmt = format.lower()
+        if fmt == "dataframe":
+            return self._dvms._fixtures_df
+        if fmt == "json":
+            return self._dvms._fixtures_list
+        raise ValueError("format must be 'dataframe' or 'json'")
+
+    async def splits(
+        self,
+        *,
+        opta_match_id: str,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        type: str = "players",
+        model_form: str = "denormalized",
+        as_pandas: bool = True,
+    ):
+        """Async counterpart of DVMS.splits()."""
+        await self._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+
+        metadata_raw, splits_csv = await asyncio.gather(
+            self._adownload_metadata(opta_match_id),
+            self._adownload_physical(opta_match_id, self.SUBTYPE_SPLITS),
+        )
+        frames = await asyncio.to_thread(self._dvms._build_splits, opta_match_id, metadata_raw, splits_csv)
+        return self._dvms._splits_result(self._dvms._select_splits(frames, type=type, model_form=model_form), as_pandas)
+
+    async def summary(
+        self,
+        *,
+        opta_match_id: str,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+    ):
+        """Async counterpart of DVMS.summary()."""
+        await self._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+
+        metadata_raw, summary_csv = await asyncio.gather(
+            self._adownload_metadata(opta_match_id),
+            self._adownload_physical(opta_match_id, self.SUBTYPE_SUMMARY),
+        )
+        return await asyncio.to_thread(self._dvms._build_summary, opta_match_id, metadata_raw, summary_csv)
+
+    async def splits_many(
+        self,
+        opta_match_ids: t.Iterable[str | int] | None = None,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        type: str = "players",
+        model_form: str = "denormalized",
+        max_workers: int | None = None,
+        on_error: str = "raise",
+        as_pandas: bool = True,
+    ):
+        """Async counterpart of DVMS.splits_many()."""
+        results = await self._afetch_batch_assets(
+            opta_match_ids,
+            self.SUBTYPE_SPLITS,
+            competition=competition,
+            season=season,
+            creds=creds,
+            max_workers=max_workers,
+        )
+        payloads = self._dvms._batch_payloads(results, self.SUBTYPE_SPLITS, on_error=on_error)
+        frames = await asyncio.to_thread(self._dvms._build_splits_batch, payloads)
+        return self._dvms._splits_result(self._dvms._select_splits(frames, type=type, model_form=model_form), as_pandas)
+
+    async def summary_many(
+        self,
+        opta_match_ids: t.Iterable[str | int] | None = None,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        max_workers: int | None = None,
+        on_error: str = "raise",
+    ):
+        """Async counterpart of DVMS.summary_many()."""
+        results = await self._afetch_batch_assets(
+            opta_match_ids,
+            self.SUBTYPE_SUMMARY,
+            competition=competition,
+            season=season,
+            creds=creds,
+            max_workers=max_workers,
+        )
+        payloads = self._dvms._batch_payloads(results, self.SUBTYPE_SUMMARY, on_error=on_error)
+        return await asyncio.to_thread(self._dvms._build_summary_batch, payloads)
+
+    async def _afetch_batch_assets(self, opta_match_ids, sub_type: int, **kwargs) -> dict[str, dict]:
+        sub_types = [self.SUBTYPE_METADATA, sub_type]
+        if opta_match_ids is None:
+            return await self.download_season(sub_types=sub_types, **kwargs)
+        return await self.fetch_many(opta_match_ids, sub_types=sub_types, **kwargs)
+
+    async def events(
+        self,
+        *,
+        opta_match_id: str | int,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        format: str = "dataframe",
+    ):
+        """Async counterpart of DVMS.events()."""
+        await self._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+
+        normalized_match_id = self._dvms._normalize_opta_match_id(opta_match_id)
+        events_xml, lineups_xml = await asyncio.gather(
+            self._adownload_physical(normalized_match_id, self.SUBTYPE_EVENTS),
+            self._adownload_physical(normalized_match_id, self.SUBTYPE_LINEUPS),
+            return_exceptions=True,
+        )
+        if isinstance(events_xml, BaseException):
+            raise events_xml
+
+        lineups_table: pa.Table | None = None
+        player_lookup: dict[str, str] = {}
+        try:
+            if isinstance(lineups_xml, BaseException):
+                raise lineups_xml
+            lineups_table = self._dvms._parse_lineups_xml(lineups_xml, opta_match_id=normalized_match_id)
+        except Exception:
+            try:
+                metadata_raw = await self._adownload_metadata(normalized_match_id)
+                player_lookup = self._dvms._build_player_lookup(metadata_raw)
+            except Exception:
+                # Events can still be returned even if lineup/player names are unavailable.
+                player_lookup = {}
+
+        events_df = await asyncio.to_thread(
+            self._dvms._build_events,
+            normalized_match_id,
+            events_xml,
+            lineups_table=lineups_table,
+            player_lookup=player_lookup,
+        )
+        return self._dvms._format_frame(events_df, format)
+
+    async def lineups(
+        self,
+        *,
+        opta_match_id: str | int,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        format: str = "dataframe",
+    ):
+        """Async counterpart of DVMS.lineups()."""
+        await self._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+
+        lineups_xml = await self._adownload_physical(str(opta_match_id), self.SUBTYPE_LINEUPS)
+        lineups_df = await asyncio.to_thread(self._dvms._build_lineups, opta_match_id, lineups_xml)
+        return self._dvms._format_frame(lineups_df, format)
+
+    async def fetch_many(
+        self,
+        opta_match_ids: t.Iterable[str | int],
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        sub_types: t.Iterable[int] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict]:
+        """
+        Async counterpart of DVMS.fetch_many().
+
+        Concurrency is bounded by the client semaphore (max_concurrency) and, when
+        given, by max_workers downloads in flight for this call.
+        """
+        await self._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+
+        match_ids = list(dict.fromkeys(self._dvms._normalize_opta_match_id(m) for m in opta_match_ids))
+        wanted_sub_types = tuple(sub_types) if sub_types is not None else self.BULK_SUB_TYPES
+        keys = [(m, s) for m in match_ids for s in wanted_sub_types]
+        limit = asyncio.Semaphore(max(1, max_workers)) if max_workers is not None else None
+
+        async def download(match_id: str, sub_type: int):
+            if limit is None:
+                return await self._adownload_sub_type(match_id, sub_type)
+            async with limit:
+                return await self._adownload_sub_type(match_id, sub_type)
+
+        payloads = await asyncio.gather(
+            *(download(m, s) for m, s in keys),
+            return_exceptions=True,
+        )
+
+        results: dict[str, dict] = {m: {"assets": {}, "errors": {}} for m in match_ids}
+        for (match_id, sub_type), payload in zip(keys, payloads):
+            bucket = "errors" if isinstance(payload, Exception) else "assets"
+            results[match_id][bucket][sub_type] = payload
+        return results
+
+    async def download_season(
+        self,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        sub_types: t.Iterable[int] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict]:
+        """Async counterpart of DVMS.download_season()."""
+        await self._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+        match_ids = [m for m in self._dvms._match_sub_types if m]
+        return await self.fetch_many(
+            match_ids,
+            competition=competition,
+            season=season,
+            creds=creds,
+            sub_types=sub_types,
+            max_workers=max_workers,
+        )
+
+    async def export_season(
+        self,
+        sink: Sink,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        outputs: t.Iterable[str] = ("splits", "summary", "events", "lineups"),
+        opta_match_ids: t.Iterable[str | int] | None = None,
+        batch_size: int = 50,
+        max_workers: int | None = None,
+        full_refresh: bool = False,
+    ) -> dict[str, t.Any]:
+        """
+        Async counterpart of DVMS.export_season().
+
+        Downloads are awaited on the event loop; transforms and sink writes run in a
+        worker thread. Returns the same report as DVMS.export_season().
+        """
+        engine = SyncEngine(
+            self._dvms,
+            sink,
+            outputs=outputs,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            full_refresh=full_refresh,
+        )
+        return await engine.arun(
+            self,
+            competition=competition,
+            season=season,
+            creds=creds,
+            opta_match_ids=opta_match_ids,
+        )
+
+    # ============================
+    # Internals
+    # ============================
+
+    async def _aauthenticate(self, creds: dict[str, str]) -> None:
+        auth_key = (creds["username"], creds["password"])
+        if self._dvms._auth_context == auth_key and self._dvms.headers.get("Hudl-AuthToken"):
+            self._dvms._default_creds = dict(creds)
+            return
+
+        payload = await self._arequest(
+            "POST",
+            self._dvms.AUTH_URL,
+            headers={"Content-Type": "application/json"},
+            json_payload={"username": creds["username"], "password": creds["password"]},
+            as_json=True,
+            retries=1,
+        )
+        self._dvms._set_auth_token(creds, self._dvms._token_from_payload(payload))
+
+    async def _aload_fixtures_context(self, competition: str, season: int) -> None:
+        snapshot = self._dvms._load_catalog_snapshot(competition, season)
+        if snapshot is not None and (self._dvms._catalog.is_fresh(snapshot) or await self._arevalidate_catalog(snapshot)):
+            self._dvms._apply_fixtures_context(competition, season, snapshot["comp"], snapshot["fixtures"])
+            return
+
+        comps = await self._aget(f"{self._dvms.BASE_URL}/dvms/competitions", as_json=True)
+        comp = self._dvms._select_competition(comps, competition)
+        fixtures = await self._aget_fixtures(comp["competitionId"], season)
+        self._dvms._apply_fixtures_context(competition, season, comp, fixtures)
+        self._dvms._save_catalog_snapshot(competition, season, comp, fixtures)
+
+    async def _arevalidate_catalog(self, snapshot: dict) -> bool:
+        """Async counterpart of DVMS._revalidate_catalog()."""
+        conditional = CatalogSnapshot.conditional_headers(snapshot)
+        if not conditional:
+            return False
+        aiohttp = self._ensure_http()
+        try:
+            async with self._semaphore:
+                async with self._http.post(
+                    self._dvms._fixtures_url(snapshot["comp"]["competitionId"], snapshot["season"]),
+                    headers={**self._dvms.headers, **conditional},
+                    json=self._dvms._fixtures_page_payload(0),
+                ) as r:
+                    status, headers = r.status, r.headers
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+        if not CatalogSnapshot.is_unchanged(snapshot, status, headers):
+            return False
+        self._dvms._catalog.touch(self._dvms._catalog_account(), snapshot["competition"], snapshot["season"], snapshot)
+        return True
+
+    async def _aensure_fixtures_loaded(
+        self,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+    ) -> None:
+        resolved_competition, resolved_season, resolved_creds = self._dvms._resolve_runtime_context(
+            competition=competition,
+            season=season,
+            creds=creds,
+        )
+        await self._aauthenticate(resolved_creds)
+
+        cache_ready = (
+            self._dvms._fixtures_df is not None
+            and self._dvms._fixture_assets is not None
+            and self._dvms._opta_competition_id is not None
+        )
+        context_key = self._dvms._build_context_key(
+            resolved_competition,
+            resolved_season,
+            resolved_creds,
+        )
+        if not cache_ready or self._dvms._fixtures_context != context_key:
+            await self._aload_fixtures_context(resolved_competition, resolved_season)
+            self._dvms._fixtures_context = context_key
+
+    async def _aget_fixtures(self, competition_id: str, season_id: int) -> list[dict]:
+        url = self._dvms._fixtures_url(competition_id, season_id)
+        first, headers = await self._arequest(
+            "POST",
+            url,
+            json_payload=self._dvms._fixtures_page_payload(0),
+            as_json=True,
+            with_headers=True,
+        )
+        self._dvms._fixtures_validators = (headers.get("ETag"), headers.get("Last-Modified"))
+        fixtures: list[dict] = list(first.get("fixtures", []))
+        served = len(fixtures)
+
+        page_count = self._dvms._fixtures_page_count(first, served)
+        if page_count is not None:
+            # Total is known: fetch the remaining pages concurrently.
+            pages = await asyncio.gather(
+                *(self._apost(url, self._dvms._fixtures_page_payload(page)) for page in range(1, page_count))
+            )
+            for data in pages:
+                fixtures.extend(data.get("fixtures", []))
+            return fixtures
+
+        # Total is unknown: page one request at a time until an empty or short page marks the end.
+        data = first
+        page = 0
+        while self._dvms._is_full_fixtures_page(data, served):
+            page += 1
+            if page >= self._dvms.MAX_FIXTURE_PAGES:
+                raise self._dvms._too_many_fixture_pages()
+            data = await self._apost(url, self._dvms._fixtures_page_payload(page))
+            fixtures.extend(data.get("fixtures", []))
+        return fixtures
+
+    # -------- Downloads --------
+    async def _adownload_metadata(self, opta_match_id: str) -> dict:
+        a = self._dvms._find_asset(opta_match_id=opta_match_id, sub_type=self.SUBTYPE_METADATA)
+        return await self._adownload_asset_json(a["opta_competition_id"], a["fixture_id"], a["asset_id"])
+
+    async def _adownload_physical(self, opta_match_id: str, sub_type: int) -> str:
+        a = self._dvms._find_asset(opta_match_id=opta_match_id, sub_type=sub_type)
+        return await self._adownload_asset_text(a["opta_competition_id"], a["fixture_id"], a["asset_id"])
+
+    async def _adownload_sub_type(self, opta_match_id: str, sub_type: int) -> dict | str:
+        if sub_type == self.SUBTYPE_METADATA:
+            return await self._adownload_metadata(opta_match_id)
+        return await self._adownload_physical(opta_match_id, sub_type)
+
+    async def _adownload_asset_text(self, competition_id: str, fixture_id: str, asset_id: str) -> str:
+        cached = self._dvms._cache_get(competition_id, fixture_id, asset_id)
+        if cached is not None:
+            return cached
+        text = await self._aget(self._dvms._asset_url(competition_id, fixture_id, asset_id))
+        self._dvms._cache_put(competition_id, fixture_id, asset_id, text)
+        return text
+
+    async def _adownload_asset_json(self, competition_id: str, fixture_id: str, asset_id: str) -> dict:
+        return json.loads(await self._adownload_asset_text(competition_id, fixture_id, asset_id))
+
+    # -------- HTTP helpers with simple retry --------
+    def _ensure_http(self):
+        aiohttp = _require_aiohttp()
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_concurrency,
+                    limit_per_host=self._limit_per_host,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._dvms._timeout),
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return aiohttp
+
+    async def _aget(self, url: str, *, as_json: bool = False):
+        return await self._arequest("GET", url, as_json=as_json)
+
+    async def _apost(self, url: str, json_payload: dict | None = None) -> dict:
+        return await self._arequest("POST", url, json_payload=json_payload, as_json=True)
+
+    async def _arequest(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json_payload: dict | None = None,
+        as_json: bool = False,
+        retries: int | None = None,
+        with_headers: bool = False,
+    ):
+        aiohttp = self._ensure_http()
+        last_exc = None
+        for _ in range(retries or self._dvms._retries):
+            try:
+                async with self._semaphore:
+                    async with self._http.request(
+                        method,
+                        url,
+                        headers=headers or self._dvms.headers,
+                        json=json_payload,
+                    ) as r:
+                        r.raise_for_status()
+                        body = await r.text()
+                        response_headers = r.headers
+                payload = json.loads(body) if as_json else body
+                return (payload, response_headers) if with_headers else payload
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exc = e
+                await asyncio.sleep(self._dvms._sleep)
+        raise RuntimeError(f"{method} failed: {url}") from last_exc
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to `path` via a temp file + os.replace so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class AssetCache:
+    """
+    On-disk cache of raw DVMS asset bodies (CSV / XML / JSON).
+
+    Layout: <directory>/<competition_id>/<fixture_id>/<asset_id>
+
+    - Writes are atomic (temp file + os.replace), so several processes can share one directory.
+    - Reads refresh the file mtime, which is used as the LRU clock.
+    - When max_bytes is set, the least recently used files are evicted once the cache grows past it.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Size estimate for this process; refreshed from disk on every eviction pass.
+        self._approx_bytes: int | None = None
+
+    @staticmethod
+    def _safe(part: object) -> str:
+        return str(part).replace("/", "_").replace("\\", "_")
+
+    def path_for(self, competition_id: str, fixture_id: str, asset_id: str) -> Path:
+        return self.directory / self._safe(competition_id) / self._safe(fixture_id) / self._safe(asset_id)
+
+    def get(self, competition_id: str, fixture_id: str, asset_id: str) -> bytes | None:
+        path = self.path_for(competition_id, fixture_id, asset_id)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another worker between read and touch.
+            pass
+        return data
+
+    def put(self, competition_id: str, fixture_id: str, asset_id: str, data: bytes) -> None:
+        atomic_write_bytes(self.path_for(competition_id, fixture_id, asset_id), data)
+        if self.max_bytes is None:
+            return
+        if self._approx_bytes is None:
+            self._approx_bytes = self.size()
+        else:
+            self._approx_bytes += len(data)
+        if self._approx_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.rglob("*"):
+            if path.name.endswith(".tmp"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file():
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes currently stored on disk."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Remove least recently used files until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.max_bytes is None or total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._approx_bytes = total
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._approx_bytes = 0
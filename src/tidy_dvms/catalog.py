@@ -0,0 +1,107 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+import time
+import typing as t
+from pathlib import Path
+
+from tidy_dvms.cache import atomic_write_bytes
+
+
+class CatalogSnapshot:
+    """
+    Local JSON snapshots of the fixtures catalog, one file per (account, competition, season).
+
+    A snapshot holds the resolved competition record, the raw fixtures list and the
+    HTTP validators (ETag / Last-Modified) of the first fixtures page, so a new process
+    can start from disk and only revalidate once the TTL has passed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: str | os.PathLike, ttl: float = 3600.0) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, username: str, competition: str, season: int) -> Path:
+        # Usernames are hashed so account names never end up in file names.
+        account = hashlib.sha1(username.encode("utf-8")).hexdigest()[:12]
+        slug = re.sub(r"[^a-z0-9]+", "-", competition.lower()).strip("-")
+        return self.directory / f"fixtures_{account}_{slug}_{season}.json"
+
+    def load(self, username: str, competition: str, season: int) -> dict | None:
+        path = self.path_for(username, competition, season)
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if snapshot.get("version") != self.VERSION:
+            return None
+        return snapshot
+
+    def save(
+        self,
+        username: str,
+        competition: str,
+        season: int,
+        *,
+        comp: dict,
+        fixtures: list[dict],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> dict:
+        snapshot = {
+            "version": self.VERSION,
+            "saved_at": time.time(),
+            "competition": competition,
+            "season": season,
+            "comp": comp,
+            "fixtures": fixtures,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._write(self.path_for(username, competition, season), snapshot)
+        return snapshot
+
+    def touch(self, username: str, competition: str, season: int, snapshot: dict) -> None:
+        """Mark a snapshot as revalidated now."""
+        snapshot["saved_at"] = time.time()
+        self._write(self.path_for(username, competition, season), snapshot)
+
+    def is_fresh(self, snapshot: dict) -> bool:
+        return time.time() - float(snapshot.get("saved_at", 0)) < self.ttl
+
+    @staticmethod
+    def conditional_headers(snapshot: dict) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if snapshot.get("etag"):
+            headers["If-None-Match"] = snapshot["etag"]
+        if snapshot.get("last_modified"):
+            headers["If-Modified-Since"] = snapshot["last_modified"]
+        return headers
+
+    @staticmethod
+    def is_unchanged(snapshot: dict, status: int, headers: t.Mapping[str, str]) -> bool:
+        """
+        Whether a revalidation response shows the fixtures did not change.
+
+        The fixtures listing is a POST, and servers may ignore conditional headers on
+        POST. So besides a 304, a 200 whose ETag / Last-Modified equal the stored
+        validators also counts as unchanged; without validators it does not.
+        """
+        if status == 304:
+            return True
+        if status != 200:
+            return False
+        etag = headers.get("ETag")
+        if etag and snapshot.get("etag"):
+            return etag.removeprefix("W/") == snapshot["etag"].removeprefix("W/")
+        last_modified = headers.get("Last-Modified")
+        return bool(last_modified) and last_modified == snapshot.get("last_modified")
+
+    @staticmethod
+    def _write(path: Path, snapshot: dict) -> None:
+        atomic_write_bytes(path, json.dumps(snapshot, ensure_ascii=False).encode("utf-8"))
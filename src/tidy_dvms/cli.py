@@ -0,0 +1,157 @@
+"""
+tidy-dvms command line.
+
+    tidy-dvms sync --competition "English Premier League" --season 2025 \\
+        --outputs splits,summary,events --workers 16 --sink parquet://dvms_lake
+
+Credentials are read from DVMS_USERNAME / DVMS_PASSWORD. The sync manifest is kept
+by the sink, so an interrupted run picks up where it stopped when started again.
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import typing as t
+
+if t.TYPE_CHECKING:
+    from tidy_dvms.sinks.base import Sink
+
+OUTPUTS = ("splits", "summary", "events", "lineups")
+
+
+def open_sink(url: str) -> Sink:
+    """
+    Sink for a URL.
+
+    - parquet://<directory>  ParquetSink (Hive-partitioned lake)
+    - duckdb://<file>        DuckDBSink (local warehouse)
+    - any SQLAlchemy URL     SQLSink, for example sqlite:///dvms.sqlite or postgresql://...
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep or not rest:
+        raise ValueError(f"Sink must be a URL such as parquet://dvms_lake, got {url!r}.")
+    if scheme == "parquet":
+        from tidy_dvms.sinks.parquet import ParquetSink
+
+        return ParquetSink(rest)
+    if scheme == "duckdb":
+        from tidy_dvms.sinks.warehouse import DuckDBSink
+
+        return DuckDBSink(rest)
+    from tidy_dvms.sinks.sql import SQLSink
+
+    return SQLSink(url)
+
+
+def _outputs(value: str) -> list[str]:
+    outputs = [part.strip().lower() for part in value.split(",") if part.strip()]
+    unknown = [output for output in outputs if output not in OUTPUTS]
+    if unknown or not outputs:
+        raise argparse.ArgumentTypeError(f"choose from {','.join(OUTPUTS)}")
+    return outputs
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tidy-dvms", description="Extract DVMS data into local stores.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync = commands.add_parser(
+        "sync",
+        help="Sync a competition/season into a sink, only touching new or changed matches.",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    sync.add_argument("--competition", required=True, help='Competition name, e.g. "English Premier League"')
+    sync.add_argument("--season", required=True, type=int, help="Season id, e.g. 2025")
+    sync.add_argument("--sink", required=True, help="parquet://<dir>, duckdb://<file> or a SQLAlchemy URL")
+    sync.add_argument("--outputs", type=_outputs, default=list(OUTPUTS), help=f"Comma separated, default {','.join(OUTPUTS)}")
+    sync.add_argument("--workers", type=int, default=8, help="Parallel downloads (default 8)")
+    sync.add_argument("--batch-size", type=int, default=50, help="Matches transformed and written together (default 50)")
+    sync.add_argument("--match", dest="matches", action="append", help="Only this match id (repeatable)")
+    sync.add_argument("--full-refresh", action="store_true", help="Ignore the sync manifest and export every ready match")
+    sync.add_argument("--cache-dir", help="Keep raw asset bodies in this directory")
+    sync.add_argument("--quiet", action="store_true", help="Only print the final summary")
+    return parser
+
+
+def _progress(report: dict[str, t.Any]) -> None:
+    done = len(report["exported"]) + len(report["identical"]) + len(report["failed"])
+    rate = done / report["seconds"] if report["seconds"] else 0.0
+    print(
+        f"  {done}/{report['pending']} matches, {sum(report['rows'].values()):,} rows, "
+        f"{rate:.2f} matches/s",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def print_summary(report: dict[str, t.Any], file: t.TextIO | None = None) -> None:
+    file = file or sys.stdout
+    seconds = report["seconds"] or 0.0
+    exported = len(report["exported"])
+    rows = sum(report["rows"].values())
+
+    def per_second(count: int) -> float:
+        return count / seconds if seconds else 0.0
+
+    print(
+        f"exported {exported} matches in {seconds:.1f} s "
+        f"({len(report['identical'])} identical, {len(report['unchanged'])} unchanged, "
+        f"{len(report['not_ready'])} not ready, {len(report['failed'])} failed)",
+        file=file,
+    )
+    print(f"throughput: {per_second(exported):.2f} matches/s, {per_second(rows):,.0f} rows/s", file=file)
+    for table_name, count in sorted(report["rows"].items()):
+        print(f"  {table_name:<16} {count:>12,} rows", file=file)
+    for match_id, error in sorted(report["failed"].items()):
+        print(f"failed {match_id}: {type(error).__name__}: {error}", file=file)
+
+
+def run_sync(args: argparse.Namespace) -> int:
+    username, password = os.environ.get("DVMS_USERNAME"), os.environ.get("DVMS_PASSWORD")
+    if not username or not password:
+        print("tidy-dvms: set DVMS_USERNAME and DVMS_PASSWORD", file=sys.stderr)
+        return 2
+
+    from tidy_dvms.client import DVMS
+    from tidy_dvms.sync import SyncEngine
+
+    workers = max(1, args.workers)
+    client = DVMS(pool_connections=workers, pool_maxsize=workers, cache_dir=args.cache_dir)
+    with client, open_sink(args.sink) as sink:
+        engine = SyncEngine(
+            client,
+            sink,
+            outputs=args.outputs,
+            batch_size=args.batch_size,
+            max_workers=workers,
+            full_refresh=args.full_refresh,
+            on_batch=None if args.quiet else _progress,
+        )
+        report = engine.run(
+            competition=args.competition,
+            season=args.season,
+            creds={"username": username, "password": password},
+            opta_match_ids=args.matches,
+        )
+    print_summary(report)
+    return 1 if report["failed"] else 0
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "sync":
+            return run_sync(args)
+    except ValueError as e:
+        print(f"tidy-dvms: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        # Finished batches are in the manifest; the next run resumes from there.
+        print("tidy-dvms: interrupted, run the same command again to resume", file=sys.stderr)
+        return 130
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,46 @@
 from __future__ import annotations
 import io
 import json
+import math
+import os
 import time
 import typing as t
 import warnings
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-import duckdb
 import polars as pl
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
 
 # from .transform import transform_fixtures, physical_splits, physical_summary
-from tidy_dvms.transform import transform_fixtures, physical_splits, physical_summary
+from tidy_dvms.transform import (
+    transform_fixtures,
+    physical_splits,
+    physical_splits_batch,
+    physical_summary,
+    physical_summary_batch,
+)
+from tidy_dvms.cache import AssetCache
+from tidy_dvms.engine import DuckDBEngine
+from tidy_dvms.catalog import CatalogSnapshot
+from tidy_dvms.match import MatchBundle
+from tidy_dvms.sinks.base import OUTPUT_TABLES, Sink, to_arrow, with_match_id
+from tidy_dvms.sync import SyncEngine
+from tidy_dvms.tracking import (
+    DEFAULT_BATCH_FRAMES,
+    READ_CHUNK_BYTES,
+    TrackingStore,
+    is_complete_tracking_store,
+    iter_tracking_file,
+    iter_tracking_stream,
+    write_tracking_store,
+)
+
+if t.TYPE_CHECKING:
+    import pandas as pd
 
 warnings.filterwarnings("ignore")
 
@@ -28,6 +57,23 @@ class DVMS:
     SUBTYPE_SPLITS = 42
     SUBTYPE_SUMMARY = 43
 
+    # Sub types fetched by fetch_many()/download_season() when none are given (tracking is opt-in).
+    BULK_SUB_TYPES = (
+        SUBTYPE_METADATA,
+        SUBTYPE_SPLITS,
+        SUBTYPE_SUMMARY,
+        SUBTYPE_EVENTS,
+        SUBTYPE_LINEUPS,
+    )
+
+    # Sub types each export_season() output is built from; all of them must be ready.
+    EXPORT_SUB_TYPES = {
+        "splits": (SUBTYPE_METADATA, SUBTYPE_SPLITS),
+        "summary": (SUBTYPE_METADATA, SUBTYPE_SUMMARY),
+        "events": (SUBTYPE_EVENTS, SUBTYPE_LINEUPS),
+        "lineups": (SUBTYPE_LINEUPS,),
+    }
+
     EVENT_TYPES = {
         1: "Pass",
         2: "Offside Pass",
@@ -227,6 +273,9 @@ class DVMS:
         73: {"name": "Other Ball Contact", "outcome_0": None, "outcome_1": "Always set to '1'"},
     }
 
+    # Upper bound on fixture pages; a listing that needs more raises instead of being truncated.
+    MAX_FIXTURE_PAGES = 50
+
     COMP_MAP = {
         "English Premier League": "8",
         "EFL Championship": "10",
@@ -244,6 +293,16 @@ class DVMS:
         request_timeout: int = 30,
         request_retries: int = 3,
         sleep_between_retries: float = 1.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        cache_dir: str | os.PathLike | None = None,
+        cache_max_bytes: int | None = None,
+        fixtures_page_size: int = 100,
+        catalog_dir: str | os.PathLike | None = None,
+        catalog_ttl: float = 3600.0,
+        duckdb_threads: int | None = None,
+        duckdb_memory_limit: str | None = None,
     ) -> None:
         self.season_id = season
         self.competition_name = competition_name
@@ -251,6 +310,23 @@ class DVMS:
         self._timeout = request_timeout
         self._retries = request_retries
         self._sleep = sleep_between_retries
+        self.fixtures_page_size = fixtures_page_size
+
+        # One pooled keep-alive session shared by every HTTP helper.
+        self._pool_maxsize = pool_maxsize
+        self._session = self._build_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+        # Opt-in on-disk cache of raw asset bodies, keyed by (competition, fixture_id, asset_id).
+        self._cache = AssetCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir is not None else None
+        # Opt-in fixtures catalog snapshots, reused for catalog_ttl seconds and then revalidated.
+        self._catalog = CatalogSnapshot(catalog_dir, ttl=catalog_ttl) if catalog_dir is not None else None
+        self._fixtures_validators: tuple[str | None, str | None] = (None, None)
+        # One long-lived DuckDB engine for every transform; static tables stay registered on it.
+        self._engine = DuckDBEngine(threads=duckdb_threads, memory_limit=duckdb_memory_limit)
 
         self.headers = {
             "Content-Type": "application/json",
@@ -269,10 +345,65 @@ class DVMS:
         self._competition_id: str | None = None
         self._opta_competition_id: str | None = None
         self._fixtures_df: pl.DataFrame | None = None
-        self._fixtures_list: list[dict] | None = None
-        self._fixture_assets: list[dict] | None = None
+        self._fixtures_list = None
+        self._fixture_assets = None
         self.fixtures_json_text: str | None = None
 
+    # The fixtures list and asset catalog are always replaced wholesale; assigning
+    # either one rebuilds its lookup index so match-level calls never scan the season.
+    @property
+    def _fixtures_list(self) -> list[dict] | None:
+        return self._fixtures_list_value
+
+    @_fixtures_list.setter
+    def _fixtures_list(self, fixtures: list[dict] | None) -> None:
+        self._fixtures_list_value = fixtures
+        self._fixture_context_index = self._build_fixture_context_index(fixtures or [])
+
+    @property
+    def _fixture_assets(self) -> list[dict] | None:
+        return self._fixture_assets_value
+
+    @_fixture_assets.setter
+    def _fixture_assets(self, assets: list[dict] | None) -> None:
+        self._fixture_assets_value = assets
+        self._asset_index, self._match_sub_types = self._build_asset_index(assets or [])
+
+    @staticmethod
+    def _build_session(
+        *,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+    ) -> requests.Session:
+        """
+        Build a requests.Session backed by a pooled HTTPAdapter.
+
+        pool_connections: number of per-host pools kept alive
+        pool_maxsize:     max connections kept alive per host
+        pool_block:       block instead of opening extra connections when the pool is full
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and the DuckDB engine."""
+        self._session.close()
+        self._engine.close()
+
+    def __enter__(self) -> "DVMS":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _resolve_creds(self, creds: dict[str, str] | None) -> dict[str, str]:
         resolved = creds or self._default_creds
         if not resolved:
@@ -326,22 +457,79 @@ class DVMS:
             return
 
         token = self._get_api_key(creds["username"], creds["password"])
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "Hudl-AuthToken": token,
-        }
-        self._auth_context = auth_key
-        self._default_creds = dict(creds)
+        self._set_auth_token(creds, token)
 
     def _load_fixtures_context(self, competition: str, season: int) -> None:
+        snapshot = self._load_catalog_snapshot(competition, season)
+        if snapshot is not None and (self._catalog.is_fresh(snapshot) or self._revalidate_catalog(snapshot)):
+            self._apply_fixtures_context(competition, season, snapshot["comp"], snapshot["fixtures"])
+            return
+
         comp = self._resolve_competition(competition)
+        fixtures = self._get_fixtures(comp["competitionId"], season)
+        self._apply_fixtures_context(competition, season, comp, fixtures)
+        self._save_catalog_snapshot(competition, season, comp, fixtures)
+
+    # -------- Fixtures catalog snapshots --------
+    def _catalog_account(self) -> str:
+        return self._auth_context[0] if self._auth_context else ""
+
+    def _load_catalog_snapshot(self, competition: str, season: int) -> dict | None:
+        if self._catalog is None:
+            return None
+        return self._catalog.load(self._catalog_account(), competition, season)
+
+    def _save_catalog_snapshot(self, competition: str, season: int, comp: dict, fixtures: list[dict]) -> None:
+        if self._catalog is None:
+            return
+        etag, last_modified = self._fixtures_validators
+        self._catalog.save(
+            self._catalog_account(),
+            competition,
+            season,
+            comp=comp,
+            fixtures=fixtures,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def _revalidate_catalog(self, snapshot: dict) -> bool:
+        """
+        Conditional request for the first fixtures page; True when the snapshot is still current.
+
+        Sent as the listing's own POST with If-None-Match / If-Modified-Since. A server that
+        ignores those on POST answers 200, which still counts as unchanged when its
+        validators match the snapshot (CatalogSnapshot.is_unchanged).
+        """
+        conditional = CatalogSnapshot.conditional_headers(snapshot)
+        if not conditional:
+            return False
+        try:
+            r = self._session.post(
+                self._fixtures_url(snapshot["comp"]["competitionId"], snapshot["season"]),
+                headers={**self.headers, **conditional},
+                json=self._fixtures_page_payload(0),
+                timeout=self._timeout,
+            )
+        except requests.RequestException:
+            return False
+        if not CatalogSnapshot.is_unchanged(snapshot, r.status_code, r.headers):
+            return False
+        self._catalog.touch(self._catalog_account(), snapshot["competition"], snapshot["season"], snapshot)
+        return True
+
+    def _apply_fixtures_context(
+        self,
+        competition: str,
+        season: int,
+        comp: dict,
+        fixtures: list[dict],
+    ) -> None:
         self._competition_id = comp["competitionId"]
         self._opta_competition_id = comp["optaCompetitionId"]
         self.competition_name = competition
         self.season_id = season
 
-        fixtures = self._get_fixtures(self._competition_id, self.season_id)
         self._fixtures_list = fixtures
         self.fixtures_json_text = json.dumps(fixtures, ensure_ascii=False)
 
@@ -352,6 +540,7 @@ class DVMS:
             )
         )
         self._fixtures_df = transform_fixtures(df).to_pandas()
+        self._engine.register_static("fixtures", self._fixtures_df)
         self._fixture_assets = self._collect_fixture_assets(fixtures)
 
     # ============================
@@ -440,10 +629,14 @@ class DVMS:
         creds: dict[str, str] | None = None,
         type: str = "players",
         model_form: str = "denormalized",
-    ) -> pl.DataFrame:
+        as_pandas: bool = True,
+    ) -> pd.DataFrame | pl.DataFrame:
         """
         Get physical splits for a match.
         type='players' | 'teams'
+
+        Returns a pandas DataFrame (as it always has), or the Polars frame the
+        transform produced with as_pandas=False.
         """
         self._ensure_fixtures_loaded(
             competition=competition,
@@ -454,25 +647,8 @@ class DVMS:
         metadata_raw = self._download_metadata(opta_match_id)
         splits_csv = self._download_physical(opta_match_id, self.SUBTYPE_SPLITS)
 
-        metadata_df = pl.from_dicts([metadata_raw])
-        players_df, players_df_normalized, teams_df, teams_df_normalized = physical_splits(
-            self.season_id,
-            self._opta_competition_id,  # type: ignore[arg-type]
-            metadata_df,
-            splits_csv,
-            opta_match_id,
-            self._fixtures_df
-        )
-
-        if type.lower() == "players" and model_form.lower() == "denormalized":
-            return players_df
-        elif type.lower() == "players" and model_form.lower() == "normalized":
-            return players_df_normalized
-        if type.lower() == "teams" and model_form.lower() == "denormalized":
-            return teams_df
-        elif type.lower() == "teams" and model_form.lower() == "normalized":
-            return teams_df_normalized
-        raise ValueError("type must be 'players' or 'teams'")
+        frames = self._build_splits(opta_match_id, metadata_raw, splits_csv)
+        return self._splits_result(self._select_splits(frames, type=type, model_form=model_form), as_pandas)
 
     def summary(
         self,
@@ -492,13 +668,7 @@ class DVMS:
         metadata_raw = self._download_metadata(opta_match_id)
         summary_csv = self._download_physical(opta_match_id, self.SUBTYPE_SUMMARY)
 
-        metadata_df = pl.from_dicts([metadata_raw])
-        return physical_summary(
-            self._fixtures_df,          # type: ignore[arg-type]
-            metadata_df,
-            summary_csv,
-            opta_match_id,
-        )
+        return self._build_summary(opta_match_id, metadata_raw, summary_csv)
 
     def events(
         self,
@@ -524,11 +694,11 @@ class DVMS:
 
         normalized_match_id = self._normalize_opta_match_id(opta_match_id)
         events_xml = self._download_physical(normalized_match_id, self.SUBTYPE_EVENTS)
-        lineup_rows: list[dict] = []
+        lineups_table: pa.Table | None = None
         player_lookup: dict[str, str] = {}
         try:
             lineups_xml = self._download_physical(normalized_match_id, self.SUBTYPE_LINEUPS)
-            lineup_rows = self._parse_lineups_xml(lineups_xml, opta_match_id=normalized_match_id)
+            lineups_table = self._parse_lineups_xml(lineups_xml, opta_match_id=normalized_match_id)
         except Exception:
             try:
                 metadata_raw = self._download_metadata(normalized_match_id)
@@ -537,19 +707,13 @@ class DVMS:
                 # Events can still be returned even if lineup/player names are unavailable.
                 player_lookup = {}
 
-        match_events = self._parse_events_xml(
+        events_df = self._build_events(
+            normalized_match_id,
             events_xml,
-            opta_match_id=normalized_match_id,
+            lineups_table=lineups_table,
             player_lookup=player_lookup,
         )
-        events_df = self._join_events_with_type_labels(match_events, lineup_rows=lineup_rows)
-
-        fmt = format.lower()
-        if fmt == "dataframe":
-            return events_df
-        if fmt == "json":
-            return events_df.to_dict(orient="records")
-        raise ValueError("format must be 'dataframe' or 'json'")
+        return self._format_frame(events_df, format)
 
     def lineups(
         self,
@@ -574,36 +738,538 @@ class DVMS:
         )
 
         lineups_xml = self._download_physical(str(opta_match_id), self.SUBTYPE_LINEUPS)
-        match_lineups = self._parse_lineups_xml(lineups_xml, opta_match_id=opta_match_id)
-        lineups_df = self._lineups_to_dataframe(match_lineups)
+        lineups_df = self._build_lineups(opta_match_id, lineups_xml)
+        return self._format_frame(lineups_df, format)
 
-        fmt = format.lower()
-        if fmt == "dataframe":
-            return lineups_df
-        if fmt == "json":
-            return lineups_df.to_dict(orient="records")
-        raise ValueError("format must be 'dataframe' or 'json'")
+    def tracking(
+        self,
+        *,
+        opta_match_id: str | int,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        batch_frames: int = DEFAULT_BATCH_FRAMES,
+        path: str | os.PathLike | None = None,
+    ) -> t.Iterator:
+        """
+        Stream tracking data (sub type 38) for a match as Arrow record batches.
+
+        Frames are parsed as they arrive and yielded every `batch_frames` frames
+        (one row per player/ball per frame, see tracking.TRACKING_SCHEMA), so the
+        full payload is never held in memory.
+
+        Args:
+            opta_match_id: Match id (with or without 'g' prefix)
+            batch_frames: Frames per record batch (1500 = 60s at 25 Hz)
+            path: Optional file to stream the raw payload to first; batches are then read from disk
+        """
+        self._ensure_fixtures_loaded(
+            competition=competition,
+            season=season,
+            creds=creds,
+        )
+
+        a = self._find_asset(opta_match_id=str(opta_match_id), sub_type=self.SUBTYPE_TRACKING)
+        url = self._asset_url(a["opta_competition_id"], a["fixture_id"], a["asset_id"])
+        return self._iter_tracking(url, batch_frames=batch_frames, path=path)
+
+    def tracking_store(
+        self,
+        *,
+        opta_match_id: str | int,
+        path: str | os.PathLike,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        overwrite: bool = False,
+    ) -> TrackingStore:
+        """
+        Persist tracking data for a match once to a memory-mapped Arrow file and open it.
+
+        The file holds one record batch per (period, game-clock minute) with a sidecar
+        index, so TrackingStore.window() reads are zero-copy and never re-parse JSON.
+        An existing store at `path` is reused unless overwrite=True, or unless its index
+        is missing or was not written for that file (e.g. an interrupted download); then
+        it is rebuilt.
+        """
+        if overwrite or not is_complete_tracking_store(path):
+            batches = self.tracking(
+                opta_match_id=opta_match_id,
+                competition=competition,
+                season=season,
+                creds=creds,
+            )
+            write_tracking_store(batches, path)
+        return TrackingStore(path)
+
+    def _iter_tracking(self, url: str, *, batch_frames: int, path: str | os.PathLike | None) -> t.Iterator:
+        r = self._get(url, stream=True)
+        with r:
+            chunks = r.iter_content(chunk_size=READ_CHUNK_BYTES)
+            if path is None:
+                # Same gzip-sniffing decode step as iter_tracking_file()
+                yield from iter_tracking_stream(chunks, batch_frames=batch_frames)
+                return
+            with open(path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        yield from iter_tracking_file(path, batch_frames=batch_frames)
+
+    def match(
+        self,
+        opta_match_id: str | int,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        payloads: dict[int, t.Any] | None = None,
+    ) -> MatchBundle:
+        """
+        Get a lazy bundle of every output for one match.
+
+        Each asset sub type is downloaded at most once and each output
+        (players/teams splits, summary, lineups, events) is computed on first access.
+
+        Args:
+            opta_match_id: Match id (with or without 'g' prefix)
+            payloads: Optional {sub_type: payload} already downloaded, e.g. fetch_many()[id]["assets"]
+        """
+        resolved_competition, resolved_season, resolved_creds = self._resolve_runtime_context(
+            competition=competition,
+            season=season,
+            creds=creds,
+        )
+        context = {
+            "competition": resolved_competition,
+            "season": resolved_season,
+            "creds": resolved_creds,
+        }
+        self._ensure_fixtures_loaded(**context)
+        return MatchBundle(self, opta_match_id, context=context, payloads=payloads)
+
+    def fetch_many(
+        self,
+        opta_match_ids: t.Iterable[str | int],
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        sub_types: t.Iterable[int] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict]:
+        """
+        Download raw assets for many matches at once on a bounded worker pool.
+
+        Args:
+            opta_match_ids: Match ids (with or without 'g' prefix)
+            sub_types: Asset sub types to download, defaults to BULK_SUB_TYPES
+            max_workers: Concurrent downloads, defaults to the session pool size
+
+        Returns:
+            {opta_match_id: {"assets": {sub_type: payload}, "errors": {sub_type: Exception}}}
+            Metadata payloads are dicts, every other sub type is raw text.
+            A failed download is reported under "errors" and never aborts the other matches.
+        """
+        self._ensure_fixtures_loaded(
+            competition=competition,
+            season=season,
+            creds=creds,
+        )
+
+        match_ids = list(dict.fromkeys(self._normalize_opta_match_id(m) for m in opta_match_ids))
+        wanted_sub_types = tuple(sub_types) if sub_types is not None else self.BULK_SUB_TYPES
+        results: dict[str, dict] = {m: {"assets": {}, "errors": {}} for m in match_ids}
+
+        with ThreadPoolExecutor(max_workers=max_workers or self._pool_maxsize) as pool:
+            futures = {
+                pool.submit(self._download_sub_type, match_id, sub_type): (match_id, sub_type)
+                for match_id in match_ids
+                for sub_type in wanted_sub_types
+            }
+            for future in as_completed(futures):
+                match_id, sub_type = futures[future]
+                try:
+                    results[match_id]["assets"][sub_type] = future.result()
+                except Exception as e:
+                    results[match_id]["errors"][sub_type] = e
+
+        return results
+
+    def download_season(
+        self,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        sub_types: t.Iterable[int] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict]:
+        """
+        Download raw assets for every fixture of a competition/season.
+
+        Same return shape as fetch_many().
+        """
+        self._ensure_fixtures_loaded(
+            competition=competition,
+            season=season,
+            creds=creds,
+        )
+        match_ids = [m for m in self._match_sub_types if m]
+        return self.fetch_many(
+            match_ids,
+            competition=competition,
+            season=season,
+            creds=creds,
+            sub_types=sub_types,
+            max_workers=max_workers,
+        )
+
+    def splits_many(
+        self,
+        opta_match_ids: t.Iterable[str | int] | None = None,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        type: str = "players",
+        model_form: str = "denormalized",
+        max_workers: int | None = None,
+        on_error: str = "raise",
+        as_pandas: bool = True,
+    ) -> pd.DataFrame | pl.DataFrame:
+        """
+        Physical splits for many matches, transformed as one batch.
+
+        Args:
+            opta_match_ids: Match ids, defaults to every fixture of the season
+            type / model_form: same as splits(); every frame carries an OptaMatchId column
+            max_workers: Concurrent downloads, defaults to the session pool size
+            on_error: "raise" (default) or "skip" matches whose downloads failed
+            as_pandas: False returns the Polars frame instead of a pandas DataFrame
+        """
+        results = self._fetch_batch_assets(
+            opta_match_ids,
+            self.SUBTYPE_SPLITS,
+            competition=competition,
+            season=season,
+            creds=creds,
+            max_workers=max_workers,
+        )
+        payloads = self._batch_payloads(results, self.SUBTYPE_SPLITS, on_error=on_error)
+        frames = self._build_splits_batch(payloads)
+        return self._splits_result(self._select_splits(frames, type=type, model_form=model_form), as_pandas)
+
+    def summary_many(
+        self,
+        opta_match_ids: t.Iterable[str | int] | None = None,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        max_workers: int | None = None,
+        on_error: str = "raise",
+    ) -> pl.DataFrame:
+        """Physical summary for many matches (default: the whole season), transformed as one batch."""
+        results = self._fetch_batch_assets(
+            opta_match_ids,
+            self.SUBTYPE_SUMMARY,
+            competition=competition,
+            season=season,
+            creds=creds,
+            max_workers=max_workers,
+        )
+        payloads = self._batch_payloads(results, self.SUBTYPE_SUMMARY, on_error=on_error)
+        return self._build_summary_batch(payloads)
+
+    def export_season(
+        self,
+        sink: Sink,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        outputs: t.Iterable[str] = ("splits", "summary", "events", "lineups"),
+        opta_match_ids: t.Iterable[str | int] | None = None,
+        batch_size: int = 50,
+        max_workers: int | None = None,
+        full_refresh: bool = False,
+    ) -> dict[str, t.Any]:
+        """
+        Export a competition/season into a sink, only touching new or changed matches.
+
+        Runs a SyncEngine: outputs whose assets are newly ready, re-published or were built
+        by an older TRANSFORM_VERSION are downloaded, transformed and written; everything
+        else is skipped. The sync manifest is kept by the sink and saved after every batch.
+
+        Args:
+            sink: Destination, for example ParquetSink("lake/")
+            outputs: Any of "splits", "summary", "events", "lineups"
+            opta_match_ids: Match ids, defaults to every fixture of the season
+            batch_size: Matches downloaded and transformed together
+            max_workers: Concurrent downloads, defaults to the session pool size
+            full_refresh: Ignore the manifest and export every ready match
+
+        Returns:
+            SyncEngine.run() report: exported / identical / unchanged / not_ready match ids,
+            failed {opta_match_id: exception} (retried on the next run) and reasons.
+        """
+        engine = SyncEngine(
+            self,
+            sink,
+            outputs=outputs,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            full_refresh=full_refresh,
+        )
+        return engine.run(
+            competition=competition,
+            season=season,
+            creds=creds,
+            opta_match_ids=opta_match_ids,
+        )
+
+    def _fetch_batch_assets(
+        self,
+        opta_match_ids: t.Iterable[str | int] | None,
+        sub_type: int,
+        **kwargs,
+    ) -> dict[str, dict]:
+        sub_types = [self.SUBTYPE_METADATA, sub_type]
+        if opta_match_ids is None:
+            return self.download_season(sub_types=sub_types, **kwargs)
+        return self.fetch_many(opta_match_ids, sub_types=sub_types, **kwargs)
 
     # ============================
     # Internals
     # ============================
 
+    # -------- Transforms (shared by DVMS and AsyncDVMS) --------
+    def _build_splits(self, opta_match_id: str, metadata_raw: dict, splits_csv: str) -> tuple:
+        metadata_df = pl.from_dicts([metadata_raw])
+        return physical_splits(
+            self.season_id,
+            self._opta_competition_id,  # type: ignore[arg-type]
+            metadata_df,
+            splits_csv,
+            opta_match_id,
+            self._fixtures_df,
+            engine=self._engine,
+        )
+
+    def _build_splits_batch(self, payloads: dict[str, tuple[dict, str]]) -> tuple:
+        return physical_splits_batch(
+            [
+                (opta_match_id, pl.from_dicts([metadata_raw]), splits_csv)
+                for opta_match_id, (metadata_raw, splits_csv) in payloads.items()
+            ],
+            self._fixtures_df,
+            engine=self._engine,
+        )
+
+    def _build_summary_batch(self, payloads: dict[str, tuple[dict, str]]) -> pl.DataFrame:
+        return physical_summary_batch(
+            self._fixtures_df,
+            [
+                (opta_match_id, pl.from_dicts([metadata_raw]), summary_csv)
+                for opta_match_id, (metadata_raw, summary_csv) in payloads.items()
+            ],
+            engine=self._engine,
+        )
+
+    def _batch_payloads(self, results: dict[str, dict], sub_type: int, *, on_error: str) -> dict[str, tuple[dict, str]]:
+        """(metadata, raw CSV) per match out of fetch_many() results, honouring on_error."""
+        if on_error not in ("raise", "skip"):
+            raise ValueError("on_error must be 'raise' or 'skip'")
+        payloads: dict[str, tuple[dict, str]] = {}
+        failed: dict[str, Exception] = {}
+        for match_id, result in results.items():
+            assets, errors = result["assets"], result["errors"]
+            error = errors.get(self.SUBTYPE_METADATA) or errors.get(sub_type)
+            if error is not None:
+                failed[match_id] = error
+                continue
+            payloads[match_id] = (assets[self.SUBTYPE_METADATA], assets[sub_type])
+        if failed and on_error == "raise":
+            first_id, first_error = next(iter(failed.items()))
+            raise RuntimeError(
+                f"Failed to download assets for {len(failed)} match(es): {sorted(failed)}"
+            ) from first_error
+        if not payloads:
+            raise RuntimeError("No matches with downloadable assets.")
+        return payloads
+
+    # -------- Export --------
+    def _ready_asset_ids(self, opta_match_id: str, sub_types: t.Iterable[int]) -> dict[int, str] | None:
+        """{sub_type: asset_id} of the assets an output is built from, or None until all of them are ready."""
+        asset_ids: dict[int, str] = {}
+        for sub_type in sub_types:
+            asset = self._asset_index.get((opta_match_id, sub_type))
+            if asset is None or asset.get("ready") is not True:
+                return None
+            asset_ids[sub_type] = asset["asset_id"]
+        return asset_ids
+
+    def _export_tables(
+        self,
+        results: dict[str, dict],
+        stale: t.Mapping[str, t.Collection[str]],
+    ) -> tuple[dict[str, dict[str, pa.Table]], dict[str, Exception]]:
+        """
+        Sink tables of the outputs `stale` asks for, for every match of one export batch.
+
+        Splits and summary are transformed as one batch per output; lineups and events
+        come from a MatchBundle over the downloaded payloads.
+
+        Returns:
+            ({opta_match_id: {table name: pa.Table}}, {opta_match_id: exception})
+        """
+        tables: dict[str, dict[str, pa.Table]] = {}
+        failed: dict[str, Exception] = {}
+        for match_id, outputs in stale.items():
+            needed = {sub_type for output in outputs for sub_type in self.EXPORT_SUB_TYPES[output]}
+            errors = [error for sub_type, error in results[match_id]["errors"].items() if sub_type in needed]
+            if errors:
+                failed[match_id] = errors[0]
+            else:
+                tables[match_id] = {}
+
+        for output, sub_type, build in (
+            # Normalized players and teams frames
+            ("splits", self.SUBTYPE_SPLITS, lambda payloads: self._build_splits_batch(payloads)[1::2]),
+            ("summary", self.SUBTYPE_SUMMARY, lambda payloads: (self._build_summary_batch(payloads),)),
+        ):
+            payloads = {
+                match_id: (results[match_id]["assets"][self.SUBTYPE_METADATA], results[match_id]["assets"][sub_type])
+                for match_id in tables
+                if output in stale[match_id]
+            }
+            for match_ids, frames in self._export_batches(payloads, build, failed):
+                for match_id in match_ids:
+                    for table_name, frame in zip(OUTPUT_TABLES[output], frames):
+                        match_frame = frame.filter(pl.col("OptaMatchId").cast(pl.Utf8) == match_id)
+                        tables[match_id][table_name] = to_arrow(match_frame)
+
+        for match_id in tables:
+            wanted = [output for output in ("lineups", "events") if output in stale[match_id]]
+            if not wanted or match_id in failed:
+                continue
+            bundle = MatchBundle(self, match_id, payloads=results[match_id]["assets"])
+            try:
+                for output in wanted:
+                    tables[match_id][output] = with_match_id(to_arrow(getattr(bundle, output)), match_id)
+            except Exception as e:
+                failed[match_id] = e
+
+        return {m: v for m, v in tables.items() if m not in failed}, failed
+
+    @staticmethod
+    def _export_batches(
+        payloads: dict[str, tuple[dict, str]],
+        build: t.Callable[[dict[str, tuple[dict, str]]], tuple],
+        failed: dict[str, Exception],
+    ) -> list[tuple[list[str], tuple]]:
+        """(match ids, frames) for the whole batch, or match by match when the batch transform fails."""
+        if not payloads:
+            return []
+        try:
+            return [(list(payloads), build(payloads))]
+        except Exception:
+            # Isolate the file(s) that broke the batch; the rest is still exported.
+            built = []
+            for match_id, payload in payloads.items():
+                try:
+                    built.append(([match_id], build({match_id: payload})))
+                except Exception as e:
+                    failed[match_id] = e
+            return built
+
+    @staticmethod
+    def _select_splits(frames: tuple, *, type: str, model_form: str):
+        players_df, players_df_normalized, teams_df, teams_df_normalized = frames
+        if type.lower() == "players" and model_form.lower() == "denormalized":
+            return players_df
+        elif type.lower() == "players" and model_form.lower() == "normalized":
+            return players_df_normalized
+        if type.lower() == "teams" and model_form.lower() == "denormalized":
+            return teams_df
+        elif type.lower() == "teams" and model_form.lower() == "normalized":
+            return teams_df_normalized
+        raise ValueError("type must be 'players' or 'teams'")
+
+    def _build_summary(self, opta_match_id: str, metadata_raw: dict, summary_csv: str) -> pl.DataFrame:
+        metadata_df = pl.from_dicts([metadata_raw])
+        return physical_summary(
+            self._fixtures_df,          # type: ignore[arg-type]
+            metadata_df,
+            summary_csv,
+            opta_match_id,
+            engine=self._engine,
+        )
+
+    def _build_events(
+        self,
+        normalized_match_id: str,
+        events_xml: str,
+        *,
+        lineups_table: pa.Table | None = None,
+        player_lookup: dict[str, str] | None = None,
+    ):
+        match_events = self._parse_events_xml(
+            events_xml,
+            opta_match_id=normalized_match_id,
+            player_lookup=player_lookup,
+        )
+        return self._join_events_with_type_labels(match_events, lineups_table=lineups_table)
+
+    def _build_lineups(self, opta_match_id: str | int, lineups_xml: str):
+        lineups_table = self._parse_lineups_xml(lineups_xml, opta_match_id=opta_match_id)
+        return self._lineups_to_dataframe(lineups_table)
+
+    @staticmethod
+    def _splits_result(df: pl.DataFrame, as_pandas: bool):
+        """Public splits result: pandas by default, the transform's Polars frame with as_pandas=False."""
+        return df.to_pandas() if as_pandas else df
+
+    @staticmethod
+    def _format_frame(df, format: str):
+        fmt = format.lower()
+        if fmt == "dataframe":
+            return df
+        if fmt == "json":
+            return df.to_dict(orient="records")
+        raise ValueError("format must be 'dataframe' or 'json'")
+
     def _get_api_key(self, username: str, password: str) -> str:
-        r = requests.post(
+        r = self._session.post(
             self.AUTH_URL,
             headers={"Content-Type": "application/json"},
             json={"username": username, "password": password},
             timeout=self._timeout,
         )
         r.raise_for_status()
-        token = r.json().get("token")
+        return self._token_from_payload(r.json())
+
+    @staticmethod
+    def _token_from_payload(payload: dict) -> str:
+        token = payload.get("token")
         if not token:
             raise RuntimeError("Authentication succeeded but token missing.")
         return token
 
+    def _set_auth_token(self, creds: dict[str, str], token: str) -> None:
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Hudl-AuthToken": token,
+        }
+        self._auth_context = (creds["username"], creds["password"])
+        self._default_creds = dict(creds)
+
     def _resolve_competition(self, competition_name: str) -> dict:
         r = self._get(f"{self.BASE_URL}/dvms/competitions")
-        comps: list[dict] = r.json()
+        return self._select_competition(r.json(), competition_name)
+
+    def _select_competition(self, comps: list[dict], competition_name: str) -> dict:
         selected = [c for c in comps if c["name"] == competition_name]
         if not selected:
             raise ValueError(f"Competition not found: {competition_name}")
@@ -614,14 +1280,69 @@ class DVMS:
         return comp
 
     def _get_fixtures(self, competition_id: str, season_id: int) -> list[dict]:
-        fixtures: list[dict] = []
-        for page in range(0, 6):
-            payload = {"pageNumber": page, "limit": 100}
-            r = self._post(f"{self.BASE_URL}/dvms/{competition_id}/fixtures/{season_id}", payload)
-            data = r.json()
+        url = self._fixtures_url(competition_id, season_id)
+        r = self._post(url, self._fixtures_page_payload(0))
+        self._fixtures_validators = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+        first = r.json()
+        fixtures: list[dict] = list(first.get("fixtures", []))
+        # The server may cap `limit` below fixtures_page_size: page by the size it served.
+        served = len(fixtures)
+
+        page_count = self._fixtures_page_count(first, served)
+        if page_count is not None:
+            # Total is known: fetch the remaining pages concurrently.
+            remaining = range(1, page_count)
+            if remaining:
+                def fetch_page(page: int) -> dict:
+                    return self._post(url, self._fixtures_page_payload(page)).json()
+
+                with ThreadPoolExecutor(max_workers=min(len(remaining), self._pool_maxsize)) as pool:
+                    for data in pool.map(fetch_page, remaining):
+                        fixtures.extend(data.get("fixtures", []))
+            return fixtures
+
+        # Total is unknown: page one request at a time until an empty page, or one shorter
+        # than the first, marks the end (concurrent paging needs the total, speculative
+        # pages would only add requests).
+        data = first
+        page = 0
+        while self._is_full_fixtures_page(data, served):
+            page += 1
+            if page >= self.MAX_FIXTURE_PAGES:
+                raise self._too_many_fixture_pages()
+            data = self._post(url, self._fixtures_page_payload(page)).json()
             fixtures.extend(data.get("fixtures", []))
         return fixtures
 
+    def _fixtures_page_payload(self, page: int) -> dict:
+        return {"pageNumber": page, "limit": self.fixtures_page_size}
+
+    @staticmethod
+    def _is_full_fixtures_page(data: dict, served: int) -> bool:
+        return served > 0 and len(data.get("fixtures", [])) >= served
+
+    def _fixtures_page_count(self, data: dict, served: int) -> int | None:
+        """Number of fixture pages if the first page reports a total, else None; `served` is its size."""
+        page_count = None
+        total_pages = data.get("totalPages")
+        if isinstance(total_pages, int):
+            page_count = total_pages
+        else:
+            for key in ("totalCount", "totalFixtures", "total"):
+                total = data.get(key)
+                if isinstance(total, int):
+                    page_count = max(math.ceil(total / served), 1) if served else 1
+                    break
+        if page_count is not None and page_count > self.MAX_FIXTURE_PAGES:
+            raise self._too_many_fixture_pages()
+        return page_count
+
+    def _too_many_fixture_pages(self) -> RuntimeError:
+        return RuntimeError(
+            f"The fixtures listing has more than MAX_FIXTURE_PAGES ({self.MAX_FIXTURE_PAGES}) pages of "
+            f"{self.fixtures_page_size}; raise fixtures_page_size or DVMS.MAX_FIXTURE_PAGES."
+        )
+
     def _collect_fixture_assets(self, fixtures: list[dict]) -> list[dict]:
         out: list[dict] = []
         for fx in fixtures:
@@ -651,25 +1372,43 @@ class DVMS:
                     )
         return out
 
+    def _build_asset_index(
+        self,
+        assets: list[dict],
+    ) -> tuple[dict[tuple[str, int], dict], dict[str, set[int]]]:
+        """
+        Index assets by (normalized match id, sub_type).
+
+        The first ready asset wins, otherwise the first asset listed for that key.
+        Also returns the available sub types per match for error messages.
+        """
+        index: dict[tuple[str, int], dict] = {}
+        match_sub_types: dict[str, set[int]] = {}
+        for asset in assets:
+            match_id = self._normalize_opta_match_id(asset["opta_match_id"])
+            key = (match_id, asset["sub_type"])
+            current = index.get(key)
+            if current is None or (current.get("ready") is not True and asset.get("ready") is True):
+                index[key] = asset
+            match_sub_types.setdefault(match_id, set()).add(asset["sub_type"])
+        return index, match_sub_types
+
     def _find_asset(self, *, opta_match_id: str, sub_type: int) -> dict:
         if not self._fixture_assets:
             raise RuntimeError(
                 "No cached assets are available for the active competition/season context."
             )
         normalized_match_id = self._normalize_opta_match_id(opta_match_id)
-        match_assets = [a for a in self._fixture_assets if a["opta_match_id"] == normalized_match_id]
-        if not match_assets:
-            raise ValueError(f"No cached assets for match {normalized_match_id}.")
+        asset = self._asset_index.get((normalized_match_id, sub_type))
+        if asset is not None:
+            return asset
 
-        typed_assets = [a for a in match_assets if a["sub_type"] == sub_type]
-        if typed_assets:
-            ready_assets = [a for a in typed_assets if a.get("ready") is True]
-            return ready_assets[0] if ready_assets else typed_assets[0]
-
-        available_subtypes = sorted({a["sub_type"] for a in match_assets})
+        available_subtypes = self._match_sub_types.get(normalized_match_id)
+        if not available_subtypes:
+            raise ValueError(f"No cached assets for match {normalized_match_id}.")
         raise ValueError(
             f"No asset for match {normalized_match_id} with sub_type {sub_type}. "
-            f"Available sub_types: {available_subtypes}"
+            f"Available sub_types: {sorted(available_subtypes)}"
         )
 
     # -------- Downloads --------
@@ -681,12 +1420,17 @@ class DVMS:
         a = self._find_asset(opta_match_id=opta_match_id, sub_type=sub_type)
         return self._download_asset_text(a["opta_competition_id"], a["fixture_id"], a["asset_id"])
 
+    def _download_sub_type(self, opta_match_id: str, sub_type: int) -> dict | str:
+        if sub_type == self.SUBTYPE_METADATA:
+            return self._download_metadata(opta_match_id)
+        return self._download_physical(opta_match_id, sub_type)
+
     # -------- HTTP helpers with simple retry --------
     def _post(self, url: str, json_payload: dict | None = None) -> requests.Response:
         last_exc = None
         for _ in range(self._retries):
             try:
-                r = requests.post(url, headers=self.headers, json=json_payload, timeout=self._timeout)
+                r = self._session.post(url, headers=self.headers, json=json_payload, timeout=self._timeout)
                 r.raise_for_status()
                 return r
             except requests.RequestException as e:
@@ -698,7 +1442,7 @@ class DVMS:
         last_exc = None
         for _ in range(self._retries):
             try:
-                r = requests.get(url, headers=self.headers, timeout=self._timeout, stream=stream)
+                r = self._session.get(url, headers=self.headers, timeout=self._timeout, stream=stream)
                 r.raise_for_status()
                 return r
             except requests.RequestException as e:
@@ -706,13 +1450,32 @@ class DVMS:
                 time.sleep(self._sleep)
         raise RuntimeError(f"GET failed: {url}") from last_exc
 
+    def _fixtures_url(self, competition_id: str, season_id: int) -> str:
+        return f"{self.BASE_URL}/dvms/{competition_id}/fixtures/{season_id}"
+
+    def _asset_url(self, competition_id: str, fixture_id: str, asset_id: str) -> str:
+        return f"{self.BASE_URL}/dvms/{competition_id}/fixtures/{fixture_id}/download/{asset_id}"
+
     def _download_asset_text(self, competition_id: str, fixture_id: str, asset_id: str) -> str:
-        url = f"{self.BASE_URL}/dvms/{competition_id}/fixtures/{fixture_id}/download/{asset_id}"
-        return self._get(url).text
+        cached = self._cache_get(competition_id, fixture_id, asset_id)
+        if cached is not None:
+            return cached
+        text = self._get(self._asset_url(competition_id, fixture_id, asset_id)).text
+        self._cache_put(competition_id, fixture_id, asset_id, text)
+        return text
 
     def _download_asset_json(self, competition_id: str, fixture_id: str, asset_id: str) -> dict:
-        url = f"{self.BASE_URL}/dvms/{competition_id}/fixtures/{fixture_id}/download/{asset_id}"
-        return self._get(url).json()
+        return json.loads(self._download_asset_text(competition_id, fixture_id, asset_id))
+
+    def _cache_get(self, competition_id: str, fixture_id: str, asset_id: str) -> str | None:
+        if self._cache is None:
+            return None
+        data = self._cache.get(competition_id, fixture_id, asset_id)
+        return data.decode("utf-8") if data is not None else None
+
+    def _cache_put(self, competition_id: str, fixture_id: str, asset_id: str, text: str) -> None:
+        if self._cache is not None:
+            self._cache.put(competition_id, fixture_id, asset_id, text.encode("utf-8"))
 
     @staticmethod
     def _normalize_opta_match_id(opta_match_id: str | int | None) -> str:
@@ -720,18 +1483,11 @@ class DVMS:
             return ""
         return str(opta_match_id).replace("g", "").strip()
 
-    def _lookup_fixture_context(self, opta_match_id: str | int) -> dict[str, str | None]:
-        normalized_match_id = self._normalize_opta_match_id(opta_match_id)
-        base_context = {
-            "opta_match_id": normalized_match_id,
-            "fixture": None,
-            "game_date": None,
-        }
-        if not self._fixtures_list:
-            return base_context
-
-        for fixture in self._fixtures_list:
-            if self._normalize_opta_match_id(fixture.get("optaMatchId")) != normalized_match_id:
+    def _build_fixture_context_index(self, fixtures: list[dict]) -> dict[str, dict[str, str | None]]:
+        index: dict[str, dict[str, str | None]] = {}
+        for fixture in fixtures:
+            normalized_match_id = self._normalize_opta_match_id(fixture.get("optaMatchId"))
+            if normalized_match_id in index:
                 continue
 
             home_team = fixture.get("homeTeamName")
@@ -741,13 +1497,23 @@ class DVMS:
             if isinstance(fixture_date, str):
                 fixture_date = fixture_date[:10]
 
-            return {
+            index[normalized_match_id] = {
                 "opta_match_id": normalized_match_id,
                 "fixture": fixture_name,
                 "game_date": fixture_date,
             }
+        return index
 
-        return base_context
+    def _lookup_fixture_context(self, opta_match_id: str | int) -> dict[str, str | None]:
+        normalized_match_id = self._normalize_opta_match_id(opta_match_id)
+        context = self._fixture_context_index.get(normalized_match_id)
+        if context is not None:
+            return dict(context)
+        return {
+            "opta_match_id": normalized_match_id,
+            "fixture": None,
+            "game_date": None,
+        }
 
     @staticmethod
     def _strip_prefix(value: str | None, prefix: str) -> str | None:
@@ -777,14 +1543,50 @@ class DVMS:
                     lookup[str(player_id)] = str(player_name)
         return lookup
 
-    def _parse_lineups_xml(self, xml_text: str, *, opta_match_id: str | int | None = None) -> list[dict]:
+    LINEUP_COLUMNS = (
+        "opta_match_id",
+        "team_id",
+        "team_name",
+        "player_id",
+        "player_name",
+        "position",
+        "shirt_number",
+        "status",
+        "fixture",
+        "game_date",
+    )
+    EVENT_COLUMNS = (
+        "opta_match_id",
+        "event_id",
+        "player_id",
+        "type_id",
+        "outcome_code",
+        "player_name",
+        "team_name",
+        "min",
+        "sec",
+        "x",
+        "y",
+        "timestamp",
+        "fixture",
+        "game_date",
+    )
+
+    @staticmethod
+    def _columns_to_arrow(columns: dict[str, list], names: tuple[str, ...]) -> pa.RecordBatch:
+        return pa.RecordBatch.from_arrays(
+            [pa.array(columns[name], type=pa.string()) for name in names],
+            names=list(names),
+        )
+
+    def _parse_lineups_xml(self, xml_text: str, *, opta_match_id: str | int | None = None) -> pa.Table:
         try:
             root = ET.fromstring(xml_text)
         except ET.ParseError as e:
             raise RuntimeError("Failed to parse lineups XML payload.") from e
 
         fixture_context = self._lookup_fixture_context(opta_match_id) if opta_match_id is not None else {}
-        lineup_rows: list[dict] = []
+        columns: dict[str, list] = {name: [] for name in self.LINEUP_COLUMNS}
 
         for team in root.findall(".//Team"):
             team_name = team.findtext("Name")
@@ -793,24 +1595,23 @@ class DVMS:
             for player in team.findall("Player"):
                 first_name = player.findtext("PersonName/First", "")
                 last_name = player.findtext("PersonName/Last", "")
-                player_name = f"{first_name} {last_name}".strip() or None
-
-                lineup_rows.append(
-                    {
-                        "opta_match_id": fixture_context.get("opta_match_id"),
-                        "team_id": team_id,
-                        "team_name": team_name,
-                        "player_id": self._strip_prefix(player.get("uID"), "p"),
-                        "player_name": player_name,
-                        "position": player.get("Position"),
-                        "shirt_number": player.get("ShirtNumber") or player.get("shirtNumber"),
-                        "status": player.get("Status") or player.get("status"),
-                        "fixture": fixture_context.get("fixture"),
-                        "game_date": fixture_context.get("game_date"),
-                    }
-                )
 
-        return lineup_rows
+                columns["opta_match_id"].append(fixture_context.get("opta_match_id"))
+                columns["team_id"].append(team_id)
+                columns["team_name"].append(team_name)
+                columns["player_id"].append(self._strip_prefix(player.get("uID"), "p"))
+                columns["player_name"].append(f"{first_name} {last_name}".strip() or None)
+                columns["position"].append(player.get("Position"))
+                columns["shirt_number"].append(player.get("ShirtNumber") or player.get("shirtNumber"))
+                columns["status"].append(player.get("Status") or player.get("status"))
+                columns["fixture"].append(fixture_context.get("fixture"))
+                columns["game_date"].append(fixture_context.get("game_date"))
+
+        return pa.Table.from_batches([self._columns_to_arrow(columns, self.LINEUP_COLUMNS)])
+
+    # Characters fed to the pull parser per step and events emitted per batch.
+    EVENTS_XML_CHUNK_CHARS = 1 << 16
+    EVENTS_BATCH_SIZE = 1000
 
     def _parse_events_xml(
         self,
@@ -818,61 +1619,113 @@ class DVMS:
         *,
         opta_match_id: str | int | None = None,
         player_lookup: dict[str, str] | None = None,
-    ) -> list[dict]:
+    ) -> pa.Table:
+        batches = list(
+            self._iter_events_xml(
+                xml_text,
+                opta_match_id=opta_match_id,
+                player_lookup=player_lookup,
+            )
+        )
+        if not batches:
+            batches = [self._columns_to_arrow({name: [] for name in self.EVENT_COLUMNS}, self.EVENT_COLUMNS)]
+        return pa.Table.from_batches(batches)
+
+    def _iter_events_xml(
+        self,
+        xml_text: str,
+        *,
+        opta_match_id: str | int | None = None,
+        player_lookup: dict[str, str] | None = None,
+        batch_size: int | None = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        """
+        Stream Event rows out of an F24-style events payload as Arrow record batches.
+
+        The payload is fed to an XMLParser in chunks with a target that receives
+        start/end callbacks, so no element tree is built at all. Event attributes go
+        straight into per-column buffers (EVENT_COLUMNS), with no per-row dicts.
+        Only Event elements that are direct children of a (non-root) Game are read.
+        """
+        fixture_context = self._lookup_fixture_context(opta_match_id) if opta_match_id is not None else {}
+        player_lookup = player_lookup or {}
+        batch_size = batch_size or self.EVENTS_BATCH_SIZE
+        chunk_chars = self.EVENTS_XML_CHUNK_CHARS
+
+        target = _EventsXMLTarget(self, fixture_context, player_lookup)
+        parser = ET.XMLParser(target=target)
+
+        def flush() -> t.Iterator[pa.RecordBatch]:
+            batch = self._columns_to_arrow(target.take_columns(), self.EVENT_COLUMNS)
+            for offset in range(0, batch.num_rows, batch_size):
+                yield batch.slice(offset, batch_size)
+
         try:
-            root = ET.fromstring(xml_text)
+            for offset in range(0, len(xml_text), chunk_chars):
+                parser.feed(xml_text[offset:offset + chunk_chars])
+                if target.pending >= batch_size:
+                    yield from flush()
+            parser.close()
         except ET.ParseError as e:
             raise RuntimeError("Failed to parse events XML payload.") from e
 
-        fixture_context = self._lookup_fixture_context(opta_match_id) if opta_match_id is not None else {}
-        player_lookup = player_lookup or {}
-        match_events: list[dict] = []
-        for game in root.findall(".//Game"):
-            home_team_id = str(game.get("home_team_id") or "")
-            away_team_id = str(game.get("away_team_id") or "")
-            home_team_name = game.get("home_team_name")
-            away_team_name = game.get("away_team_name")
-            fixture = fixture_context.get("fixture")
-            if home_team_name and away_team_name:
-                fixture = f"{home_team_name} - {away_team_name}"
-            game_date = game.get("game_date") or fixture_context.get("game_date")
-
-            for event in game.findall("Event"):
-                team_id = event.get("team_id")
-                team_name = event.get("team_name")
-                if not team_name:
-                    if team_id == home_team_id:
-                        team_name = home_team_name
-                    elif team_id == away_team_id:
-                        team_name = away_team_name
-
-                player_id = self._strip_prefix(event.get("player_id"), "p")
-                player_name = event.get("player_name")
-                if not player_name and player_id is not None:
-                    player_name = player_lookup.get(str(player_id))
-
-                match_events.append(
-                    {
-                        "opta_match_id": fixture_context.get("opta_match_id"),
-                        "event_id": event.get("id"),
-                        "player_id": player_id,
-                        "type_id": event.get("type_id"),
-                        "outcome_code": event.get("outcome"),
-                        "player_name": player_name,
-                        "team_name": team_name,
-                        "min": event.get("min"),
-                        "sec": event.get("sec"),
-                        "x": event.get("x"),
-                        "y": event.get("y"),
-                        "timestamp": event.get("timestamp"),
-                        "fixture": fixture,
-                        "game_date": game_date,
-                    }
-                )
-        return match_events
+        if target.pending:
+            yield from flush()
+
+    @staticmethod
+    def _events_game_context(game: t.Mapping[str, str], fixture_context: dict) -> dict:
+        home_team_name = game.get("home_team_name")
+        away_team_name = game.get("away_team_name")
+        fixture = fixture_context.get("fixture")
+        if home_team_name and away_team_name:
+            fixture = f"{home_team_name} - {away_team_name}"
+        return {
+            "home_team_id": str(game.get("home_team_id") or ""),
+            "away_team_id": str(game.get("away_team_id") or ""),
+            "home_team_name": home_team_name,
+            "away_team_name": away_team_name,
+            "fixture": fixture,
+            "game_date": game.get("game_date") or fixture_context.get("game_date"),
+        }
 
-    def _join_events_with_type_labels(self, match_events: list[dict], *, lineup_rows: list[dict] | None = None):
-        if not match_events:
+    def _append_event(
+        self,
+        columns: dict[str, list],
+        event: t.Mapping[str, str],
+        game_context: dict,
+        fixture_context: dict,
+        player_lookup: dict[str, str],
+    ) -> None:
+        team_id = event.get("team_id")
+        team_name = event.get("team_name")
+        if not team_name:
+            if team_id == game_context["home_team_id"]:
+                team_name = game_context["home_team_name"]
+            elif team_id == game_context["away_team_id"]:
+                team_name = game_context["away_team_name"]
+
+        player_id = self._strip_prefix(event.get("player_id"), "p")
+        player_name = event.get("player_name")
+        if not player_name and player_id is not None:
+            player_name = player_lookup.get(str(player_id))
+
+        columns["opta_match_id"].append(fixture_context.get("opta_match_id"))
+        columns["event_id"].append(event.get("id"))
+        columns["player_id"].append(player_id)
+        columns["type_id"].append(event.get("type_id"))
+        columns["outcome_code"].append(event.get("outcome"))
+        columns["player_name"].append(player_name)
+        columns["team_name"].append(team_name)
+        columns["min"].append(event.get("min"))
+        columns["sec"].append(event.get("sec"))
+        columns["x"].append(event.get("x"))
+        columns["y"].append(event.get("y"))
+        columns["timestamp"].append(event.get("timestamp"))
+        columns["fixture"].append(game_context["fixture"])
+        columns["game_date"].append(game_context["game_date"])
+
+    def _join_events_with_type_labels(self, match_events: pa.Table, *, lineups_table: pa.Table | None = None):
+        if match_events.num_rows == 0:
             return pl.DataFrame(
                 schema={
                     "player_name": pl.Utf8,
@@ -889,88 +1742,63 @@ class DVMS:
                 }
             ).to_pandas()
 
-        events_df = pl.DataFrame(match_events)
-        event_defs_df = pl.DataFrame(self._build_event_definitions_rows())
-        lineups_lookup_df = (
-            pl.DataFrame(lineup_rows)
-            if lineup_rows
-            else pl.DataFrame(
-                schema={
-                    "opta_match_id": pl.Utf8,
-                    "player_id": pl.Utf8,
-                    "player_name": pl.Utf8,
-                }
-            )
+        # Labels are a positional take into the per-process definitions table (row i = type id i);
+        # type ids that are not integers or have no definition are labelled "Unknown <type_id>".
+        definitions = pl.from_arrow(self._event_definitions())
+        type_index = pl.col("type_id").str.strip_chars().cast(pl.Int64, strict=False)
+        events = pl.from_arrow(match_events).with_columns(
+            pl.when(type_index.is_between(0, definitions.height - 1)).then(type_index).alias("_type_index")
         )
+        if lineups_table is not None and lineups_table.num_rows:
+            lineup_players = (
+                pl.from_arrow(lineups_table.select(["opta_match_id", "player_id", "player_name"]))
+                .filter(pl.col("player_id").is_not_null())
+                .unique()
+                .rename({"player_name": "_lineup_player_name"})
+            )
+            events = events.join(lineup_players, on=["opta_match_id", "player_id"], how="left", coalesce=True)
+        else:
+            events = events.with_columns(pl.lit(None, dtype=pl.Utf8).alias("_lineup_player_name"))
 
-        con = duckdb.connect()
-        try:
-            con.register("events_raw", events_df.to_arrow())
-            con.register("event_defs", event_defs_df.to_arrow())
-            con.register("lineups_raw", lineups_lookup_df.to_arrow())
-            return con.execute(
-                """
-                WITH lineup_players AS (
-                    SELECT DISTINCT
-                        opta_match_id,
-                        player_id,
-                        player_name
-                    FROM lineups_raw
-                    WHERE player_id IS NOT NULL
-                )
-                SELECT
-                    COALESCE(NULLIF(e.player_name, ''), l.player_name) AS player_name,
-                    e.team_name,
-                    e.min,
-                    e.sec,
-                    e.x,
-                    e.y,
-                    e.timestamp,
-                    COALESCE(d.event_type_name, CONCAT('Unknown ', e.type_id)) AS event_type_name,
-                    COALESCE(
-                        CASE
-                            WHEN e.outcome_code = '0' THEN d.outcome_0
-                            WHEN e.outcome_code = '1' THEN d.outcome_1
-                            ELSE NULL
-                        END,
-                        e.outcome_code
-                    ) AS outcome,
-                    e.fixture,
-                    e.game_date
-                FROM events_raw e
-                LEFT JOIN lineup_players l
-                    ON e.opta_match_id = l.opta_match_id
-                   AND e.player_id = l.player_id
-                LEFT JOIN event_defs d
-                    ON TRY_CAST(e.type_id AS INTEGER) = d.type_id
-                ORDER BY
-                    TRY_CAST(e.min AS INTEGER) NULLS LAST,
-                    TRY_CAST(e.sec AS INTEGER) NULLS LAST,
-                    TRY_CAST(e.event_id AS BIGINT) NULLS LAST
-                """
-            ).fetchdf()
-        finally:
-            con.close()
-
-    def _lineups_to_dataframe(self, lineup_rows: list[dict]):
-        if not lineup_rows:
-            return pl.DataFrame(
-                schema={
-                    "opta_match_id": pl.Utf8,
-                    "team_id": pl.Utf8,
-                    "team_name": pl.Utf8,
-                    "player_id": pl.Utf8,
-                    "player_name": pl.Utf8,
-                    "position": pl.Utf8,
-                    "shirt_number": pl.Utf8,
-                    "status": pl.Utf8,
-                    "fixture": pl.Utf8,
-                    "game_date": pl.Utf8,
-                }
-            ).to_pandas()
+        def label(name: str) -> pl.Expr:
+            return pl.lit(definitions[name]).gather(pl.col("_type_index"))
+
+        def as_int(name: str) -> pl.Expr:
+            return pl.col(name).str.strip_chars().cast(pl.Int64, strict=False)
+
+        return (
+            events.sort([as_int("min"), as_int("sec"), as_int("event_id")], nulls_last=True, maintain_order=True)
+            .select(
+                pl.coalesce(
+                    pl.when(pl.col("player_name") != "").then(pl.col("player_name")),
+                    pl.col("_lineup_player_name"),
+                ).alias("player_name"),
+                "team_name",
+                "min",
+                "sec",
+                "x",
+                "y",
+                "timestamp",
+                pl.coalesce(
+                    label("event_type_name"),
+                    pl.lit("Unknown ") + pl.col("type_id").fill_null(""),
+                ).alias("event_type_name"),
+                pl.coalesce(
+                    pl.when(pl.col("outcome_code") == "0")
+                    .then(label("outcome_0"))
+                    .when(pl.col("outcome_code") == "1")
+                    .then(label("outcome_1")),
+                    pl.col("outcome_code"),
+                ).alias("outcome"),
+                "fixture",
+                "game_date",
+            )
+            .to_pandas()
+        )
 
+    def _lineups_to_dataframe(self, lineups_table: pa.Table):
         return (
-            pl.DataFrame(lineup_rows)
+            pl.from_arrow(lineups_table)
             .with_columns(
                 pl.col("shirt_number").cast(pl.Int64, strict=False).alias("_shirt_number_sort")
             )
@@ -983,22 +1811,83 @@ class DVMS:
             .to_pandas()
         )
 
-    def _build_event_definitions_rows(self) -> list[dict]:
-        all_type_ids = sorted(set(self.EVENT_TYPES.keys()) | set(self.OUTCOME_DEFINITIONS.keys()))
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _event_definitions(cls) -> pa.Table:
+        """
+        Event type / outcome labels as an immutable Arrow table whose row i describes type id i.
+
+        Built once per process (per class) and shared by every client and events() call.
+        """
+        rows = {row["type_id"]: row for row in cls._build_event_definitions_rows()}
+        dense = [rows.get(type_id, {}) for type_id in range(max(rows) + 1)]
+        return pa.table(
+            {
+                name: pa.array([row.get(name) for row in dense], type=pa.string())
+                for name in ("event_type_name", "outcome_0", "outcome_1")
+            }
+        )
+
+    @classmethod
+    def _build_event_definitions_rows(cls) -> list[dict]:
+        all_type_ids = sorted(set(cls.EVENT_TYPES.keys()) | set(cls.OUTCOME_DEFINITIONS.keys()))
         rows: list[dict] = []
         for type_id in all_type_ids:
-            outcome_def = self.OUTCOME_DEFINITIONS.get(type_id, {})
+            outcome_def = cls.OUTCOME_DEFINITIONS.get(type_id, {})
             rows.append(
                 {
                     "type_id": type_id,
-                    "event_type_name": outcome_def.get("name") or self.EVENT_TYPES.get(type_id),
+                    "event_type_name": outcome_def.get("name") or cls.EVENT_TYPES.get(type_id),
                     "outcome_0": outcome_def.get("outcome_0"),
                     "outcome_1": outcome_def.get("outcome_1"),
                 }
             )
         return rows
 
-    # (Optional) Events / Tracking helpers you can add later if needed:
-    # def tracking(self, *, opta_match_id: str) -> pl.DataFrame: ...
-    # def events(self, *, opta_match_id: str) -> list[dict]: ...
 
+class _EventsXMLTarget:
+    """XMLParser target for DVMS._iter_events_xml: tracks Game context and buffers Event columns."""
+
+    def __init__(self, client: DVMS, fixture_context: dict, player_lookup: dict[str, str]) -> None:
+        self._client = client
+        self._fixture_context = fixture_context
+        self._player_lookup = player_lookup
+        self._depth = 0
+        self._game_depth: int | None = None
+        self._game_context: dict | None = None
+        self.columns: dict[str, list] = {name: [] for name in client.EVENT_COLUMNS}
+        self.pending = 0
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
+        if self._game_context is None:
+            if tag == "Game" and self._depth > 1:
+                self._game_depth = self._depth
+                self._game_context = self._client._events_game_context(attrib, self._fixture_context)
+        elif tag == "Event" and self._depth == self._game_depth + 1:
+            self._client._append_event(
+                self.columns,
+                attrib,
+                self._game_context,
+                self._fixture_context,
+                self._player_lookup,
+            )
+            self.pending += 1
+
+    def end(self, tag: str) -> None:
+        if self._game_context is not None and self._depth == self._game_depth:
+            self._game_context = None
+            self._game_depth = None
+        self._depth -= 1
+
+    def data(self, data: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def take_columns(self) -> dict[str, list]:
+        columns = self.columns
+        self.columns = {name: [] for name in self._client.EVENT_COLUMNS}
+        self.pending = 0
+        return columns
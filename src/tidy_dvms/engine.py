@@ -0,0 +1,144 @@
+from __future__ import annotations
+import threading
+import typing as t
+from contextlib import contextmanager
+
+if t.TYPE_CHECKING:
+    import duckdb
+
+
+class DuckDBEngine:
+    """
+    One long-lived in-memory DuckDB connection shared by the transforms.
+
+    - Static tables (fixtures) are registered once with
+      register_static() and stay registered across calls, and across close():
+      they are registered again when the connection reopens.
+    - Per-call tables are registered for the duration of a session() only.
+    - Values reach the SQL as registered tables or as bound parameters
+      (pl()/df()/arrow() take `parameters` for `$name` placeholders). SQL
+      built with f-strings only splices fixed fragments, such as column lists
+      and quoted table names, never data.
+
+    A connection must not be used from several threads at once, so sessions
+    hold a lock; DuckDB still parallelises each query over `threads`.
+
+    duckdb is imported and the connection opened on first use, so creating a
+    client that never runs a query does not pay for either.
+    """
+
+    def __init__(
+        self,
+        *,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        database: str = ":memory:",
+    ) -> None:
+        config: dict[str, t.Any] = {}
+        if threads is not None:
+            config["threads"] = int(threads)
+        if memory_limit is not None:
+            config["memory_limit"] = str(memory_limit)
+        self.threads = threads
+        self.memory_limit = memory_limit
+        self.database = database
+        self._config = config
+        self._connection: duckdb.DuckDBPyConnection | None = None
+        self._lock = threading.RLock()
+        self._static: dict[str, t.Any] = {}
+
+    @property
+    def _con(self) -> duckdb.DuckDBPyConnection:
+        with self._lock:
+            if self._connection is None:
+                import duckdb
+
+                self._connection = duckdb.connect(self.database, config=self._config)
+                for name, data in self._static.items():
+                    self._connection.register(name, data)
+            return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> "DuckDBEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -------- Static tables --------
+    def has_static(self, name: str) -> bool:
+        return name in self._static
+
+    def register_static(self, name: str, data: t.Any) -> None:
+        """Register (or replace) a table that stays available to every session."""
+        with self._lock:
+            if self._static.get(name) is data:
+                return
+            if name in self._static:
+                self._con.unregister(name)
+            self._con.register(name, data)
+            self._static[name] = data
+
+    def unregister_static(self, name: str) -> None:
+        with self._lock:
+            if self._static.pop(name, None) is not None:
+                self._con.unregister(name)
+
+    # -------- Queries --------
+    @contextmanager
+    def session(self, tables: t.Mapping[str, t.Any] | None = None) -> t.Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Hold the connection with `tables` registered on top of the static ones.
+
+        A table passed under the name of a static table is skipped when it is the
+        same object, and shadows the static table for this session otherwise.
+        """
+        with self._lock:
+            registered: list[str] = []
+            try:
+                for name, data in (tables or {}).items():
+                    if self._static.get(name) is data:
+                        continue
+                    self._con.register(name, data)
+                    registered.append(name)
+                yield self._con
+            finally:
+                for name in registered:
+                    self._con.unregister(name)
+                    if name in self._static:
+                        self._con.register(name, self._static[name])
+
+    def pl(self, sql: str, parameters: t.Any = None, *, tables: t.Mapping[str, t.Any] | None = None):
+        """Run one statement with bound parameters and return a Polars DataFrame."""
+        with self.session(tables) as con:
+            return con.execute(sql, parameters).pl()
+
+    def df(self, sql: str, parameters: t.Any = None, *, tables: t.Mapping[str, t.Any] | None = None):
+        """Run one statement with bound parameters and return a pandas DataFrame."""
+        with self.session(tables) as con:
+            return con.execute(sql, parameters).fetchdf()
+
+    def arrow(self, sql: str, parameters: t.Any = None, *, tables: t.Mapping[str, t.Any] | None = None):
+        """Run one statement with bound parameters and return an Arrow table."""
+        with self.session(tables) as con:
+            result = con.execute(sql, parameters).arrow()
+            # Newer DuckDB releases hand back a RecordBatchReader here.
+            return result.read_all() if hasattr(result, "read_all") else result
+
+
+_default_engine: DuckDBEngine | None = None
+_default_lock = threading.Lock()
+
+
+def default_engine() -> DuckDBEngine:
+    """Process-wide engine used when a transform is called without one."""
+    global _default_engine
+    with _default_lock:
+        if _default_engine is None:
+            _default_engine = DuckDBEngine()
+        return _default_engine
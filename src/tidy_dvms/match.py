@@ -0,0 +1,124 @@
+from __future__ import annotations
+import threading
+import typing as t
+from functools import cached_property
+
+import polars as pl
+import pyarrow as pa
+
+if t.TYPE_CHECKING:
+    from tidy_dvms.client import DVMS
+
+
+class MatchBundle:
+    """
+    Every output for one match, built from a single download per asset sub type.
+
+    Raw assets are downloaded on first use and kept on the bundle. Each output
+    (splits frames, summary, lineups, events) is computed lazily on first access
+    and memoized, so reading players and teams costs one metadata + one splits
+    download and one splits transform.
+
+    Obtain one through DVMS.match(); payloads already fetched with DVMS.fetch_many()
+    can be handed over to skip the downloads entirely.
+    """
+
+    def __init__(
+        self,
+        client: DVMS,
+        opta_match_id: str | int,
+        *,
+        context: dict | None = None,
+        payloads: dict[int, t.Any] | None = None,
+    ) -> None:
+        self._client = client
+        self.opta_match_id = client._normalize_opta_match_id(opta_match_id)
+        self._context = context or {}
+        self._payloads: dict[int, t.Any] = dict(payloads or {})
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"MatchBundle(opta_match_id={self.opta_match_id!r}, downloaded={sorted(self._payloads)})"
+
+    def raw(self, sub_type: int):
+        """Raw payload for one sub type (dict for metadata, text otherwise), downloaded at most once."""
+        with self._lock:
+            if sub_type not in self._payloads:
+                self._client._ensure_fixtures_loaded(**self._context)
+                self._payloads[sub_type] = self._client._download_sub_type(self.opta_match_id, sub_type)
+            return self._payloads[sub_type]
+
+    # -------- Raw assets --------
+    @property
+    def metadata(self) -> dict:
+        return self.raw(self._client.SUBTYPE_METADATA)
+
+    # -------- Physical splits --------
+    @cached_property
+    def _splits_frames(self) -> tuple:
+        metadata_raw = self.metadata
+        splits_csv = self.raw(self._client.SUBTYPE_SPLITS)
+        return self._client._build_splits(self.opta_match_id, metadata_raw, splits_csv)
+
+    def splits(self, type: str = "players", model_form: str = "denormalized", as_pandas: bool = True):
+        """Same selection and return type as DVMS.splits(), served from the memoized frames."""
+        frame = self._client._select_splits(self._splits_frames, type=type, model_form=model_form)
+        return self._client._splits_result(frame, as_pandas)
+
+    @property
+    def players(self) -> pl.DataFrame:
+        return self._splits_frames[0]
+
+    @property
+    def players_normalized(self) -> pl.DataFrame:
+        return self._splits_frames[1]
+
+    @property
+    def teams(self) -> pl.DataFrame:
+        return self._splits_frames[2]
+
+    @property
+    def teams_normalized(self) -> pl.DataFrame:
+        return self._splits_frames[3]
+
+    # -------- Physical summary --------
+    @cached_property
+    def summary(self) -> pl.DataFrame:
+        return self._client._build_summary(
+            self.opta_match_id,
+            self.metadata,
+            self.raw(self._client.SUBTYPE_SUMMARY),
+        )
+
+    # -------- Lineups / events --------
+    @cached_property
+    def _lineups_table(self) -> pa.Table:
+        return self._client._parse_lineups_xml(
+            self.raw(self._client.SUBTYPE_LINEUPS),
+            opta_match_id=self.opta_match_id,
+        )
+
+    @cached_property
+    def lineups(self):
+        return self._client._lineups_to_dataframe(self._lineups_table)
+
+    @cached_property
+    def events(self):
+        events_xml = self.raw(self._client.SUBTYPE_EVENTS)
+        lineups_table: pa.Table | None = None
+        player_lookup: dict[str, str] = {}
+        try:
+            lineups_table = self._lineups_table
+        except Exception:
+            try:
+                player_lookup = self._client._build_player_lookup(self.metadata)
+            except Exception:
+                # Events can still be returned even if lineup/player names are unavailable.
+                player_lookup = {}
+
+        return self._client._build_events(
+            self.opta_match_id,
+            events_xml,
+            lineups_table=lineups_table,
+            player_lookup=player_lookup,
+        )
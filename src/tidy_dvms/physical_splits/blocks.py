@@ -0,0 +1,139 @@
+from __future__ import annotations
+import re
+import typing as t
+
+import numpy as np
+import pyarrow as pa
+
+from tidy_dvms.transformers import get_halves
+
+# Every player/team block starts with its metric rows right after the "Name (id)" row.
+FIRST_METRIC = "Total Distance"
+
+_IDENTITY = re.compile(r"\(([^()]*)\)\s*$")
+
+
+def identity_id(label: str) -> str | None:
+    """Id out of a "Name (id)" identity row label, or None if the label has no trailing "(id)"."""
+    match = _IDENTITY.search(label)
+    return match.group(1).strip() if match else None
+
+
+def find_split_blocks(rows: t.Sequence[t.Sequence[str]]) -> list[tuple[int, str]]:
+    """
+    Locate player/team blocks in a splits file with the 'Minute Splits' rows removed.
+
+    A block is an identity row "Name (id)" directly followed by a "Total Distance" row.
+
+    Returns:
+        list of (row index of the identity row, id)
+    """
+    blocks = []
+    for i in range(len(rows) - 1):
+        head, following = rows[i], rows[i + 1]
+        if not head or not following or following[0].strip() != FIRST_METRIC:
+            continue
+        block_id = identity_id(head[0])
+        if block_id is not None:
+            blocks.append((i, block_id))
+    return blocks
+
+
+def _metric_count(rows: t.Sequence[t.Sequence[str]], starts: list[int]) -> int:
+    # Blocks are laid out back to back; the last one runs until the first blank label or the end of the file.
+    gaps = [b - a - 1 for a, b in zip(starts, starts[1:])]
+    last = starts[-1] + 1
+    end = last
+    while end < len(rows) and rows[end] and rows[end][0].strip():
+        end += 1
+    return min(gaps + [end - last])
+
+
+class SplitsLayout:
+    """
+    Per-file invariants of a physical splits CSV, computed once in a single pre-pass.
+
+    Holds the rows with 'Minute Splits' removed, the minute headers with their
+    period labels and separator mask, the fixture / match date / match id and the
+    located blocks, so per-block work never has to rescan the file.
+    """
+
+    def __init__(self, data_list: list[list[str]]) -> None:
+        # Minute headers (from row 9, skipping first column)
+        self.min_headers = [str(h) for h in data_list[9][1:]]
+        self.rows = [row for row in data_list if "Minute Splits" not in row]
+
+        self.keep = np.array([h.strip() != "" for h in self.min_headers], dtype=bool)
+        self.periods = get_halves(self.min_headers)
+        self.minutes = [h for h in self.min_headers if h.strip()]
+
+        self.match_id = self.rows[2][0]
+        self.fixture, _, self.match_date = self.rows[1][0].partition(" : ")
+
+        self.blocks = find_split_blocks(self.rows)
+        starts = [start for start, _ in self.blocks]
+        self.n_metrics = _metric_count(self.rows, starts) if starts else 0
+        self.metrics = [self.rows[starts[0] + 1 + m][0].strip() for m in range(self.n_metrics)] if starts else []
+
+    @property
+    def width(self) -> int:
+        return len(self.min_headers)
+
+    def block_values(self, first_metric_row: int, n_metrics: int | None = None) -> list[list[str]]:
+        """Metric rows of one block, padded to the header width (label column excluded)."""
+        width = self.width
+        cells = []
+        for row in self.rows[first_metric_row:first_metric_row + (n_metrics or self.n_metrics)]:
+            values = list(row[1:width + 1])
+            cells.append(values + [""] * (width - len(values)))
+        return cells
+
+
+def parse_split_blocks(
+    data_list: list[list[str]],
+    fixture_id: str | int,
+    layout: SplitsLayout | None = None,
+) -> pa.Table:
+    """
+    Parse every player/team block of a physical splits CSV in one pass.
+
+    All blocks are stacked into a single (blocks, metrics, columns) array and reshaped
+    to one row per block and minute, so any squad size is handled the same way.
+
+    Args:
+        data_list: CSV rows of the splits file (blank rows already dropped)
+        fixture_id: value of the "Fixture ID" column (the Opta match id)
+        layout: SplitsLayout of data_list, if already computed
+
+    Returns:
+        pa.Table with one string column per metric ("Total Distance", ...) followed by
+        Period, Minute, Player ID, Fixture ID, Fixture and Match Date.
+    """
+    layout = layout or SplitsLayout(data_list)
+    blocks = layout.blocks
+    if not blocks:
+        raise ValueError("No player or team blocks found in physical splits data.")
+    n_metrics, metrics = layout.n_metrics, layout.metrics
+
+    cells = []
+    for start, _ in blocks:
+        for m in range(n_metrics):
+            label = layout.rows[start + 1 + m][0]
+            if label.strip() != metrics[m]:
+                raise ValueError(f"Unexpected metric row {label!r} in physical splits block at row {start}.")
+        cells.extend(layout.block_values(start + 1))
+
+    # (blocks, metrics, columns) -> drop blank separator columns -> (blocks * minutes, metrics)
+    grid = np.array(cells, dtype=object).reshape(len(blocks), n_metrics, layout.width)[:, :, layout.keep]
+    n_minutes = grid.shape[2]
+    values = grid.transpose(0, 2, 1).reshape(len(blocks) * n_minutes, n_metrics)
+
+    n_rows = len(blocks) * n_minutes
+    columns = {name: pa.array(values[:, m], type=pa.string()) for m, name in enumerate(metrics)}
+    columns["Period"] = pa.array(layout.periods * len(blocks), type=pa.string())
+    columns["Minute"] = pa.array(layout.minutes * len(blocks), type=pa.string())
+    columns["Player ID"] = pa.array(np.repeat([pid for _, pid in blocks], n_minutes), type=pa.string())
+    columns["Fixture ID"] = pa.array([str(fixture_id)] * n_rows, type=pa.string())
+    columns["Fixture"] = pa.array([layout.fixture] * n_rows, type=pa.string())
+    columns["Match Date"] = pa.array([layout.match_date] * n_rows, type=pa.string())
+    return pa.table(columns)
@@ -1,209 +1,203 @@
 from __future__ import annotations
-import pandas as pd
-from tidy_dvms.transformers import get_index_range, capture_player_frame, get_halves
-import duckdb
+from tidy_dvms.physical_splits.blocks import SplitsLayout, parse_split_blocks
+from tidy_dvms.schemas import SPLITS_SCHEMA, apply_schema
+from tidy_dvms.engine import DuckDBEngine, default_engine
+from tidy_dvms.transformers import as_polars, column
 import polars as pl
+import pyarrow as pa
 
 class PhysicalSplit:
-    def __init__(self, data_list, season_id, opta_compid, opta_matchid, df_matchlineups, df_fixtures):
+    def __init__(self, data_list, season_id, opta_compid, opta_matchid, df_matchlineups, df_fixtures, engine: DuckDBEngine | None = None):
         self.season_id = season_id
         self.opta_compid = opta_compid
         self.opta_matchid = opta_matchid
         self.bronze_path = data_list
         self.df_matchlineups = df_matchlineups
         self.df_fixtures = df_fixtures
+        self.engine = engine
 
-    def transform_dataframe(self, data_list, row_1: int, row_2: int, player_inx: int, file_name: str):
-        self.list_count = len(data_list)
-
-        # Extract Minute headers (from row 9, skipping first column)
-        min_headers = data_list[9][1:]
-        # Remove any row that contains 'Minute Splits'
-        data_list = [row for row in data_list if 'Minute Splits' not in row]
-
-        # Extract relevant rows from the cleaned data list
-        data = data_list[row_1:row_2]
+    def transform_physical_splits(self, data_list, opta_matchid):
+        layout = SplitsLayout(data_list)
 
         # Determine ID types based on match ID format
-        match_id = data_list[2][0]
-        self.player_id = "ssiId" if len(match_id) > 10 else "OptaPlayerId"
-        self.team_col = "SsiId" if len(match_id) > 10 else "OptaId"
-
-        # Extract match date from the second row
-        fixture = data_list[1][0].split(' : ')[0]
-        match_date = data_list[1][0].split(' : ')[1]
-
-        # Create DataFrame and set headers
-        df = pd.DataFrame(data).transpose()
-        df.columns = df.iloc[0]
-        df = df.iloc[1:]
-
-        # Get halves for periods
-        half = get_halves(min_headers)
-        min_headers = [x for x in min_headers if x.strip()]  # Clean up headers
-
-        # Filter out rows with empty 'Total Distance'
-        df = df[df['Total Distance'] != '']
-        df['Period'] = half
-        df['Minute'] = min_headers
-
-        # Extract player ID from player line
-        player_info = data_list[player_inx][0].split('(')
-        player_id = player_info[1].replace(')', '')
-
-        # Add columns to df
-        df['Player ID'] = player_id
-        df['Fixture ID'] = file_name
-        df['Fixture'] = fixture
-        df['Match Date'] = match_date
+        self.player_id = "ssiId" if len(layout.match_id) > 10 else "OptaPlayerId"
+        self.team_col = "SsiId" if len(layout.match_id) > 10 else "OptaId"
+
+        # A batch of one; the denormalized frames keep their single-match columns
+        players_df, players_df_normalized, teams_df, teams_df_normalized = transform_physical_splits_batch(
+            [(opta_matchid, layout, self.df_matchlineups)],
+            self.df_fixtures,
+            engine=self.engine,
+        )
+        return (
+            players_df.drop("OptaMatchId"),
+            players_df_normalized,
+            teams_df.drop("OptaMatchId"),
+            teams_df_normalized,
+        )
 
-        return df
 
-    def transform_physical_splits(self, data_list, opta_matchid):
-        # Generate transformed player frames and associated functions
-        dfs, functions = get_index_range(
-            lambda dl, r1, r2, pi: self.transform_dataframe(dl, r1, r2, pi, opta_matchid),
-            data_list
-        )
-        df = capture_player_frame(self.list_count, dfs, functions)
-
-        # Connect to DuckDB in-memory DB
-        conn = duckdb.connect()
-
-        # Register tables in DuckDB
-        conn.register('physical_splits', df)
-        conn.register('fixtures', self.df_fixtures)
-        conn.register('matchlineups', self.df_matchlineups)
-
-        # Query players data
-        players_df_normalized = conn.execute(f'''
-            SELECT 
-                "Fixture ID" AS OptaMatchId, 
-                REPLACE(ml.OptaPlayerId, 'Unknown opta', '0') AS "OptaPlayerId",
-                ml.OptaTeamId,
-                Minute, 
-                REPLACE(Period, '', '1') AS Period, 
-                "Total Distance" AS TotalDistance, 
-                "Walking Distance" AS WalkingDistance, 
-                "Jogging Distance" AS JoggingDistance, 
-                "Low Speed Running Distance" AS LowSpeedRunningDistance, 
-                "High Speed Running Distance" AS HighSpeedRunningDistance, 
-                "Sprinting Distance" AS SprintingDistance, 
-                "Walking Count" AS WalkingCount, 
-                "Jogging Count" AS JoggingCount, 
-                "Low Speed Running Count" AS LowSpeedRunningCount, 
-                "High Speed Running Count" AS HighSpeedRunningCount, 
-                "Sprinting Count" AS SprintingCount
-            FROM physical_splits ps
-            JOIN (SELECT OptaId AS OptaPlayerId, ssiId, optaTeamId FROM matchlineups) AS ml
-                ON ps."Player ID" = ml.{self.player_id}
-            WHERE "Player ID" NOT IN (
-                SELECT home{self.team_col} AS teamid FROM matchlineups
-                UNION 
-                SELECT away{self.team_col} AS teamid FROM matchlineups
-            )
-        ''').df()
-
-
-        players_df = conn.execute(f'''
-            SELECT 
-                Fixture,
-                ps."Match Date" AS MatchDate,
-                ml.name AS PlayerName,
-                ml.number AS PlayerNumber,
-                ml.Position AS Position,
-                f.TeamName as TeamName,
-                f.Side AS Side,
-                Minute, 
-                REPLACE(Period, '', '1') AS Period, 
-                "Total Distance" AS TotalDistance, 
-                "Walking Distance" AS WalkingDistance, 
-                "Jogging Distance" AS JoggingDistance, 
-                "Low Speed Running Distance" AS LowSpeedRunningDistance, 
-                "High Speed Running Distance" AS HighSpeedRunningDistance, 
-                "Sprinting Distance" AS SprintingDistance, 
-                "Walking Count" AS WalkingCount, 
-                "Jogging Count" AS JoggingCount, 
-                "Low Speed Running Count" AS LowSpeedRunningCount, 
-                "High Speed Running Count" AS HighSpeedRunningCount, 
-                "Sprinting Count" AS SprintingCount
-            FROM physical_splits ps
-            JOIN (SELECT OptaId AS OptaPlayerId, ssiId, optaTeamId, periods, name, number, position FROM matchlineups) AS ml
-                ON ps."Player ID" = ml.{self.player_id}
-            JOIN (
-                SELECT fixtureId, OptaMatchId, OptaHomeTeamId AS TeamId, homeTeamName AS TeamName, 'Home' AS Side
-                FROM fixtures WHERE optaMatchId = {opta_matchid}
-                UNION
-                SELECT fixtureId, OptaMatchId, OptaAwayTeamId AS TeamId, awayTeamName AS TeamName, 'Away' AS Side
-                FROM fixtures WHERE optaMatchId = {opta_matchid}
-            ) AS f ON f.OptaMatchId = ps."Fixture ID" AND ml.OptaTeamId=f.TeamId
-            WHERE "Player ID" NOT IN (
-                SELECT home{self.team_col} AS teamid FROM matchlineups
-                UNION 
-                SELECT away{self.team_col} AS teamid FROM matchlineups
-            )
-        ''').df()
-
-        # Query teams data
-        teams_df_normalized = conn.execute(f'''
-            SELECT 
-                "Fixture ID" AS OptaMatchId, 
-                ml.OptaTeamId, 
-                Minute, 
-                Period, 
-                "Total Distance" AS TotalDistance, 
-                "Walking Distance" AS WalkingDistance, 
-                "Jogging Distance" AS JoggingDistance, 
-                "Low Speed Running Distance" AS LowSpeedRunningDistance, 
-                "High Speed Running Distance" AS HighSpeedRunningDistance, 
-                "Sprinting Distance" AS SprintingDistance, 
-                "Walking Count" AS WalkingCount, 
-                "Jogging Count" AS JoggingCount, 
-                "Low Speed Running Count" AS LowSpeedRunningCount, 
-                "High Speed Running Count" AS HighSpeedRunningCount, 
-                "Sprinting Count" AS SprintingCount
-            FROM physical_splits ps
-            JOIN (
-                SELECT home{self.team_col} AS teamid, homeOptaId AS OptaTeamId FROM MatchLineups
-                UNION
-                SELECT away{self.team_col} AS teamid, awayOptaId AS OptaTeamId FROM MatchLineups
-            ) AS ml ON ps."Player ID" = ml.teamid
-        ''').df()
-
-        # Query teams data
-        teams_df = conn.execute(f'''
-            SELECT 
-                Fixture, 
-                ps."Match Date" AS MatchDate,
-                f.TeamName as TeamName,
-                Minute, 
-                Period, 
-                "Total Distance" AS TotalDistance, 
-                "Walking Distance" AS WalkingDistance, 
-                "Jogging Distance" AS JoggingDistance, 
-                "Low Speed Running Distance" AS LowSpeedRunningDistance, 
-                "High Speed Running Distance" AS HighSpeedRunningDistance, 
-                "Sprinting Distance" AS SprintingDistance, 
-                "Walking Count" AS WalkingCount, 
-                "Jogging Count" AS JoggingCount, 
-                "Low Speed Running Count" AS LowSpeedRunningCount, 
-                "High Speed Running Count" AS HighSpeedRunningCount, 
-                "Sprinting Count" AS SprintingCount
-            FROM physical_splits ps
-            JOIN (
-                SELECT home{self.team_col} AS teamid, homeOptaId AS OptaTeamId FROM MatchLineups
-                UNION
-                SELECT away{self.team_col} AS teamid, awayOptaId AS OptaTeamId FROM MatchLineups
-            ) AS ml ON ps."Player ID" = ml.teamid
-            JOIN (
-                SELECT fixtureId, OptaMatchId, OptaHomeTeamId AS TeamId, homeTeamName AS TeamName, 'Home' AS Side
-                FROM fixtures WHERE OptaMatchId = {opta_matchid}
-                UNION
-                SELECT fixtureId, OptaMatchId, OptaAwayTeamId AS TeamId, awayTeamName AS TeamName, 'Away' AS Side
-                FROM fixtures WHERE OptaMatchId = {opta_matchid}
-            ) AS f ON f.OptaMatchId = ps."Fixture ID" AND ml.OptaTeamId=f.TeamId
-        ''').df()
-
-
-        return players_df, players_df_normalized, teams_df, teams_df_normalized
-    
+METRIC_COLUMNS = """
+    "Total Distance" AS TotalDistance,
+    "Walking Distance" AS WalkingDistance,
+    "Jogging Distance" AS JoggingDistance,
+    "Low Speed Running Distance" AS LowSpeedRunningDistance,
+    "High Speed Running Distance" AS HighSpeedRunningDistance,
+    "Sprinting Distance" AS SprintingDistance,
+    "Walking Count" AS WalkingCount,
+    "Jogging Count" AS JoggingCount,
+    "Low Speed Running Count" AS LowSpeedRunningCount,
+    "High Speed Running Count" AS HighSpeedRunningCount,
+    "Sprinting Count" AS SprintingCount
+"""
+
+
+def _batch_lineups(opta_matchid: str, match_id: str, df_matchlineups) -> pl.DataFrame:
+    """Lineup rows of one match with its player/team keys resolved (ssi ids for long match ids, Opta ids otherwise)."""
+    ml = as_polars(df_matchlineups)
+    player_key = "ssiId" if len(match_id) > 10 else "optaId"
+    team_key = "SsiId" if len(match_id) > 10 else "OptaId"
+    return ml.select(
+        pl.lit(opta_matchid).alias("match_id"),
+        column(ml, "optaId").cast(pl.Utf8).alias("OptaPlayerId"),
+        column(ml, player_key).cast(pl.Utf8).alias("player_key"),
+        column(ml, "optaTeamId").cast(pl.Utf8).alias("OptaTeamId"),
+        column(ml, "name").cast(pl.Utf8).alias("name"),
+        column(ml, "number").cast(pl.Utf8).alias("number"),
+        column(ml, "position").cast(pl.Utf8).alias("position"),
+        column(ml, f"home{team_key}").cast(pl.Utf8).alias("home_team_key"),
+        column(ml, "homeOptaId").cast(pl.Utf8).alias("home_team_id"),
+        column(ml, f"away{team_key}").cast(pl.Utf8).alias("away_team_key"),
+        column(ml, "awayOptaId").cast(pl.Utf8).alias("away_team_id"),
+    )
+
+
+def transform_physical_splits_batch(matches, df_fixtures, engine: DuckDBEngine | None = None):
+    """
+    Physical splits for many matches with one query per output frame.
+
+    Args:
+        matches: iterable of (opta_matchid, data_list or SplitsLayout, df_matchlineups)
+        df_fixtures: fixtures of the season (registered once on the engine by DVMS)
+        engine: DuckDBEngine to run on, defaults to the process-wide engine
+
+    Returns:
+        players_df, players_df_normalized, teams_df, teams_df_normalized, each with an
+        OptaMatchId column identifying the match of every row.
+    """
+    blocks, lineups = [], []
+    for opta_matchid, source, df_matchlineups in matches:
+        opta_matchid = str(opta_matchid)
+        layout = source if isinstance(source, SplitsLayout) else SplitsLayout(source)
+        blocks.append(parse_split_blocks(None, opta_matchid, layout=layout))
+        lineups.append(_batch_lineups(opta_matchid, layout.match_id, df_matchlineups))
+    if not blocks:
+        raise ValueError("No matches to transform.")
+
+    # Stack every match; the match id travels as a column instead of a literal in the SQL
+    engine = engine or default_engine()
+    stacked = pa.concat_tables(blocks, promote_options="default")
+    # Row position in the source files, so every output keeps file order
+    stacked = stacked.append_column("ordinal", pa.array(range(stacked.num_rows), type=pa.int64()))
+    tables = {
+        'physical_splits': stacked,
+        'batch_lineups': pl.concat(lineups, how="vertical_relaxed").to_arrow(),
+        'fixtures': df_fixtures,
+    }
+
+    with engine.session(tables) as conn:
+        conn.execute('''
+            CREATE OR REPLACE TEMP TABLE batch_teams AS
+            SELECT DISTINCT match_id, home_team_key AS teamid, home_team_id AS OptaTeamId FROM batch_lineups
+            UNION
+            SELECT DISTINCT match_id, away_team_key AS teamid, away_team_id AS OptaTeamId FROM batch_lineups
+        ''')
+        conn.execute('''
+            CREATE OR REPLACE TEMP TABLE batch_sides AS
+            SELECT CAST(OptaMatchId AS VARCHAR) AS match_id, CAST(OptaHomeTeamId AS VARCHAR) AS TeamId,
+                   homeTeamName AS TeamName, 'Home' AS Side
+            FROM fixtures WHERE CAST(OptaMatchId AS VARCHAR) IN (SELECT DISTINCT match_id FROM batch_lineups)
+            UNION
+            SELECT CAST(OptaMatchId AS VARCHAR) AS match_id, CAST(OptaAwayTeamId AS VARCHAR) AS TeamId,
+                   awayTeamName AS TeamName, 'Away' AS Side
+            FROM fixtures WHERE CAST(OptaMatchId AS VARCHAR) IN (SELECT DISTINCT match_id FROM batch_lineups)
+        ''')
+        try:
+            # Query players data
+            players_df_normalized = conn.execute(f'''
+                SELECT
+                    "Fixture ID" AS OptaMatchId,
+                    REPLACE(ml.OptaPlayerId, 'Unknown opta', '0') AS "OptaPlayerId",
+                    ml.OptaTeamId AS optaTeamId,
+                    Minute,
+                    REPLACE(Period, '', '1') AS Period,
+                    {METRIC_COLUMNS}
+                FROM physical_splits ps
+                JOIN batch_lineups ml
+                    ON ml.match_id = ps."Fixture ID" AND ps."Player ID" = ml.player_key
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM batch_teams t WHERE t.match_id = ps."Fixture ID" AND t.teamid = ps."Player ID"
+                )
+                ORDER BY ps.ordinal
+            ''').pl()
+
+            players_df = conn.execute(f'''
+                SELECT
+                    "Fixture ID" AS OptaMatchId,
+                    Fixture,
+                    ps."Match Date" AS MatchDate,
+                    ml.name AS PlayerName,
+                    ml.number AS PlayerNumber,
+                    ml.position AS Position,
+                    f.TeamName AS TeamName,
+                    f.Side AS Side,
+                    Minute,
+                    REPLACE(Period, '', '1') AS Period,
+                    {METRIC_COLUMNS}
+                FROM physical_splits ps
+                JOIN batch_lineups ml
+                    ON ml.match_id = ps."Fixture ID" AND ps."Player ID" = ml.player_key
+                JOIN batch_sides f
+                    ON f.match_id = ps."Fixture ID" AND ml.OptaTeamId = f.TeamId
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM batch_teams t WHERE t.match_id = ps."Fixture ID" AND t.teamid = ps."Player ID"
+                )
+                ORDER BY ps.ordinal
+            ''').pl()
+
+            # Query teams data
+            teams_df_normalized = conn.execute(f'''
+                SELECT
+                    "Fixture ID" AS OptaMatchId,
+                    t.OptaTeamId,
+                    Minute,
+                    Period,
+                    {METRIC_COLUMNS}
+                FROM physical_splits ps
+                JOIN batch_teams t ON t.match_id = ps."Fixture ID" AND ps."Player ID" = t.teamid
+                ORDER BY ps.ordinal
+            ''').pl()
+
+            teams_df = conn.execute(f'''
+                SELECT
+                    "Fixture ID" AS OptaMatchId,
+                    Fixture,
+                    ps."Match Date" AS MatchDate,
+                    f.TeamName AS TeamName,
+                    Minute,
+                    Period,
+                    {METRIC_COLUMNS}
+                FROM physical_splits ps
+                JOIN batch_teams t ON t.match_id = ps."Fixture ID" AND ps."Player ID" = t.teamid
+                JOIN batch_sides f ON f.match_id = ps."Fixture ID" AND t.OptaTeamId = f.TeamId
+                ORDER BY ps.ordinal
+            ''').pl()
+        finally:
+            conn.execute("DROP TABLE IF EXISTS batch_teams")
+            conn.execute("DROP TABLE IF EXISTS batch_sides")
+
+    # Cast metrics once to their registered dtypes
+    return tuple(
+        apply_schema(frame, SPLITS_SCHEMA)
+        for frame in (players_df, players_df_normalized, teams_df, teams_df_normalized)
+    )
@@ -1,125 +1,160 @@
 from __future__ import annotations
-import pandas as pd
-import duckdb
 import polars as pl
 
-
-def transform_physical_total(cleaned_data, df_fixtures, df_matchlineups, opta_matchid) -> None:
-
+from tidy_dvms.schemas import SUMMARY_SCHEMA, apply_schema
+from tidy_dvms.transformers import as_polars, column
+
+# Source header -> output column, in output order.
+TOTAL_COLUMNS = {
+    "Minutes": "Minutes",
+    "Distance": "Distance",
+    "Walking": "Walking",
+    "Jogging": "Jogging",
+    "Running": "Running",
+    "High Speed Running": "HighSpeedRunning",
+    "Sprinting": "Sprinting",
+    "No. of High Intensity Runs": "HighIntensityRuns",
+    "Top Speed": "TopSpeed",
+    "Average Speed": "AverageSpeed",
+    "Distance TIP": "DistanceTIP",
+    "HSR Distance TIP": "HSRDistanceTIP",
+    "Sprint Distance TIP": "SprintDistanceTIP",
+    "No. of High Intensity Runs TIP": "HighIntensityRunsTIP",
+    "Distance OTIP": "DistanceOTIP",
+    "HSR Distance OTIP": "HSRDistanceOTIP",
+    "Sprint Distance OTIP": "SprintDistanceOTIP",
+    "No. of High Intensity Runs OTIP": "HighIntensityRunsOTIP",
+    "Distance BOP": "DistanceBOP",
+    "HSR Distance BOP": "HSRDistanceBOP",
+    "Sprint Distance BOP": "SprintDistanceBOP",
+    "No. of High Intensity Runs BOP": "HighIntensityRunsBOP",
+}
+
+# ID, Player and the TOTAL_COLUMNS metrics: the only layout the transform supports.
+HEADER_WIDTH = 2 + len(TOTAL_COLUMNS)
+
+
+def transform_physical_total(cleaned_data, df_fixtures, df_matchlineups, opta_matchid) -> pl.DataFrame:
+    return transform_physical_total_batch([(opta_matchid, cleaned_data, df_matchlineups)], df_fixtures)
+
+
+def _check_layout(opta_matchid, cleaned_data) -> None:
+    """Raise ValueError unless row 9 of the file holds the HEADER_WIDTH-column totals header."""
+    width = len(cleaned_data[9]) if len(cleaned_data) > 9 else 0
+    if width != HEADER_WIDTH:
+        raise ValueError(
+            f"Unsupported physical summary layout for match {opta_matchid}: "
+            f"header row has {width} columns, expected {HEADER_WIDTH}."
+        )
+
+
+def _match_frames(index: int, opta_matchid, cleaned_data, df_matchlineups) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Totals, lineups and per-side constants of one match, each tagged with the match id and batch position."""
     data = cleaned_data[10:]
-
-    # Get headers   
     headers = cleaned_data[9]
-
-    if len(headers) == 24:
-
-        # Get Totals
-        # Game Time
-        game_time_row = cleaned_data[4]
-
-        total_game_time = game_time_row[2]
-        first_half_time = game_time_row[3]
-        second_half_time = game_time_row[4]
-
-        # Home EPT Time
-        home_ept_row = cleaned_data[6]
-        
-        home_ept_total = home_ept_row[2]
-        home_ept_fh = home_ept_row[3]
-        home_ept_sh = home_ept_row[4]
-
-        # Away EPT Time
-        away_ept_row = cleaned_data[7]
-        
-        away_ept_total = away_ept_row[2]
-        away_ept_fh = away_ept_row[3]
-        away_ept_sh = away_ept_row[4]
-
-
-        # Execute the SQL query to select all data from the view
-        df = pd.DataFrame(data=data, columns=headers)
-        df = df[df['Player'] != 'Player']
-
-        # Create a DuckDB connection and register the DataFrame as a view
-        conn = duckdb.connect()
-
-        # Register DataFrames as a view
-        conn.register('physical_total', df)
-        conn.register('fixtures', df_fixtures)
-        conn.register('matchlineups', df_matchlineups)
-
-        # Get PlayerId (identify Opta or SS Player Id)
-        match_id = cleaned_data[1][1].split(': ')[1]
-        player_id = "ssiId" if len(match_id) > 10 else "OptaPlayerId"
-
-        # Join with Lineups view to get OptaTeamIds
-        conn.execute(f''' 
-            CREATE VIEW physical_total_1 AS
-            SELECT 
-                {opta_matchid} AS OptaMatchId,      
-                ml.OptaPlayerId, "Player", "Minutes", "Distance", "Walking",
-                "Jogging", "Running", "High Speed Running", "Sprinting",
-                "No. of High Intensity Runs", "Top Speed", "Average Speed",
-                "Distance TIP", "HSR Distance TIP", "Sprint Distance TIP",
-                "No. of High Intensity Runs TIP", "Distance OTIP", "HSR Distance OTIP",
-                "Sprint Distance OTIP", "No. of High Intensity Runs OTIP",
-                "Distance BOP", "HSR Distance BOP", "Sprint Distance BOP",
-                "No. of High Intensity Runs BOP"
-                ,ml.OptaTeamId
-            FROM physical_total pt
-            JOIN (SELECT OptaId AS OptaPlayerId, ssiId, optaTeamId FROM matchlineups) AS ml ON pt.ID = ml.{player_id}
-            ''') 
-
-        # Create Home/Away side
-        conn.execute(f'''
-            CREATE VIEW physical_total_2 AS
-            SELECT 
-                pt."OptaMatchId", OptaPlayerId, "OptaTeamId" AS OptaTeamId, f."Side", 
-                "Minutes", "Distance", "Walking", "Jogging", "Running", "High Speed Running" AS HighSpeedRunning, 
-                "Sprinting", "No. of High Intensity Runs" AS HighIntensityRuns, "Top Speed" AS TopSpeed, 
-                "Average Speed" AS AverageSpeed, "Distance TIP" AS DistanceTIP, "HSR Distance TIP" AS HSRDistanceTIP, 
-                "Sprint Distance TIP" AS SprintDistanceTIP, "No. of High Intensity Runs TIP" AS HighIntensityRunsTIP, 
-                "Distance OTIP" AS DistanceOTIP, "HSR Distance OTIP" AS HSRDistanceOTIP, "Sprint Distance OTIP" AS SprintDistanceOTIP, 
-                "No. of High Intensity Runs OTIP" AS HighIntensityRunsOTIP, "Distance BOP" AS DistanceBOP, 
-                "HSR Distance BOP" AS HSRDistanceBOP, "Sprint Distance BOP" AS SprintDistanceBOP, 
-                "No. of High Intensity Runs BOP" AS HighIntensityRunsBOP
-            FROM physical_total_1 pt
-            JOIN 
-            (
-                SELECT fixtureId, OptaMatchId, OptaHomeTeamId AS TeamId, 'Home' AS Side
-                FROM fixtures WHERE OptaMatchId = {opta_matchid}
-                UNION
-                SELECT fixtureId, OptaMatchId, OptaAwayTeamId AS TeamId, 'Away' AS Side
-                FROM fixtures WHERE OptaMatchId = {opta_matchid}
-            ) AS f ON f.OptaMatchId = pt.OptaMatchId AND pt.OptaTeamId=f.TeamId
-            ''')
-        
-        # Combine Home + Away team
-        conn.execute(f'''
-            CREATE VIEW final_table AS
-            SELECT 
-                *, '{home_ept_fh}' AS EPTFirstHalf, '{home_ept_sh}' AS EPTSecondHalf, '{home_ept_total}' AS EPTTotal
-                FROM physical_total_2
-                WHERE Side = 'Home'
-                UNION
-                SELECT *, '{away_ept_fh}' AS EPTFirstHalf, '{away_ept_sh}' AS EPTSecondHalf, '{away_ept_total}' AS EPTTotal
-            FROM physical_total_2
-            WHERE Side = 'Away'
-            ''')
-
-        # final df
-        final_df = conn.execute(f'''
-            SELECT  
-                OptaMatchId, REPLACE("OptaPlayerId", 'Unknown opta', '0') AS "OptaPlayerId", 
-                OptaTeamId, Minutes, Distance, Walking, Jogging, Running, HighSpeedRunning, 
-                Sprinting, HighIntensityRuns, TopSpeed, AverageSpeed, DistanceTIP, HSRDistanceTIP, 
-                SprintDistanceTIP, HighIntensityRunsTIP, DistanceOTIP, HSRDistanceOTIP, 
-                SprintDistanceOTIP, HighIntensityRunsOTIP, DistanceBOP, HSRDistanceBOP, 
-                SprintDistanceBOP, HighIntensityRunsBOP, EPTFirstHalf, EPTSecondHalf, EPTTotal,
-                '{first_half_time}' AS FHTime, '{second_half_time}' AS SHTime, '{total_game_time}' AS TotalGameTime
-            FROM final_table
-            ''').pl()
-
-        final_df = final_df.to_pandas()
-
-        return final_df
+    match_tag = [pl.lit(index, dtype=pl.Int32).alias("_match"), pl.lit(str(opta_matchid)).alias("_match_id")]
+
+    # Get Totals
+    # Game Time
+    total_game_time, first_half_time, second_half_time = cleaned_data[4][2:5]
+
+    # Home / Away EPT Time
+    home_ept_total, home_ept_fh, home_ept_sh = cleaned_data[6][2:5]
+    away_ept_total, away_ept_fh, away_ept_sh = cleaned_data[7][2:5]
+
+    # Physical totals, one row per player (repeated header rows, blank and separator lines dropped)
+    player_idx = headers.index("Player")
+    rows = [row for row in data if len(row) > player_idx and row[player_idx] not in ("Player", "")]
+    df = pl.DataFrame(
+        {header: [row[i] if i < len(row) else None for row in rows] for i, header in enumerate(headers)},
+        schema={header: pl.Utf8 for header in headers},
+    )
+    totals = df.select(
+        *match_tag,
+        column(df, "ID").cast(pl.Utf8).alias("_player_key"),
+        *(column(df, source).alias(target) for source, target in TOTAL_COLUMNS.items()),
+    )
+
+    # Get PlayerId (identify Opta or SS Player Id)
+    match_id = cleaned_data[1][1].split(": ")[1]
+    lineups = as_polars(df_matchlineups)
+    lineup_key = "ssiId" if len(match_id) > 10 else "optaId"
+    lineups = lineups.select(
+        pl.lit(str(opta_matchid)).alias("_match_id"),
+        column(lineups, "optaId").cast(pl.Utf8).alias("OptaPlayerId"),
+        column(lineups, lineup_key).cast(pl.Utf8).alias("_player_key"),
+        column(lineups, "optaTeamId").cast(pl.Utf8).alias("OptaTeamId"),
+    )
+
+    sides = pl.DataFrame(
+        {
+            "Side": ["Home", "Away"],
+            "EPTFirstHalf": [home_ept_fh, away_ept_fh],
+            "EPTSecondHalf": [home_ept_sh, away_ept_sh],
+            "EPTTotal": [home_ept_total, away_ept_total],
+            "FHTime": [first_half_time] * 2,
+            "SHTime": [second_half_time] * 2,
+            "TotalGameTime": [total_game_time] * 2,
+        }
+    ).select(pl.lit(str(opta_matchid)).alias("_match_id"), pl.all())
+    return totals, lineups, sides
+
+
+def transform_physical_total_batch(matches, df_fixtures) -> pl.DataFrame:
+    """
+    Physical summary for many matches, joined once over the whole batch.
+
+    Args:
+        matches: iterable of (opta_matchid, cleaned_data, df_matchlineups)
+        df_fixtures: fixtures of the season
+
+    Returns:
+        pl.DataFrame with one row per player and match (OptaMatchId identifies the match).
+
+    Raises:
+        ValueError: a file does not have the HEADER_WIDTH-column totals layout, or
+                    there are no matches.
+    """
+    frames = []
+    for index, (opta_matchid, cleaned_data, df_matchlineups) in enumerate(matches):
+        _check_layout(opta_matchid, cleaned_data)
+        frames.append(_match_frames(index, opta_matchid, cleaned_data, df_matchlineups))
+    if not frames:
+        raise ValueError("No physical summary files to transform.")
+    totals, lineups, side_constants = (pl.concat(parts, how="vertical_relaxed") for parts in zip(*frames))
+
+    # Home/Away side of both teams of every match in the batch
+    fixtures = as_polars(df_fixtures)
+    fixtures = fixtures.select(
+        column(fixtures, "optaMatchId").cast(pl.Utf8).alias("_match_id"),
+        column(fixtures, "optaHomeTeamId").cast(pl.Utf8).alias("Home"),
+        column(fixtures, "optaAwayTeamId").cast(pl.Utf8).alias("Away"),
+    ).filter(pl.col("_match_id").is_in(side_constants["_match_id"].unique()))
+    sides = (
+        fixtures.melt(id_vars="_match_id", value_vars=["Home", "Away"], variable_name="Side", value_name="OptaTeamId")
+        .unique(maintain_order=True)
+        .join(side_constants, on=["_match_id", "Side"], how="inner")
+    )
+
+    final_df = (
+        totals.join(lineups, on=["_match_id", "_player_key"], how="inner")
+        .join(sides, on=["_match_id", "OptaTeamId"], how="inner")
+        # Batch order, Home rows first, then Away (UNION of both sides drops duplicate rows)
+        .sort([pl.col("_match"), pl.col("Side") == "Away"], maintain_order=True)
+        .select(
+            pl.col("_match_id").alias("OptaMatchId"),
+            pl.col("OptaPlayerId").str.replace_all("Unknown opta", "0", literal=True),
+            "OptaTeamId",
+            *TOTAL_COLUMNS.values(),
+            "EPTFirstHalf",
+            "EPTSecondHalf",
+            "EPTTotal",
+            "FHTime",
+            "SHTime",
+            "TotalGameTime",
+        )
+        .unique(maintain_order=True)
+    )
+
+    # Cast metrics once to their registered dtypes
+    return apply_schema(final_df, SUMMARY_SCHEMA)
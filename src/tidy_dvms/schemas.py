@@ -0,0 +1,158 @@
+from __future__ import annotations
+import typing as t
+
+import polars as pl
+
+# ============================
+# Column kinds
+# ============================
+# Every physical output column is registered under one kind; the kind decides
+# how its raw CSV string is parsed and which compact dtype it ends up as.
+
+DISTANCE = "distance"   # metres -> Float32
+SPEED = "speed"         # km/h -> Float32
+COUNT = "count"         # -> Int16
+MINUTE = "minute"       # "45", "45+2" -> Int16 45, stoppage time in Added<name> (0, 2)
+PERIOD = "period"       # "1".."4" -> Enum (categorical with fixed categories)
+CLOCK = "clock"         # "mm:ss" or plain minutes -> Float32 minutes
+MATCH_ID = "match_id"   # -> Int64
+
+PERIODS = pl.Enum(["1", "2", "3", "4"])
+
+KIND_DTYPES: dict[str, pl.PolarsDataType] = {
+    DISTANCE: pl.Float32,
+    SPEED: pl.Float32,
+    COUNT: pl.Int16,
+    MINUTE: pl.Int16,
+    PERIOD: PERIODS,
+    CLOCK: pl.Float32,
+    MATCH_ID: pl.Int64,
+}
+
+# ============================
+# Registry
+# ============================
+
+# Minute column -> column holding its stoppage time, derived while the minute is cast.
+ADDED_MINUTE_COLUMNS: dict[str, str] = {"Minute": "AddedMinute"}
+
+SPLITS_SCHEMA: dict[str, str] = {
+    "OptaMatchId": MATCH_ID,
+    "PlayerNumber": COUNT,
+    "Minute": MINUTE,
+    "Period": PERIOD,
+    "TotalDistance": DISTANCE,
+    "WalkingDistance": DISTANCE,
+    "JoggingDistance": DISTANCE,
+    "LowSpeedRunningDistance": DISTANCE,
+    "HighSpeedRunningDistance": DISTANCE,
+    "SprintingDistance": DISTANCE,
+    "WalkingCount": COUNT,
+    "JoggingCount": COUNT,
+    "LowSpeedRunningCount": COUNT,
+    "HighSpeedRunningCount": COUNT,
+    "SprintingCount": COUNT,
+}
+
+SUMMARY_SCHEMA: dict[str, str] = {
+    "OptaMatchId": MATCH_ID,
+    "Minutes": CLOCK,
+    "Distance": DISTANCE,
+    "Walking": DISTANCE,
+    "Jogging": DISTANCE,
+    "Running": DISTANCE,
+    "HighSpeedRunning": DISTANCE,
+    "Sprinting": DISTANCE,
+    "HighIntensityRuns": COUNT,
+    "TopSpeed": SPEED,
+    "AverageSpeed": SPEED,
+    "DistanceTIP": DISTANCE,
+    "HSRDistanceTIP": DISTANCE,
+    "SprintDistanceTIP": DISTANCE,
+    "HighIntensityRunsTIP": COUNT,
+    "DistanceOTIP": DISTANCE,
+    "HSRDistanceOTIP": DISTANCE,
+    "SprintDistanceOTIP": DISTANCE,
+    "HighIntensityRunsOTIP": COUNT,
+    "DistanceBOP": DISTANCE,
+    "HSRDistanceBOP": DISTANCE,
+    "SprintDistanceBOP": DISTANCE,
+    "HighIntensityRunsBOP": COUNT,
+    "EPTFirstHalf": CLOCK,
+    "EPTSecondHalf": CLOCK,
+    "EPTTotal": CLOCK,
+    "FHTime": CLOCK,
+    "SHTime": CLOCK,
+    "TotalGameTime": CLOCK,
+}
+
+
+def _text(name: str) -> pl.Expr:
+    """Column as trimmed text, with empty strings as null."""
+    text = pl.col(name).cast(pl.Utf8).str.strip_chars()
+    return pl.when(text == "").then(None).otherwise(text)
+
+
+def _number(text: pl.Expr) -> pl.Expr:
+    return text.str.replace_all(",", "", literal=True).cast(pl.Float64, strict=False)
+
+
+def cast_expr(name: str, kind: str) -> pl.Expr:
+    """Expression parsing column `name` as `kind` (see KIND_DTYPES)."""
+    text = _text(name)
+    if kind in (DISTANCE, SPEED):
+        expr = _number(text)
+    elif kind == COUNT:
+        expr = _number(text).round(0)
+    elif kind == MATCH_ID:
+        expr = text.str.replace_all("g", "", literal=True).cast(pl.Int64, strict=False)
+    elif kind == MINUTE:
+        # Minute of the period clock; stoppage time ("45+2") goes to added_minute_expr()
+        expr = _number(text.str.split("+").list.first()).round(0)
+    elif kind == CLOCK:
+        parts = text.str.split(":")
+        clock = _number(parts.list.first()) + _number(parts.list.get(1)) / 60
+        expr = pl.when(text.str.contains(":", literal=True)).then(clock).otherwise(_number(text))
+    elif kind == PERIOD:
+        expr = text
+    else:
+        raise ValueError(f"Unknown column kind: {kind!r}")
+    return expr.cast(KIND_DTYPES[kind], strict=False).alias(name)
+
+
+def added_minute_expr(name: str) -> pl.Expr:
+    """Stoppage time of minute column `name` ("45+2" -> 2, "45" -> 0), as Int16."""
+    text = _text(name)
+    added = _number(text.str.split("+").list.get(1)).round(0).fill_null(0)
+    return pl.when(text.is_not_null()).then(added).cast(pl.Int16, strict=False)
+
+
+def apply_schema(df: pl.DataFrame, schema: t.Mapping[str, str]) -> pl.DataFrame:
+    """
+    Cast every registered column present in df once; other columns are left as they are.
+
+    A raw (text) minute column also gets its stoppage time as a separate column right
+    after it (ADDED_MINUTE_COLUMNS), so "45+2" becomes Minute 45 and AddedMinute 2.
+    """
+    exprs = [cast_expr(name, schema[name]) for name in df.columns if name in schema]
+    if not exprs:
+        return df
+    added = {
+        name: ADDED_MINUTE_COLUMNS[name]
+        for name in df.columns
+        if schema.get(name) == MINUTE
+        and name in ADDED_MINUTE_COLUMNS
+        and ADDED_MINUTE_COLUMNS[name] not in df.columns
+        and df.schema[name] == pl.Utf8
+    }
+    df = df.with_columns(*exprs, *(added_minute_expr(name).alias(target) for name, target in added.items()))
+    if not added:
+        return df
+    order: list[str] = []
+    for name in df.columns:
+        if name in added.values():
+            continue
+        order.append(name)
+        if name in added:
+            order.append(added[name])
+    return df.select(order)
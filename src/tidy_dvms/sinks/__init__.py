@@ -0,0 +1,26 @@
+from __future__ import annotations
+import typing as t
+
+from tidy_dvms import _lazy
+
+if t.TYPE_CHECKING:
+    from tidy_dvms.sinks.base import OUTPUT_TABLES, TABLE_KEYS, Sink
+    from tidy_dvms.sinks.parquet import ParquetSink
+    from tidy_dvms.sinks.sql import SQLSink
+    from tidy_dvms.sinks.warehouse import DuckDBSink
+
+__all__ = ["OUTPUT_TABLES", "TABLE_KEYS", "Sink", "ParquetSink", "DuckDBSink", "SQLSink"]
+
+# Imported on first access: each sink only loads its own driver (pyarrow.parquet,
+# duckdb, sqlalchemy).
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    {
+        "OUTPUT_TABLES": "tidy_dvms.sinks.base",
+        "TABLE_KEYS": "tidy_dvms.sinks.base",
+        "Sink": "tidy_dvms.sinks.base",
+        "ParquetSink": "tidy_dvms.sinks.parquet",
+        "SQLSink": "tidy_dvms.sinks.sql",
+        "DuckDBSink": "tidy_dvms.sinks.warehouse",
+    },
+)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import typing as t
+
+import pyarrow as pa
+
+# Export output -> tables written for it. Splits are exported in their normalized
+# form, so every table is keyed by ids (names live in lineups).
+OUTPUT_TABLES: dict[str, tuple[str, ...]] = {
+    "splits": ("players_splits", "teams_splits"),
+    "summary": ("summary",),
+    "events": ("events",),
+    "lineups": ("lineups",),
+}
+
+
+# Stable key of every table: loading rows replaces the stored rows with the same key.
+# Events carry no event id, so a match's events are replaced as a whole.
+TABLE_KEYS: dict[str, tuple[str, ...]] = {
+    "players_splits": ("OptaMatchId", "OptaPlayerId", "Minute", "AddedMinute", "Period"),
+    "teams_splits": ("OptaMatchId", "OptaTeamId", "Minute", "AddedMinute", "Period"),
+    "summary": ("OptaMatchId", "OptaPlayerId"),
+    "lineups": ("OptaMatchId", "team_id", "player_id"),
+    "events": ("OptaMatchId",),
+}
+
+
+def to_arrow(frame: t.Any) -> pa.Table:
+    """
+    Arrow table out of a Polars / pandas DataFrame (or an Arrow table).
+
+    All-null columns (e.g. an empty pandas object column) are typed as strings, so a
+    table created from one match accepts the values of the next.
+    """
+    if isinstance(frame, pa.Table):
+        table = frame
+    elif hasattr(frame, "to_arrow"):
+        table = frame.to_arrow()
+    else:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table
+
+
+def with_match_id(table: pa.Table, opta_match_id: str) -> pa.Table:
+    """Prepend an Int64 OptaMatchId column to tables that do not carry one (events, lineups)."""
+    if "OptaMatchId" in table.column_names:
+        return table
+    return table.add_column(0, "OptaMatchId", pa.array([int(opta_match_id)] * table.num_rows, type=pa.int64()))
+
+
+class Sink:
+    """
+    Destination of DVMS.export_season(): receives the output tables of one match at a time.
+
+    Subclasses implement write_match(). load_state()/save_state() persist the sync
+    manifest (tidy_dvms.sync.SyncManifest) of what was already exported, so a re-run
+    only exports new or changed matches; the default keeps no state (everything is exported).
+    """
+
+    def write_match(
+        self,
+        competition: str,
+        season: int,
+        opta_match_id: str,
+        tables: t.Mapping[str, pa.Table],
+    ) -> None:
+        raise NotImplementedError
+
+    def load_state(self, competition: str, season: int) -> dict[str, dict[str, str]]:
+        """{opta_match_id: {output: manifest entry (JSON)}} of the matches already exported."""
+        return {}
+
+    def save_state(self, competition: str, season: int, state: t.Mapping[str, t.Mapping[str, str]]) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+import typing as t
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tidy_dvms.cache import atomic_write_bytes
+from tidy_dvms.sinks.base import Sink
+
+
+class ParquetSink(Sink):
+    """
+    Hive-partitioned Parquet lake, one file per table and match.
+
+    Layout: <root>/<table>/competition=<id>/season=<season>/match_id=<id>/part-0.parquet
+
+    - Files are written to a temp file and moved into place, so readers never see
+      a partial file and re-exporting a match replaces its partition.
+    - The sync manifest lives in <root>/_sync_state.json.
+
+    Read it back with any Hive-aware reader, for example
+    pl.scan_parquet("<root>/players_splits/**/*.parquet", hive_partitioning=True).
+    """
+
+    STATE_FILE = "_sync_state.json"
+    PART_FILE = "part-0.parquet"
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        *,
+        compression: str = "zstd",
+        compression_level: int | None = None,
+        row_group_size: int = 128_000,
+    ) -> None:
+        self.root = Path(root)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def partition_dir(self, table_name: str, competition: str, season: int, opta_match_id: str) -> Path:
+        return (
+            self.root
+            / table_name
+            / f"competition={competition}"
+            / f"season={season}"
+            / f"match_id={opta_match_id}"
+        )
+
+    def write_table(
+        self,
+        table_name: str,
+        table: pa.Table,
+        *,
+        competition: str,
+        season: int,
+        opta_match_id: str,
+    ) -> Path:
+        """Replace the partition of one match; an empty table removes it."""
+        directory = self.partition_dir(table_name, competition, season, opta_match_id)
+        path = directory / self.PART_FILE
+        if table.num_rows == 0:
+            path.unlink(missing_ok=True)
+            return path
+
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{self.PART_FILE}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            pq.write_table(
+                table,
+                tmp_name,
+                compression=self.compression,
+                compression_level=self.compression_level,
+                row_group_size=self.row_group_size,
+            )
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+        return path
+
+    def write_match(
+        self,
+        competition: str,
+        season: int,
+        opta_match_id: str,
+        tables: t.Mapping[str, pa.Table],
+    ) -> None:
+        for table_name, table in tables.items():
+            self.write_table(
+                table_name,
+                table,
+                competition=competition,
+                season=season,
+                opta_match_id=opta_match_id,
+            )
+
+    # -------- Sync manifest --------
+    @staticmethod
+    def _state_key(competition: str, season: int) -> str:
+        return f"competition={competition}/season={season}"
+
+    def _read_state_file(self) -> dict:
+        try:
+            return json.loads((self.root / self.STATE_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def load_state(self, competition: str, season: int) -> dict[str, dict[str, str]]:
+        return self._read_state_file().get(self._state_key(competition, season), {})
+
+    def save_state(self, competition: str, season: int, state: t.Mapping[str, t.Mapping[str, str]]) -> None:
+        data = self._read_state_file()
+        data[self._state_key(competition, season)] = {m: dict(v) for m, v in sorted(state.items())}
+        atomic_write_bytes(
+            self.root / self.STATE_FILE,
+            json.dumps(data, indent=2, sort_keys=True).encode("utf-8"),
+        )
@@ -0,0 +1,232 @@
+from __future__ import annotations
+import io
+import typing as t
+from contextlib import contextmanager
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import sqlalchemy as sa
+
+from tidy_dvms.sinks.base import TABLE_KEYS, Sink, to_arrow
+
+
+def sql_type(arrow_type: pa.DataType, *, key: bool = False) -> sa.types.TypeEngine:
+    """Portable SQL column type for an Arrow type (text key columns get a bounded length so they can be indexed)."""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pa.types.is_boolean(arrow_type):
+        return sa.Boolean()
+    if pa.types.is_integer(arrow_type):
+        if arrow_type.bit_width <= 16:
+            return sa.SmallInteger()
+        return sa.Integer() if arrow_type.bit_width <= 32 else sa.BigInteger()
+    if pa.types.is_floating(arrow_type):
+        return sa.REAL() if arrow_type.bit_width <= 32 else sa.Float()
+    if pa.types.is_timestamp(arrow_type):
+        return sa.DateTime()
+    if pa.types.is_date(arrow_type):
+        return sa.Date()
+    return sa.Unicode(64) if key else sa.UnicodeText()
+
+
+def _decode_dictionaries(table: pa.Table) -> pa.Table:
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+    return table
+
+
+class SQLSink(Sink):
+    """
+    Any SQLAlchemy database, loaded in bulk.
+
+    - Tables are created from the Arrow schema of the first frame loaded into them,
+      i.e. from the compact dtypes of tidy_dvms.schemas, with an index on OptaMatchId.
+    - load() / write_match() replace every row of the matches they load, in one
+      transaction, so re-runs never duplicate rows.
+    - Rows are inserted in batches of `batch_size` with the fastest path of the dialect:
+        postgresql (psycopg2 / psycopg): COPY ... FROM STDIN (CSV)
+        mssql+pyodbc:                    executemany with cursor.fast_executemany
+        other positional drivers:        one DBAPI executemany of plain tuples per batch
+        anything else:                   SQLAlchemy executemany (multi-row VALUES where supported)
+    - The sync manifest is kept in STATE_TABLE with the same layout as DuckDBSink: one
+      row per (match, output) with the JSON entry of SyncEngine in manifest_entry.
+    """
+
+    STATE_TABLE = "_sync_state"
+
+    def __init__(
+        self,
+        engine: sa.Engine | str,
+        *,
+        schema: str | None = None,
+        batch_size: int = 10_000,
+        keys: t.Mapping[str, t.Sequence[str]] | None = None,
+    ) -> None:
+        self.engine = sa.create_engine(engine) if isinstance(engine, str) else engine
+        self.schema = schema
+        self.batch_size = batch_size
+        self.keys: dict[str, tuple[str, ...]] = {**TABLE_KEYS, **{k: tuple(v) for k, v in (keys or {}).items()}}
+        self._metadata = sa.MetaData(schema=schema)
+        self._tables: dict[str, sa.Table] = {}
+
+    def close(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def _begin(self) -> t.Iterator[sa.Connection]:
+        try:
+            with self.engine.begin() as conn:
+                yield conn
+        except BaseException:
+            # Tables created inside a rolled back transaction may be gone; look them up again next time.
+            self._tables.clear()
+            self._metadata.clear()
+            raise
+
+    # -------- Tables --------
+    def _table(self, conn: sa.Connection, table_name: str, data: pa.Table) -> sa.Table:
+        """Existing table (reflected once) or a new one created from the Arrow schema of `data`."""
+        table = self._tables.get(table_name)
+        if table is not None:
+            return table
+        if sa.inspect(conn).has_table(table_name, schema=self.schema):
+            table = sa.Table(table_name, self._metadata, autoload_with=conn)
+        else:
+            keys = set(self.keys.get(table_name, ()))
+            table = sa.Table(
+                table_name,
+                self._metadata,
+                *(sa.Column(field.name, sql_type(field.type, key=field.name in keys)) for field in data.schema),
+            )
+            if "OptaMatchId" in data.column_names:
+                sa.Index(f"ix_{table_name}_OptaMatchId", table.c.OptaMatchId)
+            table.create(conn)
+        self._tables[table_name] = table
+        return table
+
+    # -------- Loads --------
+    def load(self, table_name: str, frame: t.Any) -> int:
+        """
+        Replace the rows of every match in `frame` (by OptaMatchId) with the rows of `frame`.
+
+        Returns:
+            Number of rows inserted.
+        """
+        data = to_arrow(frame)
+        if "OptaMatchId" not in data.column_names:
+            raise ValueError(f"Table {table_name!r} has no OptaMatchId column.")
+        match_ids = [m for m in pc.unique(data.column("OptaMatchId")).to_pylist() if m is not None]
+        with self._begin() as conn:
+            table = self._table(conn, table_name, data)
+            for start in range(0, len(match_ids), 500):
+                conn.execute(table.delete().where(table.c.OptaMatchId.in_(match_ids[start:start + 500])))
+            self._insert(conn, table, data)
+        return data.num_rows
+
+    def write_match(
+        self,
+        competition: str,
+        season: int,
+        opta_match_id: str,
+        tables: t.Mapping[str, pa.Table],
+    ) -> None:
+        """Replace every row of one match in each table, in a single transaction."""
+        with self._begin() as conn:
+            for table_name, frame in tables.items():
+                data = to_arrow(frame)
+                table = self._table(conn, table_name, data)
+                conn.execute(table.delete().where(table.c.OptaMatchId == int(opta_match_id)))
+                self._insert(conn, table, data)
+
+    def _insert(self, conn: sa.Connection, table: sa.Table, data: pa.Table) -> None:
+        columns = [name for name in data.column_names if name in table.c]
+        data = _decode_dictionaries(data.select(columns))
+        if data.num_rows == 0:
+            return
+        dialect = conn.dialect
+
+        if dialect.name == "postgresql" and dialect.driver in ("psycopg2", "psycopg"):
+            self._copy_postgres(conn, table, data)
+            return
+
+        # Python rows are built by Polars, several times faster than Arrow's to_pylist().
+        frame = pl.from_arrow(data)
+        batches = range(0, frame.height, self.batch_size)
+        if not dialect.positional:
+            for start in batches:
+                conn.execute(table.insert(), frame.slice(start, self.batch_size).to_dicts())
+            return
+
+        compiled = table.insert().compile(dialect=dialect, column_keys=columns)
+        frame = frame.select(list(compiled.positiontup))
+        cursor = conn.connection.cursor()
+        try:
+            if dialect.name == "mssql" and dialect.driver == "pyodbc":
+                cursor.fast_executemany = True
+            for start in batches:
+                cursor.executemany(str(compiled), frame.slice(start, self.batch_size).rows())
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _copy_postgres(conn: sa.Connection, table: sa.Table, data: pa.Table) -> None:
+        preparer = conn.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(name) for name in data.column_names)
+        sql = f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        buffer = io.BytesIO()
+        pacsv.write_csv(data, buffer, write_options=pacsv.WriteOptions(include_header=False))
+        cursor = conn.connection.cursor()
+        try:
+            if conn.dialect.driver == "psycopg2":
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+    # -------- Sync manifest --------
+    def _state_table(self, conn: sa.Connection) -> sa.Table:
+        table = self._tables.get(self.STATE_TABLE)
+        if table is None:
+            table = sa.Table(
+                self.STATE_TABLE,
+                self._metadata,
+                sa.Column("competition", sa.Unicode(32)),
+                sa.Column("season", sa.Integer),
+                sa.Column("opta_match_id", sa.Unicode(32)),
+                sa.Column("output", sa.Unicode(32)),
+                sa.Column("manifest_entry", sa.UnicodeText),
+            )
+            table.create(conn, checkfirst=True)
+            self._tables[self.STATE_TABLE] = table
+        return table
+
+    def load_state(self, competition: str, season: int) -> dict[str, dict[str, str]]:
+        with self._begin() as conn:
+            table = self._state_table(conn)
+            rows = conn.execute(
+                sa.select(table.c.opta_match_id, table.c.output, table.c.manifest_entry).where(
+                    table.c.competition == competition, table.c.season == season
+                )
+            ).all()
+        state: dict[str, dict[str, str]] = {}
+        for opta_match_id, output, manifest_entry in rows:
+            state.setdefault(opta_match_id, {})[output] = manifest_entry
+        return state
+
+    def save_state(self, competition: str, season: int, state: t.Mapping[str, t.Mapping[str, str]]) -> None:
+        rows = [
+            {"competition": competition, "season": season, "opta_match_id": m, "output": output, "manifest_entry": entry}
+            for m, outputs in state.items()
+            for output, entry in outputs.items()
+        ]
+        with self._begin() as conn:
+            table = self._state_table(conn)
+            conn.execute(table.delete().where(table.c.competition == competition, table.c.season == season))
+            if rows:
+                conn.execute(table.insert(), rows)
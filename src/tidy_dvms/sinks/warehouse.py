@@ -0,0 +1,168 @@
+from __future__ import annotations
+import os
+import typing as t
+
+import pyarrow as pa
+
+from tidy_dvms.engine import DuckDBEngine
+from tidy_dvms.sinks.base import TABLE_KEYS, Sink, to_arrow
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DuckDBSink(Sink):
+    """
+    Local DuckDB warehouse with one table per output and idempotent loads.
+
+    - Tables are created from the first frame loaded into them.
+    - upsert() replaces stored rows that share a key (TABLE_KEYS) with an incoming row.
+    - write_match() (used by DVMS.export_season) replaces every row of the match, so
+      rows dropped from a re-published asset disappear too.
+    - Frames are handed to DuckDB as Arrow tables and loaded with one set-based
+      DELETE + INSERT per table inside a transaction.
+    - The sync manifest is kept in STATE_TABLE, one row per (match, output) whose
+      manifest_entry column holds the JSON entry written by SyncEngine (asset ids,
+      content hash, transform version).
+    """
+
+    STATE_TABLE = "_sync_state"
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        keys: t.Mapping[str, t.Sequence[str]] | None = None,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+    ) -> None:
+        self.path = str(path)
+        self.keys: dict[str, tuple[str, ...]] = {**TABLE_KEYS, **{k: tuple(v) for k, v in (keys or {}).items()}}
+        self._engine = DuckDBEngine(threads=threads, memory_limit=memory_limit, database=self.path)
+
+    def close(self) -> None:
+        self._engine.close()
+
+    # -------- Loads --------
+    def upsert(self, table_name: str, frame: t.Any) -> int:
+        """
+        Insert `frame` into `table_name`, replacing stored rows with the same key.
+
+        Args:
+            table_name: one of TABLE_KEYS (or a table given through keys=)
+            frame: Polars / pandas DataFrame or Arrow table holding every key column
+
+        Returns:
+            Number of rows loaded.
+        """
+        keys = self.keys.get(table_name)
+        if not keys:
+            raise ValueError(f"No key registered for table {table_name!r}; pass keys={{{table_name!r}: [...]}}.")
+        table = to_arrow(frame)
+        missing = [key for key in keys if key not in table.column_names]
+        if missing:
+            raise ValueError(f"Table {table_name!r} is missing key column(s) {missing}.")
+
+        matches_key = " AND ".join(f"t.{_quote(key)} IS NOT DISTINCT FROM i.{_quote(key)}" for key in keys)
+        with self._engine.session({"incoming": table}) as con:
+            self._load(
+                con,
+                [(
+                    table_name,
+                    "incoming",
+                    f"DELETE FROM {_quote(table_name)} AS t WHERE EXISTS (SELECT 1 FROM incoming AS i WHERE {matches_key})",
+                    None,
+                )],
+            )
+        return table.num_rows
+
+    def write_match(
+        self,
+        competition: str,
+        season: int,
+        opta_match_id: str,
+        tables: t.Mapping[str, pa.Table],
+    ) -> None:
+        """Replace every row of one match in each table, in a single transaction."""
+        incoming = {f"incoming_{i}": to_arrow(table) for i, table in enumerate(tables.values())}
+        statements = [
+            (table_name, source, f"DELETE FROM {_quote(table_name)} WHERE OptaMatchId = $match_id", {"match_id": int(opta_match_id)})
+            for table_name, source in zip(tables, incoming)
+        ]
+        with self._engine.session(incoming) as con:
+            self._load(con, statements)
+
+    @staticmethod
+    def _load(con, statements: list[tuple[str, str, str, dict | None]]) -> None:
+        """(table, source, delete statement, parameters) -> create if needed, delete, insert; all or nothing."""
+        con.execute("BEGIN TRANSACTION")
+        try:
+            for table_name, source, delete_sql, parameters in statements:
+                con.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table_name)} AS SELECT * FROM {source} LIMIT 0")
+                con.execute(delete_sql, parameters)
+                con.execute(f"INSERT INTO {_quote(table_name)} BY NAME SELECT * FROM {source}")
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+
+    # -------- Reads --------
+    def pl(self, sql: str, parameters: t.Any = None):
+        """Query the warehouse and return a Polars DataFrame."""
+        return self._engine.pl(sql, parameters)
+
+    # -------- Sync manifest --------
+    def _ensure_state_table(self, con) -> None:
+        con.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.STATE_TABLE} (
+                competition VARCHAR,
+                season INTEGER,
+                opta_match_id VARCHAR,
+                output VARCHAR,
+                manifest_entry VARCHAR
+            )
+            """
+        )
+
+    def load_state(self, competition: str, season: int) -> dict[str, dict[str, str]]:
+        with self._engine.session() as con:
+            self._ensure_state_table(con)
+            rows = con.execute(
+                f"SELECT opta_match_id, output, manifest_entry FROM {self.STATE_TABLE} "
+                "WHERE competition = $competition AND season = $season",
+                {"competition": competition, "season": season},
+            ).fetchall()
+        state: dict[str, dict[str, str]] = {}
+        for opta_match_id, output, manifest_entry in rows:
+            state.setdefault(opta_match_id, {})[output] = manifest_entry
+        return state
+
+    def save_state(self, competition: str, season: int, state: t.Mapping[str, t.Mapping[str, str]]) -> None:
+        rows = [(m, output, entry) for m, outputs in state.items() for output, entry in outputs.items()]
+        state_rows = pa.table(
+            {
+                "opta_match_id": pa.array([r[0] for r in rows], type=pa.string()),
+                "output": pa.array([r[1] for r in rows], type=pa.string()),
+                "manifest_entry": pa.array([r[2] for r in rows], type=pa.string()),
+            }
+        )
+        parameters = {"competition": competition, "season": season}
+        with self._engine.session({"state_rows": state_rows}) as con:
+            self._ensure_state_table(con)
+            con.execute("BEGIN TRANSACTION")
+            try:
+                con.execute(
+                    f"DELETE FROM {self.STATE_TABLE} WHERE competition = $competition AND season = $season",
+                    parameters,
+                )
+                con.execute(
+                    f"INSERT INTO {self.STATE_TABLE} "
+                    "SELECT $competition, $season, opta_match_id, output, manifest_entry FROM state_rows",
+                    parameters,
+                )
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
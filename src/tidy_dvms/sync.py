@@ -0,0 +1,349 @@
+from __future__ import annotations
+import hashlib
+import json
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from tidy_dvms.async_client import AsyncDVMS
+    from tidy_dvms.client import DVMS
+    from tidy_dvms.sinks.base import Sink
+
+# Bump whenever a transform changes the rows or columns it produces: every output
+# synced with an older version is rebuilt on the next run.
+TRANSFORM_VERSION = 2
+
+# Why an output is (re)processed
+NEW = "new"
+REPUBLISHED = "republished"
+TRANSFORM_BUMP = "transform_version"
+
+
+def content_hash(payloads: t.Mapping[int, t.Any], sub_types: t.Iterable[int]) -> str:
+    """sha256 over the raw payloads of `sub_types` (metadata dicts are hashed as canonical JSON)."""
+    digest = hashlib.sha256()
+    for sub_type in sorted(sub_types):
+        payload = payloads[sub_type]
+        text = payload if isinstance(payload, str) else json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        digest.update(f"{sub_type}:{len(text)}:".encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """
+    What has been synced for one competition/season.
+
+    One entry per (match, output): the ids of the assets it was built from, a content
+    hash of their payloads and the TRANSFORM_VERSION that produced it. Entries are
+    persisted through the sink's load_state()/save_state() as JSON strings.
+    """
+
+    def __init__(self, entries: dict[str, dict[str, dict]] | None = None) -> None:
+        self.entries: dict[str, dict[str, dict]] = entries or {}
+
+    @classmethod
+    def from_state(cls, state: t.Mapping[str, t.Mapping[str, str]]) -> "SyncManifest":
+        entries: dict[str, dict[str, dict]] = {}
+        for match_id, outputs in state.items():
+            for output, raw in outputs.items():
+                try:
+                    entry = json.loads(raw)
+                except (TypeError, ValueError):
+                    # Unreadable entry: the output is treated as new and synced again.
+                    continue
+                if isinstance(entry, dict) and {"assets", "content_hash", "transform_version"} <= entry.keys():
+                    entries.setdefault(match_id, {})[output] = entry
+        return cls(entries)
+
+    def to_state(self) -> dict[str, dict[str, str]]:
+        return {
+            match_id: {output: json.dumps(entry, sort_keys=True) for output, entry in outputs.items()}
+            for match_id, outputs in self.entries.items()
+        }
+
+    def get(self, opta_match_id: str, output: str) -> dict | None:
+        return self.entries.get(opta_match_id, {}).get(output)
+
+    def record(
+        self,
+        opta_match_id: str,
+        output: str,
+        *,
+        asset_ids: t.Mapping[int, str],
+        content_hash: str,
+        transform_version: int | None = None,
+    ) -> None:
+        self.entries.setdefault(opta_match_id, {})[output] = {
+            "assets": {str(sub_type): asset_id for sub_type, asset_id in sorted(asset_ids.items())},
+            "content_hash": content_hash,
+            "transform_version": TRANSFORM_VERSION if transform_version is None else transform_version,
+        }
+
+    def change(self, opta_match_id: str, output: str, asset_ids: t.Mapping[int, str]) -> str | None:
+        """NEW, REPUBLISHED, TRANSFORM_BUMP, or None when the output is up to date."""
+        entry = self.get(opta_match_id, output)
+        if entry is None:
+            return NEW
+        if entry["assets"] != {str(sub_type): asset_id for sub_type, asset_id in asset_ids.items()}:
+            return REPUBLISHED
+        if entry["transform_version"] != TRANSFORM_VERSION:
+            return TRANSFORM_BUMP
+        return None
+
+    def is_identical(self, opta_match_id: str, output: str, digest: str) -> bool:
+        """Whether a re-published output has the same content and transform version as the synced one."""
+        entry = self.get(opta_match_id, output)
+        return (
+            entry is not None
+            and entry["content_hash"] == digest
+            and entry["transform_version"] == TRANSFORM_VERSION
+        )
+
+
+class SyncEngine:
+    """
+    Incremental export of a competition/season from a DVMS client into a sink.
+
+    Only outputs whose assets are newly ready, re-published (different asset ids) or
+    were built by an older TRANSFORM_VERSION are downloaded. A re-published output whose
+    payloads hash to the synced content is not transformed or written again; only its
+    manifest entry is updated. The manifest is saved after every batch, so an interrupted
+    run resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        client: DVMS,
+        sink: Sink,
+        *,
+        outputs: t.Iterable[str] = ("splits", "summary", "events", "lineups"),
+        batch_size: int = 50,
+        max_workers: int | None = None,
+        full_refresh: bool = False,
+        on_batch: t.Callable[[dict[str, t.Any]], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            outputs: Any of "splits", "summary", "events", "lineups"
+            batch_size: Matches downloaded and transformed together
+            max_workers: Concurrent downloads, defaults to the client's session pool size
+            full_refresh: Ignore the manifest and export every ready match
+            on_batch: Called with the running report after every batch (progress reporting)
+        """
+        self.client = client
+        self.sink = sink
+        self.outputs = tuple(dict.fromkeys(output.lower() for output in outputs))
+        unknown = [output for output in self.outputs if output not in client.EXPORT_SUB_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown outputs {unknown}; expected any of {sorted(client.EXPORT_SUB_TYPES)}")
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max_workers
+        self.full_refresh = full_refresh
+        self.on_batch = on_batch
+
+    def plan(
+        self,
+        manifest: SyncManifest,
+        match_ids: t.Iterable[str],
+        report: dict[str, t.Any],
+    ) -> dict[str, dict[str, tuple[dict[int, str], str]]]:
+        """{opta_match_id: {output: (asset ids, reason)}} of the outputs to sync; the rest is reported as is."""
+        pending: dict[str, dict[str, tuple[dict[int, str], str]]] = {}
+        for match_id in match_ids:
+            ready = False
+            for output in self.outputs:
+                asset_ids = self.client._ready_asset_ids(match_id, self.client.EXPORT_SUB_TYPES[output])
+                if asset_ids is None:
+                    continue
+                ready = True
+                reason = manifest.change(match_id, output, asset_ids)
+                if reason is not None:
+                    pending.setdefault(match_id, {})[output] = (asset_ids, reason)
+            if match_id not in pending:
+                report["unchanged" if ready else "not_ready"].append(match_id)
+        return pending
+
+    def run(
+        self,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        opta_match_ids: t.Iterable[str | int] | None = None,
+    ) -> dict[str, t.Any]:
+        """
+        Sync one competition/season.
+
+        Returns:
+            {
+                "exported": [...],   matches written to the sink
+                "identical": [...],  re-published matches whose content did not change
+                "unchanged": [...],  matches already up to date (nothing downloaded)
+                "not_ready": [...],  matches without ready assets for any output
+                "failed": {opta_match_id: exception},  retried on the next run
+                "reasons": {opta_match_id: {output: "new" | "republished" | "transform_version"}},
+                "pending": number of matches to sync,
+                "rows": {table name: rows written},
+                "seconds": wall time of the run,
+            }
+        """
+        started = time.perf_counter()
+        self.client._ensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+        competition_key, season_key, manifest, pending, report = self._start(opta_match_ids)
+        for batch, sub_types in self._batches(pending):
+            results = self.client.fetch_many(
+                batch,
+                competition=competition,
+                season=season,
+                creds=creds,
+                sub_types=sub_types,
+                max_workers=self.max_workers,
+            )
+            self._finish_batch(manifest, batch, results, competition_key, season_key, report, started)
+        report["seconds"] = time.perf_counter() - started
+        return report
+
+    async def arun(
+        self,
+        downloader: AsyncDVMS,
+        *,
+        competition: str | None = None,
+        season: int | None = None,
+        creds: dict[str, str] | None = None,
+        opta_match_ids: t.Iterable[str | int] | None = None,
+    ) -> dict[str, t.Any]:
+        """
+        run() with downloads awaited through `downloader`, an AsyncDVMS wrapping this
+        engine's client. Transforms and sink writes run in a worker thread so the event
+        loop is never blocked.
+        """
+        import asyncio
+
+        started = time.perf_counter()
+        await downloader._aensure_fixtures_loaded(competition=competition, season=season, creds=creds)
+        competition_key, season_key, manifest, pending, report = await asyncio.to_thread(self._start, opta_match_ids)
+        for batch, sub_types in self._batches(pending):
+            results = await downloader.fetch_many(
+                batch,
+                competition=competition,
+                season=season,
+                creds=creds,
+                sub_types=sub_types,
+                max_workers=self.max_workers,
+            )
+            await asyncio.to_thread(
+                self._finish_batch, manifest, batch, results, competition_key, season_key, report, started
+            )
+        report["seconds"] = time.perf_counter() - started
+        return report
+
+    def _start(
+        self,
+        opta_match_ids: t.Iterable[str | int] | None,
+    ) -> tuple[str, int, SyncManifest, dict[str, dict[str, tuple[dict[int, str], str]]], dict[str, t.Any]]:
+        """(competition key, season key, manifest, pending outputs, empty report) of a run; fixtures must be loaded."""
+        client = self.client
+        competition_key, season_key = str(client._opta_competition_id), int(client.season_id)  # type: ignore[arg-type]
+        manifest = SyncManifest() if self.full_refresh else SyncManifest.from_state(
+            self.sink.load_state(competition_key, season_key)
+        )
+        if opta_match_ids is None:
+            match_ids = [m for m in client._match_sub_types if m]
+        else:
+            match_ids = list(dict.fromkeys(client._normalize_opta_match_id(m) for m in opta_match_ids))
+
+        report: dict[str, t.Any] = {
+            "exported": [],
+            "identical": [],
+            "unchanged": [],
+            "not_ready": [],
+            "failed": {},
+            "reasons": {},
+            "pending": 0,
+            "rows": {},
+            "seconds": 0.0,
+        }
+        pending = self.plan(manifest, match_ids, report)
+        report["reasons"] = {m: {o: reason for o, (_, reason) in outputs.items()} for m, outputs in pending.items()}
+        report["pending"] = len(pending)
+        return competition_key, season_key, manifest, pending, report
+
+    def _batches(
+        self,
+        pending: dict[str, dict[str, tuple[dict[int, str], str]]],
+    ) -> t.Iterator[tuple[dict[str, dict[str, tuple[dict[int, str], str]]], list[int]]]:
+        """(batch of pending matches, sub types to download for it) in batch_size chunks."""
+        pending_ids = list(pending)
+        for start in range(0, len(pending_ids), self.batch_size):
+            batch = {match_id: pending[match_id] for match_id in pending_ids[start:start + self.batch_size]}
+            sub_types = {
+                sub_type
+                for outputs in batch.values()
+                for output in outputs
+                for sub_type in self.client.EXPORT_SUB_TYPES[output]
+            }
+            yield batch, sorted(sub_types)
+
+    def _finish_batch(
+        self,
+        manifest: SyncManifest,
+        batch: dict[str, dict[str, tuple[dict[int, str], str]]],
+        results: dict[str, dict],
+        competition: str,
+        season: int,
+        report: dict[str, t.Any],
+        started: float,
+    ) -> None:
+        """Write a downloaded batch, save the manifest and report progress."""
+        self._sync_batch(manifest, batch, results, competition, season, report)
+        self.sink.save_state(competition, season, manifest.to_state())
+        report["seconds"] = time.perf_counter() - started
+        if self.on_batch is not None:
+            self.on_batch(report)
+
+    def _sync_batch(
+        self,
+        manifest: SyncManifest,
+        batch: dict[str, dict[str, tuple[dict[int, str], str]]],
+        results: dict[str, dict],
+        competition: str,
+        season: int,
+        report: dict[str, t.Any],
+    ) -> None:
+        client = self.client
+        digests: dict[str, dict[str, str]] = {}
+        to_build: dict[str, list[str]] = {}
+        for match_id, outputs in batch.items():
+            result = results[match_id]
+            for output, (asset_ids, reason) in outputs.items():
+                sub_types = client.EXPORT_SUB_TYPES[output]
+                if any(sub_type in result["errors"] for sub_type in sub_types):
+                    # Downloads failed: handed to the build step, which reports the error.
+                    to_build.setdefault(match_id, []).append(output)
+                    continue
+                digest = content_hash(result["assets"], sub_types)
+                digests.setdefault(match_id, {})[output] = digest
+                if reason == REPUBLISHED and manifest.is_identical(match_id, output, digest):
+                    manifest.record(match_id, output, asset_ids=asset_ids, content_hash=digest)
+                else:
+                    to_build.setdefault(match_id, []).append(output)
+
+        for match_id in batch:
+            if match_id not in to_build:
+                report["identical"].append(match_id)
+
+        tables, failed = client._export_tables(results, to_build)
+        for match_id, match_tables in tables.items():
+            try:
+                self.sink.write_match(competition, season, match_id, match_tables)
+            except Exception as e:
+                failed[match_id] = e
+                continue
+            for output in to_build[match_id]:
+                asset_ids, _ = batch[match_id][output]
+                manifest.record(match_id, output, asset_ids=asset_ids, content_hash=digests[match_id][output])
+            for table_name, table in match_tables.items():
+                report["rows"][table_name] = report["rows"].get(table_name, 0) + table.num_rows
+            report["exported"].append(match_id)
+        report["failed"].update(failed)
@@ -0,0 +1,368 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+import typing as t
+import zlib
+from pathlib import Path
+
+import pyarrow as pa
+
+from tidy_dvms.cache import atomic_write_bytes
+
+# One row per tracked object per frame (home/away players and the ball).
+TRACKING_SCHEMA = pa.schema(
+    [
+        ("period", pa.int8()),
+        ("frame_idx", pa.int32()),
+        ("game_clock", pa.float64()),
+        ("wall_clock", pa.int64()),
+        ("live", pa.bool_()),
+        ("last_touch", pa.string()),
+        ("team", pa.string()),
+        ("player_id", pa.string()),
+        ("opta_player_id", pa.string()),
+        ("jersey_number", pa.int16()),
+        ("x", pa.float32()),
+        ("y", pa.float32()),
+        ("z", pa.float32()),
+        ("speed", pa.float32()),
+    ]
+)
+
+# 60 seconds of 25 Hz tracking per batch.
+DEFAULT_BATCH_FRAMES = 1500
+
+GZIP_MAGIC = b"\x1f\x8b"
+READ_CHUNK_BYTES = 1 << 20
+
+
+class _ColumnBuffers:
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self.columns: dict[str, list] = {name: [] for name in TRACKING_SCHEMA.names}
+        self.frames = 0
+
+    def add_frame(self, frame: dict) -> None:
+        frame_values = (
+            frame.get("period"),
+            frame.get("frameIdx"),
+            frame.get("gameClock"),
+            frame.get("wallClock"),
+            frame.get("live"),
+            frame.get("lastTouch"),
+        )
+        for team, key in (("home", "homePlayers"), ("away", "awayPlayers")):
+            for player in frame.get(key) or []:
+                opta_id = player.get("optaId")
+                self._add_row(
+                    frame_values,
+                    team,
+                    player.get("playerId"),
+                    str(opta_id) if opta_id is not None else None,
+                    player.get("number"),
+                    player.get("xyz"),
+                    player.get("speed"),
+                )
+        ball = frame.get("ball")
+        if ball:
+            self._add_row(frame_values, "ball", None, None, None, ball.get("xyz"), ball.get("speed"))
+        self.frames += 1
+
+    def _add_row(self, frame_values, team, player_id, opta_player_id, number, xyz, speed) -> None:
+        c = self.columns
+        for name, value in zip(
+            ("period", "frame_idx", "game_clock", "wall_clock", "live", "last_touch"),
+            frame_values,
+        ):
+            c[name].append(value)
+        xyz = list(xyz or []) + [None, None, None]
+        c["team"].append(team)
+        c["player_id"].append(player_id)
+        c["opta_player_id"].append(opta_player_id)
+        c["jersey_number"].append(number)
+        c["x"].append(xyz[0])
+        c["y"].append(xyz[1])
+        c["z"].append(xyz[2])
+        c["speed"].append(speed)
+
+    def flush(self) -> pa.RecordBatch:
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(self.columns[f.name], type=f.type) for f in TRACKING_SCHEMA],
+            schema=TRACKING_SCHEMA,
+        )
+        self._reset()
+        return batch
+
+
+def iter_tracking_batches(
+    lines: t.Iterable[str | bytes],
+    *,
+    batch_frames: int = DEFAULT_BATCH_FRAMES,
+) -> t.Iterator[pa.RecordBatch]:
+    """
+    Parse Second Spectrum JSONL tracking (one frame per line) into Arrow record batches.
+
+    Only `batch_frames` frames are buffered at a time, so memory stays bounded
+    regardless of the match length.
+    """
+    buffers = _ColumnBuffers()
+    for line in lines:
+        if not line or not line.strip():
+            continue
+        buffers.add_frame(json.loads(line))
+        if buffers.frames >= batch_frames:
+            yield buffers.flush()
+    if buffers.frames:
+        yield buffers.flush()
+
+
+def _gunzip(chunks: t.Iterator[bytes]) -> t.Iterator[bytes]:
+    """Decompress gzip byte chunks as they arrive (concatenated members included)."""
+    decoder = zlib.decompressobj(wbits=31)
+    for chunk in chunks:
+        while chunk:
+            yield decoder.decompress(chunk)
+            if not decoder.eof:
+                break
+            chunk = decoder.unused_data
+            decoder = zlib.decompressobj(wbits=31)
+
+
+def _decoded_chunks(chunks: t.Iterable[bytes]) -> t.Iterator[bytes]:
+    """Payload bytes, gunzipped on the fly when the payload starts with the gzip magic."""
+    chunks = iter(chunks)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= len(GZIP_MAGIC):
+            break
+    body = _prepend(head, chunks)
+    yield from _gunzip(body) if head.startswith(GZIP_MAGIC) else body
+
+
+def _prepend(head: bytes, chunks: t.Iterator[bytes]) -> t.Iterator[bytes]:
+    yield head
+    yield from chunks
+
+
+def iter_tracking_stream(
+    chunks: t.Iterable[bytes],
+    *,
+    batch_frames: int = DEFAULT_BATCH_FRAMES,
+) -> t.Iterator[pa.RecordBatch]:
+    """
+    Stream record batches from a JSONL tracking payload given as byte chunks (plain or
+    gzip), e.g. an HTTP response body or a file read in blocks.
+    """
+
+    def lines() -> t.Iterator[bytes]:
+        rest = b""
+        for data in _decoded_chunks(chunks):
+            *complete, rest = (rest + data).split(b"\n")
+            yield from complete
+        yield rest
+
+    yield from iter_tracking_batches(lines(), batch_frames=batch_frames)
+
+
+def iter_tracking_file(
+    path: str | os.PathLike,
+    *,
+    batch_frames: int = DEFAULT_BATCH_FRAMES,
+) -> t.Iterator[pa.RecordBatch]:
+    """Stream record batches from a JSONL tracking file on disk (plain or gzip)."""
+    with Path(path).open("rb") as f:
+        yield from iter_tracking_stream(iter(lambda: f.read(READ_CHUNK_BYTES), b""), batch_frames=batch_frames)
+
+
+# -------- Memory-mapped tracking store --------
+
+def _bucket_runs(batch: pa.RecordBatch) -> t.Iterator[tuple[tuple[int, int], pa.RecordBatch]]:
+    """Split a batch into consecutive runs sharing the same (period, game-clock minute)."""
+    import numpy as np
+    import pyarrow.compute as pc
+
+    if batch.num_rows == 0:
+        return
+    periods = pc.fill_null(batch.column("period"), 0).to_numpy(zero_copy_only=False).astype("int64")
+    clock = pc.fill_null(batch.column("game_clock"), -60.0).to_numpy(zero_copy_only=False)
+    minutes = np.floor(clock / 60).astype("int64")
+
+    changes = np.flatnonzero((periods[1:] != periods[:-1]) | (minutes[1:] != minutes[:-1])) + 1
+    starts = [0, *changes.tolist()]
+    ends = [*changes.tolist(), batch.num_rows]
+    for start, end in zip(starts, ends):
+        yield (int(periods[start]), int(minutes[start])), batch.slice(start, end - start)
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".index.json")
+
+
+def is_complete_tracking_store(path: str | os.PathLike) -> bool:
+    """True when `path` and its sidecar index exist and the index was written for this very file."""
+    path = Path(path)
+    try:
+        index = json.loads(_index_path(path).read_text(encoding="utf-8"))
+        return isinstance(index, dict) and index.get("bytes") == path.stat().st_size
+    except (OSError, ValueError):
+        return False
+
+
+def write_tracking_store(
+    batches: t.Iterable[pa.RecordBatch],
+    path: str | os.PathLike,
+) -> Path:
+    """
+    Persist tracking batches to an uncompressed Arrow IPC (Feather v2) file.
+
+    Rows are regrouped so every record batch in the file covers exactly one
+    (period, game-clock minute). A sidecar `<path>.index.json` maps each bucket
+    to its batch number and row range, which TrackingStore uses for window reads.
+
+    The file is written to a temp file and moved into place, and the index is
+    written last, so an interrupted write never leaves a store that
+    is_complete_tracking_store() accepts.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index: list[dict] = []
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        _write_buckets(batches, tmp_name, index)
+        # The previous index must never describe the new file.
+        _index_path(path).unlink(missing_ok=True)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    index_doc = {"version": 2, "bytes": path.stat().st_size, "buckets": index}
+    atomic_write_bytes(_index_path(path), json.dumps(index_doc).encode("utf-8"))
+    return path
+
+
+def _write_buckets(batches: t.Iterable[pa.RecordBatch], path: str, index: list[dict]) -> None:
+    """Write one record batch per (period, minute) bucket to `path`, appending its entry to `index`."""
+    pending: list[pa.RecordBatch] = []
+    pending_key: tuple[int, int] | None = None
+    row_start = 0
+
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, TRACKING_SCHEMA) as writer:
+
+        def flush() -> None:
+            nonlocal row_start
+            if not pending:
+                return
+            bucket = pa.Table.from_batches(pending, schema=TRACKING_SCHEMA).combine_chunks()
+            for out in bucket.to_batches(max_chunksize=max(bucket.num_rows, 1)):
+                writer.write_batch(out)
+            index.append(
+                {
+                    "period": pending_key[0],
+                    "minute": pending_key[1],
+                    "batch": len(index),
+                    "row_start": row_start,
+                    "row_count": bucket.num_rows,
+                }
+            )
+            row_start += bucket.num_rows
+            pending.clear()
+
+        for batch in batches:
+            for key, run in _bucket_runs(batch):
+                if key != pending_key:
+                    flush()
+                    pending_key = key
+                pending.append(run)
+        flush()
+
+
+def _clock_seconds(value: float | str) -> float:
+    """Accept seconds or an 'mm:ss' game-clock string."""
+    if isinstance(value, str):
+        minutes, _, seconds = value.partition(":")
+        return int(minutes) * 60 + float(seconds or 0)
+    return float(value)
+
+
+class TrackingStore:
+    """
+    Read-only, memory-mapped view over a file written by write_tracking_store().
+
+    Window reads only touch the (period, minute) batches that overlap the window.
+    Whole-minute batches are returned zero-copy from the memory map, and only the
+    two edge minutes are filtered.
+
+    Usage:
+        store = TrackingStore("tracking_2561923.arrow")
+        table = store.window(period=2, start="10:00", end="12:00")
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+        self._source = pa.memory_map(str(self.path), "r")
+        self._reader = pa.ipc.open_file(self._source)
+        buckets = json.loads(_index_path(self.path).read_text(encoding="utf-8"))["buckets"]
+        self._buckets: dict[tuple[int, int], list[dict]] = {}
+        for bucket in buckets:
+            self._buckets.setdefault((bucket["period"], bucket["minute"]), []).append(bucket)
+
+    def __enter__(self) -> "TrackingStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._source.close()
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self._reader.schema
+
+    def read_all(self) -> pa.Table:
+        """Whole match as a table backed by the memory map."""
+        return self._reader.read_all()
+
+    def periods(self) -> list[int]:
+        return sorted({period for period, _ in self._buckets})
+
+    def row_ranges(self, period: int, start: float | str, end: float | str) -> list[tuple[int, int]]:
+        """(row_start, row_count) of every bucket overlapping [start, end) in `period`."""
+        return [(b["row_start"], b["row_count"]) for b in self._window_buckets(period, start, end)]
+
+    def _window_buckets(self, period: int, start: float | str, end: float | str) -> list[dict]:
+        start_s, end_s = _clock_seconds(start), _clock_seconds(end)
+        first_minute, last_minute = int(start_s // 60), int((end_s - 1e-9) // 60)
+        return sorted(
+            (
+                bucket
+                for minute in range(first_minute, last_minute + 1)
+                for bucket in self._buckets.get((period, minute), [])
+            ),
+            key=lambda b: b["batch"],
+        )
+
+    def window(self, period: int, start: float | str, end: float | str) -> pa.Table:
+        """Rows of `period` with start <= game_clock < end (seconds or 'mm:ss')."""
+        import pyarrow.compute as pc
+
+        start_s, end_s = _clock_seconds(start), _clock_seconds(end)
+        batches = []
+        for bucket in self._window_buckets(period, start, end):
+            batch = self._reader.get_batch(bucket["batch"])
+            minute_start = bucket["minute"] * 60
+            if minute_start < start_s or minute_start + 60 > end_s:
+                clock = batch.column("game_clock")
+                batch = batch.filter(pc.and_(pc.greater_equal(clock, start_s), pc.less(clock, end_s)))
+            batches.append(batch)
+        return pa.Table.from_batches(batches, schema=self.schema)
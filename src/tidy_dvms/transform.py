@@ -30,59 +30,92 @@ def transform_fixtures(df):
     return df
 
 
-def physical_splits(season_id, opta_competition_id, metadata_df, physical_splits_raw, opta_match_id, physical_splits):
-    
-    def read_csv(data: str) -> list:
-        return [
-            row
-            for row in csv.reader(io.StringIO(data))
-            if any(cell.strip() for cell in row)
-        ]
-
-    df_matchlineups = transform_matchlineups(
+def _read_splits_csv(data: str) -> list:
+    return [
+        row
+        for row in csv.reader(io.StringIO(data))
+        if any(cell.strip() for cell in row)
+    ]
+
+
+def _read_physical_data(data: str):
+    cleaned_data = []
+
+    # If 'data' looks like a path to an existing file, open it
+    if os.path.exists(data):
+        f = open(data, "r")
+    else:
+        # Otherwise treat it as CSV text
+        f = io.StringIO(data)
+
+    with f:
+        csvreader = csv.reader(f, delimiter=",")
+        for row in csvreader:
+            cleaned_data.append(row[0:24])
+
+    return cleaned_data
+
+
+def _match_lineups(metadata_df, engine=None):
+    return transform_matchlineups(
         metadata_df,
         table_name='match_lineups',
-        sql_query='SELECT * FROM match_lineups'
+        sql_query='SELECT * FROM match_lineups',
+        engine=engine,
     )
 
-    ps_instance = ps_module.PhysicalSplit(physical_splits_raw, season_id, opta_competition_id, opta_match_id, df_matchlineups, physical_splits)
 
-    splits_list = read_csv(physical_splits_raw)
+def physical_splits(season_id, opta_competition_id, metadata_df, physical_splits_raw, opta_match_id, physical_splits, engine=None):
+
+    df_matchlineups = _match_lineups(metadata_df, engine)
+
+    ps_instance = ps_module.PhysicalSplit(physical_splits_raw, season_id, opta_competition_id, opta_match_id, df_matchlineups, physical_splits, engine=engine)
+
+    splits_list = _read_splits_csv(physical_splits_raw)
 
     players_df, players_df_normalized, teams_df, teams_df_normalized = ps_instance.transform_physical_splits(splits_list, opta_match_id)
 
     return players_df, players_df_normalized, teams_df, teams_df_normalized
 
 
+def physical_splits_batch(matches, df_fixtures, engine=None):
+    """
+    Physical splits for many matches at once.
 
-def physical_summary(df_fixtures, metadata_df, physical_summary_raw, opta_match_id):
-    
-    def read_physical_data(data: str):
-        cleaned_data = []
+    Args:
+        matches: iterable of (opta_match_id, metadata_df, physical_splits_raw)
 
-        # If 'data' looks like a path to an existing file, open it
-        if os.path.exists(data):
-            f = open(data, "r")
-        else:
-            # Otherwise treat it as CSV text
-            f = io.StringIO(data)
+    Returns:
+        players_df, players_df_normalized, teams_df, teams_df_normalized with an OptaMatchId column.
+    """
+    batch = [
+        (opta_match_id, _read_splits_csv(physical_splits_raw), _match_lineups(metadata_df, engine))
+        for opta_match_id, metadata_df, physical_splits_raw in matches
+    ]
+    return ps_module.transform_physical_splits_batch(batch, df_fixtures, engine=engine)
 
-        with f:
-            csvreader = csv.reader(f, delimiter=",")
-            for row in csvreader:
-                cleaned_data.append(row[0:24])
 
-        return cleaned_data
+def physical_summary(df_fixtures, metadata_df, physical_summary_raw, opta_match_id, engine=None):
 
-    df_matchlineups = transform_matchlineups(
-        metadata_df,
-        table_name='match_lineups',
-        sql_query='SELECT * FROM match_lineups'
-    )
+    df_matchlineups = _match_lineups(metadata_df, engine)
 
-    cleaned_data = read_physical_data(physical_summary_raw)
+    cleaned_data = _read_physical_data(physical_summary_raw)
 
     summary_df = pt_module.transform_physical_total(
         cleaned_data, df_fixtures, df_matchlineups, opta_match_id)
 
-    return summary_df
\ No newline at end of file
+    return summary_df
+
+
+def physical_summary_batch(df_fixtures, matches, engine=None):
+    """
+    Physical summary for many matches at once.
+
+    Args:
+        matches: iterable of (opta_match_id, metadata_df, physical_summary_raw)
+    """
+    batch = [
+        (opta_match_id, _read_physical_data(physical_summary_raw), _match_lineups(metadata_df, engine))
+        for opta_match_id, metadata_df, physical_summary_raw in matches
+    ]
+    return pt_module.transform_physical_total_batch(batch, df_fixtures)
@@ -1,94 +1,28 @@
 from __future__ import annotations
-import pandas as pd
-import duckdb
 import polars as pl
 
-def get_index_range(transform_dataframe, json_list):
-    ''' 
-    get index range of a player, team
+from tidy_dvms.engine import DuckDBEngine, default_engine
 
-    returns: 
-        list (functions)
-        dataframe list (dfs)
-    '''
 
-    from_dataframe = []
-    to_dataframe = []
-    final_dataframe_ix = []
+def as_polars(df) -> pl.DataFrame:
+    """Accept Polars, pandas or Arrow input (fixtures / lineups come from different sources)."""
+    if isinstance(df, pl.DataFrame):
+        return df
+    if hasattr(df, "schema") and hasattr(df, "column_names"):
+        return pl.from_arrow(df)
+    return pl.from_pandas(df)
 
-    dfs = []
 
-    # Get start ix of frame
-    for from_row in range(10, 500, 12): 
-        from_dataframe.append(from_row)
+def column(df: pl.DataFrame, name: str) -> pl.Expr:
+    """Column by name, matched case-insensitively (optaId / OptaId, optaTeamId / OptaTeamId, ...)."""
+    lowered = name.lower()
+    for existing in df.columns:
+        if existing.lower() == lowered:
+            return pl.col(existing)
+    raise KeyError(f"Column {name!r} not found (available: {df.columns})")
 
-    # Get end ix of frame
-    for to_row in range(21, 500, 12):
-        to_dataframe.append(to_row)
 
-    for jump_ix_by in range(9, 500, 12):
-        final_dataframe_ix.append(jump_ix_by)
-
-    functions = []
-
-    # Declare arguments (for each player/team dataframe)
-    for start_index, end_index, jump_index_by in zip(from_dataframe, to_dataframe, final_dataframe_ix):  
-        function = lambda json_list=json_list, s=start_index, e=end_index, j=jump_index_by: transform_dataframe(json_list, s, e, j)
-        functions.append(function)
-
-    # Get frames from data source in chunks (minimum: 24)
-    for frames in range(0, 24):     
-        df = functions[frames](json_list)
-        dfs.append(df)
-
-    return dfs, functions
-
-
-
-def capture_player_frame(list_count, dfs, functions):
-
-    # Dataframe Concatenation
-    print('Concatenate Dataframes...')
-
-    if list_count == 323:
-        df = pd.concat(dfs)
-
-    elif list_count == 335:
-        df = pd.concat(dfs + [functions[25]()])
-
-    elif list_count == 347:
-        df = pd.concat(dfs + [functions[25](), functions[26]()])
-
-    elif list_count == 359:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27]()])
-
-    elif list_count == 371:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28]()])
-
-    elif list_count == 383:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28](), functions[29]()])
-
-    elif list_count == 395:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28](), functions[29](), functions[30]()])
-
-    elif list_count == 407:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28](), functions[29](), functions[30](), functions[31]()])
-
-    elif list_count == 419:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28](), functions[29](), functions[30](), functions[31](), functions[32]()])
-
-    elif list_count == 431:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28](), functions[29](), functions[30](), functions[31](), functions[32](), functions[33]()])
-
-    elif list_count == 443:
-        df = pd.concat(dfs + [functions[25](), functions[26](), functions[27](), functions[28](), functions[29](), functions[30](), functions[31](), functions[32](), functions[33](), functions[34]()])
-
-    print('Dataframe Concatenation Complete!')
-
-    return df
-
-
-def transform_matchlineups(df, table_name, sql_query):
+def transform_matchlineups(df, table_name, sql_query, engine: DuckDBEngine | None = None):
 
     # Rename columns
     df = df.rename({
@@ -115,14 +49,9 @@ def transform_matchlineups(df, table_name, sql_query):
     # combine home players + away players
     union_df = pl.concat([df_home, df_away])
 
-    # Convert to DuckDB
-    con = duckdb.connect()
-
-    # Register the Polars DataFrame directly as a DuckDB view
-    con.register(table_name, union_df.to_arrow())
-
-    # Query the view
-    final_df = con.execute(sql_query).fetchdf()
+    # Query the Polars DataFrame as an Arrow view on the shared DuckDB engine
+    engine = engine or default_engine()
+    final_df = engine.pl(sql_query, tables={table_name: union_df.to_arrow()})
 
     return final_df
 
@@ -0,0 +1,176 @@
+from pathlib import Path
+import asyncio
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import polars as pl
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.async_client import AsyncDVMS
+from tidy_dvms.sinks.parquet import ParquetSink
+from test_client_lineups import LINEUPS_XML
+
+
+def make_client() -> AsyncDVMS:
+    client = AsyncDVMS(request_retries=1, sleep_between_retries=0)
+    client._dvms._fixtures_list = [
+        {
+            "optaMatchId": "g12345",
+            "homeTeamName": "Home FC",
+            "awayTeamName": "Away FC",
+            "date": "2026-03-29T15:00:00Z",
+        }
+    ]
+    client._dvms._fixture_assets = [
+        {
+            "fixture_id": "fixture-1",
+            "opta_match_id": "12345",
+            "competition_id": "comp-1",
+            "opta_competition_id": "8",
+            "opta_season_id": "2025",
+            "asset_id": "asset-1",
+            "sub_type": AsyncDVMS.SUBTYPE_LINEUPS,
+            "ready": True,
+        }
+    ]
+
+    async def fake_ensure(**kwargs):
+        return None
+
+    client._aensure_fixtures_loaded = fake_ensure
+    return client
+
+
+def test_async_lineups_reuses_sync_parsing():
+    client = make_client()
+
+    async def fake_download(opta_match_id, sub_type):
+        return LINEUPS_XML
+
+    client._adownload_physical = fake_download
+
+    records = asyncio.run(client.lineups(opta_match_id="g12345", format="json"))
+
+    assert {record["player_id"] for record in records} == {"11", "12", "21"}
+    assert all(record["fixture"] == "Home FC - Away FC" for record in records)
+
+
+def test_async_fetch_many_bounds_concurrency_and_reports_errors():
+    pytest.importorskip("aiohttp")
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            threading.Event().wait(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            status = 404 if self.path.endswith("/missing") else 200
+            body = self.path.encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = make_client()
+    client._dvms.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    client._max_concurrency = 2
+    client._dvms._fixture_assets = [
+        {
+            "fixture_id": f"fixture-{m}",
+            "opta_match_id": str(m),
+            "opta_competition_id": "8",
+            "asset_id": "missing" if m == 3 else f"asset-{m}",
+            "sub_type": AsyncDVMS.SUBTYPE_SPLITS,
+            "ready": True,
+        }
+        for m in range(1, 6)
+    ]
+
+    async def run():
+        async with client:
+            return await client.fetch_many(range(1, 6), sub_types=[AsyncDVMS.SUBTYPE_SPLITS])
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert results["1"]["assets"][AsyncDVMS.SUBTYPE_SPLITS] == "/dvms/8/fixtures/fixture-1/download/asset-1"
+    assert isinstance(results["3"]["errors"][AsyncDVMS.SUBTYPE_SPLITS], RuntimeError)
+    assert in_flight["peak"] <= 2
+
+
+def test_async_fetch_many_honours_max_workers():
+    client = make_client()
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_download(opta_match_id, sub_type):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return f"{opta_match_id}-{sub_type}"
+
+    client._adownload_sub_type = fake_download
+    client._dvms._fixture_assets = []
+
+    results = asyncio.run(client.fetch_many(range(1, 9), sub_types=[AsyncDVMS.SUBTYPE_SPLITS], max_workers=3))
+
+    assert results["8"]["assets"][AsyncDVMS.SUBTYPE_SPLITS] == f"8-{AsyncDVMS.SUBTYPE_SPLITS}"
+    assert in_flight["peak"] == 3
+
+
+def test_async_export_season_awaits_downloads(tmp_path):
+    client = make_client()
+    client._dvms._opta_competition_id = "8"
+    client._dvms.season_id = 2025
+    client._dvms._fixture_assets = [
+        {
+            "fixture_id": f"fixture-{m}",
+            "opta_match_id": m,
+            "opta_competition_id": "8",
+            "asset_id": f"asset-{m}-{sub_type}",
+            "sub_type": sub_type,
+            "ready": True,
+        }
+        for m in ("1", "2")
+        for sub_type in (AsyncDVMS.SUBTYPE_METADATA, AsyncDVMS.SUBTYPE_SPLITS)
+    ]
+
+    async def fake_download(opta_match_id, sub_type):
+        await asyncio.sleep(0)
+        return {"optaId": opta_match_id} if sub_type == AsyncDVMS.SUBTYPE_METADATA else f"csv-{opta_match_id}"
+
+    def fake_build_splits_batch(payloads):
+        frame = pl.DataFrame({"OptaMatchId": [int(m) for m in payloads], "Minute": [1] * len(payloads)})
+        return frame, frame, frame, frame.head(0)
+
+    client._adownload_sub_type = fake_download
+    client._dvms._build_splits_batch = fake_build_splits_batch
+
+    report = asyncio.run(client.export_season(ParquetSink(tmp_path), outputs=["splits"], max_workers=2))
+
+    assert report["exported"] == ["1", "2"]
+    assert report["failed"] == {}
+    assert (tmp_path / "players_splits" / "competition=8" / "season=2025" / "match_id=2" / "part-0.parquet").exists()
+
+    rerun = asyncio.run(client.export_season(ParquetSink(tmp_path), outputs=["splits"]))
+    assert rerun["unchanged"] == ["1", "2"]
+
+
+@pytest.mark.parametrize("method", ["tracking", "tracking_store", "match"])
+def test_async_client_has_no_sync_only_methods(method):
+    assert not hasattr(make_client(), method)
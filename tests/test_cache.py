@@ -0,0 +1,51 @@
+from pathlib import Path
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.cache import AssetCache
+from tidy_dvms.client import DVMS
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = AssetCache(tmp_path, max_bytes=25)
+    cache.put("8", "fx-1", "a", b"x" * 10)
+    cache.put("8", "fx-1", "b", b"y" * 10)
+    os.utime(cache.path_for("8", "fx-1", "a"), (1, 1))
+    os.utime(cache.path_for("8", "fx-1", "b"), (2, 2))
+
+    assert cache.get("8", "fx-1", "a") == b"x" * 10  # refreshes "a"
+    cache.put("8", "fx-2", "c", b"z" * 10)
+
+    assert cache.get("8", "fx-1", "b") is None
+    assert cache.get("8", "fx-1", "a") == b"x" * 10
+    assert cache.get("8", "fx-2", "c") == b"z" * 10
+    assert cache.size() == 20
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_client_serves_repeat_downloads_from_disk(tmp_path):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return FakeResponse('{"optaId": "g1"}')
+
+    first = DVMS(cache_dir=tmp_path)
+    first._session.get = fake_get
+    assert first._download_asset_json("8", "fx-1", "asset-1") == {"optaId": "g1"}
+
+    # A fresh client (e.g. a new process) reuses the same directory without network.
+    second = DVMS(cache_dir=tmp_path)
+    second._session.get = fake_get
+    assert second._download_asset_text("8", "fx-1", "asset-1") == '{"optaId": "g1"}'
+    assert len(calls) == 1
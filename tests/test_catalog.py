@@ -0,0 +1,100 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.client import DVMS
+
+
+FIXTURES = [
+    {
+        "fixtureId": "fixture-1",
+        "optaMatchId": "g12345",
+        "competition": "comp-1",
+        "optaCompetition": "8",
+        "optaSeason": "2025",
+        "optaHomeTeamId": "t1",
+        "optaAwayTeamId": "t2",
+        "homeTeamName": "Home FC",
+        "awayTeamName": "Away FC",
+        "date": "2026-03-29T15:00:00Z",
+        "homeScore": 1,
+        "awayScore": 0,
+        "round": 1,
+        "assets": [{"assetId": "asset-1", "subType": DVMS.SUBTYPE_LINEUPS, "ready": True}],
+    }
+]
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def make_client(tmp_path, *, ttl: float = 3600.0) -> tuple[DVMS, list]:
+    client = DVMS(catalog_dir=tmp_path, catalog_ttl=ttl)
+    client._auth_context = ("user@example.com", "secret")
+    network = []
+
+    def fake_resolve(competition):
+        network.append("competitions")
+        return {"competitionId": "comp-1", "name": competition, "optaCompetitionId": "8"}
+
+    def fake_get_fixtures(competition_id, season):
+        network.append("fixtures")
+        client._fixtures_validators = ('"v1"', None)
+        return FIXTURES
+
+    client._resolve_competition = fake_resolve
+    client._get_fixtures = fake_get_fixtures
+    return client, network
+
+
+def test_fresh_snapshot_skips_fixture_requests(tmp_path):
+    first, first_network = make_client(tmp_path)
+    first._load_fixtures_context("English Premier League", 2025)
+
+    second, second_network = make_client(tmp_path)
+    second._load_fixtures_context("English Premier League", 2025)
+
+    assert first_network == ["competitions", "fixtures"]
+    assert second_network == []
+    assert second._opta_competition_id == "8"
+    assert second._find_asset(opta_match_id="12345", sub_type=DVMS.SUBTYPE_LINEUPS)["asset_id"] == "asset-1"
+
+
+def test_expired_snapshot_is_revalidated_with_etag(tmp_path):
+    first, _ = make_client(tmp_path)
+    first._load_fixtures_context("English Premier League", 2025)
+
+    second, network = make_client(tmp_path, ttl=0)
+    sent_headers = []
+
+    def fake_post(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return FakeResponse(304)
+
+    second._session.post = fake_post
+    second._load_fixtures_context("English Premier League", 2025)
+
+    assert network == []
+    assert sent_headers[0]["If-None-Match"] == '"v1"'
+
+    second._session.post = lambda *args, **kwargs: FakeResponse(200)
+    second._load_fixtures_context("English Premier League", 2025)
+    assert network == ["competitions", "fixtures"]
+
+
+def test_revalidation_accepts_matching_validators_when_post_ignores_conditionals(tmp_path):
+    first, _ = make_client(tmp_path)
+    first._load_fixtures_context("English Premier League", 2025)
+
+    second, network = make_client(tmp_path, ttl=0)
+    second._session.post = lambda *args, **kwargs: FakeResponse(200, {"ETag": 'W/"v1"'})
+    second._load_fixtures_context("English Premier League", 2025)
+    assert network == []
+
+    second._session.post = lambda *args, **kwargs: FakeResponse(200, {"ETag": '"v2"'})
+    second._load_fixtures_context("English Premier League", 2025)
+    assert network == ["competitions", "fixtures"]
@@ -0,0 +1,73 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms import cli
+from tidy_dvms.sinks import DuckDBSink, ParquetSink, SQLSink
+from tidy_dvms.sync import SyncEngine
+
+
+def test_open_sink_resolves_urls(tmp_path):
+    assert isinstance(cli.open_sink(f"parquet://{tmp_path / 'lake'}"), ParquetSink)
+    with cli.open_sink(f"duckdb://{tmp_path / 'dvms.duckdb'}") as sink:
+        assert isinstance(sink, DuckDBSink)
+    assert isinstance(cli.open_sink(f"sqlite:///{tmp_path / 'dvms.sqlite'}"), SQLSink)
+    with pytest.raises(ValueError, match="parquet://"):
+        cli.open_sink(str(tmp_path))
+
+
+def test_sync_command_runs_the_sync_engine_and_prints_throughput(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("DVMS_USERNAME", "user@example.com")
+    monkeypatch.setenv("DVMS_PASSWORD", "secret")
+    runs = []
+
+    def fake_run(self, **kwargs):
+        runs.append((self.outputs, self.max_workers, self.batch_size, kwargs))
+        return {
+            "exported": ["1", "2"],
+            "identical": [],
+            "unchanged": ["3"],
+            "not_ready": [],
+            "failed": {"4": RuntimeError("GET failed")},
+            "reasons": {},
+            "pending": 3,
+            "rows": {"players_splits": 300, "summary": 60},
+            "seconds": 2.0,
+        }
+
+    monkeypatch.setattr(SyncEngine, "run", fake_run)
+
+    code = cli.main([
+        "sync",
+        "--competition", "English Premier League",
+        "--season", "2025",
+        "--outputs", "splits,summary",
+        "--workers", "4",
+        "--sink", f"parquet://{tmp_path}",
+        "--match", "g1",
+    ])
+
+    assert code == 1
+    outputs, workers, batch_size, kwargs = runs[0]
+    assert (outputs, workers, batch_size) == (("splits", "summary"), 4, 50)
+    assert kwargs["creds"] == {"username": "user@example.com", "password": "secret"}
+    assert kwargs["opta_match_ids"] == ["g1"]
+    out = capsys.readouterr().out
+    assert "exported 2 matches in 2.0 s (0 identical, 1 unchanged, 0 not ready, 1 failed)" in out
+    assert "throughput: 1.00 matches/s, 180 rows/s" in out
+    assert "failed 4: RuntimeError: GET failed" in out
+
+
+def test_sync_command_requires_credentials_from_the_environment(monkeypatch, capsys):
+    monkeypatch.delenv("DVMS_USERNAME", raising=False)
+    monkeypatch.delenv("DVMS_PASSWORD", raising=False)
+
+    code = cli.main(["sync", "--competition", "EPL", "--season", "2025", "--sink", "parquet://lake"])
+
+    assert code == 2
+    assert "DVMS_USERNAME" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cli.main(["sync", "--competition", "EPL", "--season", "2025", "--sink", "parquet://lake", "--outputs", "video"])
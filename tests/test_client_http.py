@@ -0,0 +1,194 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pytest
+
+from tidy_dvms.client import DVMS
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_session_is_pooled_with_configured_limits():
+    client = DVMS(pool_connections=4, pool_maxsize=32, pool_block=True)
+
+    adapter = client._session.get_adapter("https://dvms.premierleague.com")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    client.close()
+
+
+def test_downloads_share_the_client_session():
+    client = DVMS(request_retries=1)
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return FakeResponse("payload")
+
+    client._session.get = fake_get
+
+    assert client._download_asset_text("8", "fixture-1", "asset-1") == "payload"
+    assert client._download_asset_text("8", "fixture-1", "asset-2") == "payload"
+    assert calls == [
+        f"{DVMS.BASE_URL}/dvms/8/fixtures/fixture-1/download/asset-1",
+        f"{DVMS.BASE_URL}/dvms/8/fixtures/fixture-1/download/asset-2",
+    ]
+
+
+def test_fetch_many_reports_results_and_errors_per_match():
+    client = DVMS()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+
+    def fake_physical(opta_match_id, sub_type):
+        if opta_match_id == "2":
+            raise RuntimeError("GET failed")
+        return f"{opta_match_id}-{sub_type}"
+
+    client._download_physical = fake_physical
+    client._download_metadata = lambda opta_match_id: {"optaId": opta_match_id}
+
+    results = client.fetch_many(
+        ["g1", "2", "1"],
+        sub_types=[DVMS.SUBTYPE_METADATA, DVMS.SUBTYPE_SPLITS],
+        max_workers=4,
+    )
+
+    assert list(results) == ["1", "2"]
+    assert results["1"]["assets"] == {
+        DVMS.SUBTYPE_METADATA: {"optaId": "1"},
+        DVMS.SUBTYPE_SPLITS: f"1-{DVMS.SUBTYPE_SPLITS}",
+    }
+    assert results["1"]["errors"] == {}
+    assert results["2"]["assets"] == {DVMS.SUBTYPE_METADATA: {"optaId": "2"}}
+    assert isinstance(results["2"]["errors"][DVMS.SUBTYPE_SPLITS], RuntimeError)
+
+
+def test_splits_many_transforms_downloaded_matches_as_one_batch():
+    client = DVMS()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    client._download_metadata = lambda opta_match_id: {"optaId": opta_match_id}
+
+    def fake_physical(opta_match_id, sub_type):
+        if opta_match_id == "2":
+            raise RuntimeError("GET failed")
+        return f"csv-{opta_match_id}"
+
+    client._download_physical = fake_physical
+    batches = []
+
+    def fake_build_splits_batch(payloads):
+        batches.append(payloads)
+        return ("players", "players_norm", "teams", "teams_norm")
+
+    client._build_splits_batch = fake_build_splits_batch
+
+    with pytest.raises(RuntimeError, match=r"1 match\(es\): \['2'\]"):
+        client.splits_many(["1", "2", "3"], as_pandas=False)
+    assert batches == []
+
+    teams = client.splits_many(["1", "2", "3"], type="teams", on_error="skip", as_pandas=False)
+
+    assert teams == "teams"
+    assert batches == [{"1": ({"optaId": "1"}, "csv-1"), "3": ({"optaId": "3"}, "csv-3")}]
+
+
+def test_splits_many_returns_pandas_unless_as_pandas_is_false_and_summary_many_returns_polars():
+    pd = pytest.importorskip("pandas")
+    import polars as pl
+
+    client = DVMS()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    client._download_metadata = lambda opta_match_id: {"optaId": opta_match_id}
+    client._download_physical = lambda opta_match_id, sub_type: f"csv-{opta_match_id}"
+    frame = pl.DataFrame({"OptaMatchId": [1], "Minute": pl.Series([45], dtype=pl.Int16)})
+    client._build_splits_batch = lambda payloads: (frame, frame, frame, frame)
+    client._build_summary_batch = lambda payloads: frame
+
+    assert isinstance(client.splits_many(["1"]), pd.DataFrame)
+    assert client.splits_many(["1"], as_pandas=False) is frame
+    assert client.summary_many(["1"]) is frame
+
+
+class FakeJsonResponse:
+    def __init__(self, payload: dict, headers: dict | None = None) -> None:
+        self.payload = payload
+        self.headers = headers or {}
+
+    def json(self) -> dict:
+        return self.payload
+
+
+def fake_fixture_pages(total: int, page_size: int, report_total: bool):
+    posted = []
+
+    def fake_post(url, payload=None):
+        posted.append(payload["pageNumber"])
+        # page_size caps the requested limit, like a server with a maximum page size.
+        size = min(payload["limit"], page_size)
+        start = payload["pageNumber"] * size
+        data = {"fixtures": [{"fixtureId": i} for i in range(start, min(start + size, total))]}
+        if report_total:
+            data["totalCount"] = total
+        return FakeJsonResponse(data)
+
+    return fake_post, posted
+
+
+def test_get_fixtures_stops_at_first_short_page_when_total_is_unknown():
+    client = DVMS(fixtures_page_size=10)
+    client._post, posted = fake_fixture_pages(total=25, page_size=10, report_total=False)
+
+    fixtures = client._get_fixtures("comp-1", 2025)
+
+    assert [f["fixtureId"] for f in fixtures] == list(range(25))
+    assert posted == [0, 1, 2]
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+def test_get_fixtures_pages_by_the_size_a_capping_server_serves(report_total):
+    client = DVMS(fixtures_page_size=100)
+    client._post, posted = fake_fixture_pages(total=130, page_size=50, report_total=report_total)
+
+    fixtures = client._get_fixtures("comp-1", 2025)
+
+    assert [f["fixtureId"] for f in fixtures] == list(range(130))
+    assert sorted(posted) == [0, 1, 2]
+
+
+def test_get_fixtures_stops_at_an_empty_page():
+    client = DVMS(fixtures_page_size=10)
+    client._post, posted = fake_fixture_pages(total=20, page_size=10, report_total=False)
+
+    assert len(client._get_fixtures("comp-1", 2025)) == 20
+    assert posted == [0, 1, 2]
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+def test_get_fixtures_raises_instead_of_truncating(report_total):
+    client = DVMS(fixtures_page_size=10)
+    client.MAX_FIXTURE_PAGES = 3
+    client._post, posted = fake_fixture_pages(total=45, page_size=10, report_total=report_total)
+
+    with pytest.raises(RuntimeError, match="MAX_FIXTURE_PAGES"):
+        client._get_fixtures("comp-1", 2025)
+    assert max(posted) < 3
+
+
+def test_get_fixtures_fetches_remaining_pages_when_total_is_known():
+    client = DVMS(fixtures_page_size=100)
+    client._post, posted = fake_fixture_pages(total=650, page_size=100, report_total=True)
+
+    fixtures = client._get_fixtures("comp-1", 2025)
+
+    assert [f["fixtureId"] for f in fixtures] == list(range(650))
+    assert sorted(posted) == list(range(7))
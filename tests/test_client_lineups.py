@@ -1,6 +1,8 @@
 from pathlib import Path
 import sys
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from tidy_dvms.client import DVMS
@@ -102,6 +104,23 @@ def test_find_asset_accepts_g_prefixed_match_id():
     assert asset["asset_id"] == "asset-1"
 
 
+def test_find_asset_prefers_ready_asset_and_reports_available_sub_types():
+    client = make_client()
+    base = dict(client._fixture_assets[0])
+    client._fixture_assets = [
+        {**base, "asset_id": "not-ready", "sub_type": DVMS.SUBTYPE_EVENTS, "ready": False},
+        {**base, "asset_id": "ready", "sub_type": DVMS.SUBTYPE_EVENTS, "ready": True},
+        {**base, "asset_id": "later", "sub_type": DVMS.SUBTYPE_EVENTS, "ready": True},
+        base,
+    ]
+
+    assert client._find_asset(opta_match_id="12345", sub_type=DVMS.SUBTYPE_EVENTS)["asset_id"] == "ready"
+    with pytest.raises(ValueError, match=r"Available sub_types: \[20, 21\]"):
+        client._find_asset(opta_match_id="12345", sub_type=DVMS.SUBTYPE_SPLITS)
+    with pytest.raises(ValueError, match="No cached assets for match 999"):
+        client._find_asset(opta_match_id="999", sub_type=DVMS.SUBTYPE_SPLITS)
+
+
 def test_lineups_returns_match_lineups_with_fixture_context():
     client = make_client()
     captured = {}
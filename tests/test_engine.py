@@ -0,0 +1,101 @@
+from pathlib import Path
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.engine import DuckDBEngine
+from test_client_lineups import make_client
+
+
+def test_engine_applies_threads_and_memory_limit():
+    with DuckDBEngine(threads=2, memory_limit="256MB") as engine:
+        settings = engine.pl(
+            "SELECT current_setting('threads') AS threads, current_setting('memory_limit') AS memory_limit"
+        )
+    assert settings["threads"][0] == 2
+    assert settings["memory_limit"][0].startswith("244")
+
+
+def test_engine_keeps_static_tables_and_scopes_session_tables():
+    engine = DuckDBEngine()
+    fixtures = pa.table({"optaMatchId": ["1", "2"], "home": ["A", "B"]})
+    engine.register_static("fixtures", fixtures)
+    engine.register_static("fixtures", fixtures)
+
+    assert engine.pl("SELECT home FROM fixtures WHERE optaMatchId = $id", {"id": "2"})["home"].to_list() == ["B"]
+
+    # Same object: reused as is. Other object: shadows the static table for one session only.
+    shadow = pa.table({"optaMatchId": ["9"], "home": ["Z"]})
+    assert engine.pl("SELECT count(*) AS n FROM fixtures", tables={"fixtures": fixtures})["n"][0] == 2
+    assert engine.pl("SELECT home FROM fixtures", tables={"fixtures": shadow})["home"].to_list() == ["Z"]
+    assert engine.pl("SELECT count(*) AS n FROM fixtures")["n"][0] == 2
+
+    engine.pl("SELECT * FROM events", tables={"events": pa.table({"a": [1]})})
+    assert engine.df("SELECT count(*) AS n FROM duckdb_views() WHERE view_name = 'events'")["n"][0] == 0
+    engine.close()
+
+
+def test_engine_reopens_after_close_with_its_static_tables():
+    engine = DuckDBEngine()
+    fixtures = pa.table({"optaMatchId": ["1"]})
+    engine.register_static("fixtures", fixtures)
+    engine.close()
+    assert engine._connection is None
+
+    # A client keeps its fixtures context across close(), so the engine must serve it again.
+    assert engine.pl("SELECT optaMatchId FROM fixtures")["optaMatchId"].to_list() == ["1"]
+    engine.register_static("fixtures", fixtures)
+    engine.close()
+    engine.register_static("fixtures", pa.table({"optaMatchId": ["2"]}))
+    assert engine.pl("SELECT optaMatchId FROM fixtures")["optaMatchId"].to_list() == ["2"]
+    engine.close()
+    engine.close()
+
+
+def test_engine_serialises_queries_from_many_threads():
+    engine = DuckDBEngine(threads=1)
+
+    def run(i: int) -> int:
+        table = pa.table({"v": list(range(i))})
+        return engine.arrow("SELECT count(*) AS n FROM per_call", tables={"per_call": table}).column("n")[0].as_py()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(run, range(40))) == list(range(40))
+    engine.close()
+
+
+def test_event_definitions_are_built_once_per_process():
+    client = make_client()
+    events = pa.table(
+        {
+            name: pa.array([value], type=pa.string())
+            for name, value in (
+                ("opta_match_id", "12345"),
+                ("event_id", "1"),
+                ("player_id", None),
+                ("type_id", "1"),
+                ("outcome_code", "1"),
+                ("player_name", "Player"),
+                ("team_name", "Home FC"),
+                ("min", "0"),
+                ("sec", "1"),
+                ("x", "50"),
+                ("y", "50"),
+                ("timestamp", None),
+                ("fixture", "Home FC - Away FC"),
+                ("game_date", "2026-03-29"),
+            )
+        }
+    )
+
+    first = client._join_events_with_type_labels(events)
+    second = make_client()._join_events_with_type_labels(events)
+
+    # Shared by every client, and no longer registered on (or joined in) the engine.
+    assert make_client()._event_definitions() is client._event_definitions()
+    assert not client._engine.has_static("event_defs")
+    assert first["event_type_name"].tolist() == second["event_type_name"].tolist() == ["Pass"]
+    client.close()
@@ -0,0 +1,88 @@
+from pathlib import Path
+import sys
+
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.client import DVMS
+from test_client_lineups import LINEUPS_XML, make_client
+
+
+def make_events_xml(n_events: int) -> str:
+    events = "".join(
+        f'<Event id="{i}" type_id="{(1, 4, 16, 999)[i % 4]}" outcome="{i % 2}" team_id="{(100, 200)[i % 2]}" '
+        f'player_id="p{(11, 21)[i % 2]}" min="{i // 60}" sec="{i % 60}" x="50.0" y="40.0" '
+        f'timestamp="2026-03-29T15:00:{i % 60:02d}">'
+        f'<Q id="{i}1" qualifier_id="1" value="x"/></Event>'
+        for i in range(n_events)
+    )
+    return (
+        '<Games><Game id="12345" home_team_id="100" away_team_id="200" '
+        'home_team_name="Home FC" away_team_name="Away FC" game_date="2026-03-29T15:00:00">'
+        f"{events}</Game></Games>"
+    )
+
+
+def test_events_xml_streams_rows_in_batches():
+    client = make_client()
+    client.EVENTS_XML_CHUNK_CHARS = 97  # split tags across feeds
+
+    batches = list(client._iter_events_xml(make_events_xml(25), opta_match_id="12345", batch_size=10))
+
+    assert [b.num_rows for b in batches] == [10, 10, 5]
+    rows = [row for batch in batches for row in batch.to_pylist()]
+    assert [row["event_id"] for row in rows] == [str(i) for i in range(25)]
+    assert rows[1]["team_name"] == "Away FC"
+    assert rows[0]["player_id"] == "11"
+    assert rows[0]["fixture"] == "Home FC - Away FC"
+    assert rows[0]["game_date"] == "2026-03-29T15:00:00"
+
+
+def test_events_xml_rejects_malformed_payload():
+    client = make_client()
+
+    with pytest.raises(RuntimeError, match="Failed to parse events XML payload"):
+        client._parse_events_xml("<Games><Game><Event></Games>")
+
+
+def test_events_are_labelled_and_named_from_lineups():
+    client = make_client()
+    lineups_table = client._parse_lineups_xml(LINEUPS_XML, opta_match_id="12345")
+
+    events = client._build_events("12345", make_events_xml(4), lineups_table=lineups_table)
+
+    assert list(events["event_type_name"]) == ["Pass", "Foul", "Goal", "Unknown 999"]
+    assert list(events["outcome"]) == [
+        "Unsuccessful pass ie pass did not find team mate",
+        "Player who was fouled",
+        "0",
+        "1",
+    ]
+    assert list(events["player_name"]) == ["Alex Jones", "Pat Kim", "Alex Jones", "Pat Kim"]
+
+
+def test_events_labels_follow_the_sql_semantics():
+    client = make_client()
+    columns = ("opta_match_id", "event_id", "player_id", "type_id", "outcome_code", "player_name", "min", "sec")
+    rows = [
+        ("12345", "3", "11", " 16 ", "1", "", "1", "5"),
+        ("12345", "2", None, "x", None, None, "0", "30"),
+        ("12345", "1", "21", "1", "2", "Named", "0", "30"),
+        ("12345", "4", "99", "-1", "0", None, None, "0"),
+    ]
+    events = pa.table(
+        {
+            **{name: pa.array([row[i] for row in rows], type=pa.string()) for i, name in enumerate(columns)},
+            **{name: pa.array([None] * len(rows), type=pa.string()) for name in ("team_name", "x", "y", "timestamp", "fixture", "game_date")},
+        }
+    )
+    lineups = client._parse_lineups_xml(LINEUPS_XML, opta_match_id="12345")
+
+    labelled = client._join_events_with_type_labels(events, lineups_table=lineups)
+
+    # Ordered by integer min, sec, event id with nulls last
+    assert list(labelled["event_type_name"]) == ["Pass", "Unknown x", "Goal", "Unknown -1"]
+    assert list(labelled["outcome"]) == ["2", None, "Always set to '1'", "0"]
+    assert list(labelled["player_name"]) == ["Named", None, "Alex Jones", None]
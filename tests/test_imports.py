@@ -0,0 +1,47 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HEAVY = ("polars", "pandas", "duckdb", "pyarrow", "requests", "sqlalchemy")
+
+
+def loaded_after(statement: str) -> list[str]:
+    """Heavy modules a fresh interpreter has imported after running `statement`."""
+    probe = (
+        f"import sys; sys.path.insert(0, {str(SRC)!r}); {statement}; "
+        f"import json; print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_package_and_cli_import_without_heavy_dependencies():
+    assert loaded_after("import tidy_dvms, tidy_dvms.cli, tidy_dvms.sinks, tidy_dvms.sync") == []
+    assert loaded_after("from tidy_dvms.cli import build_parser; build_parser()") == []
+
+
+def test_client_loads_only_what_it_needs_until_used():
+    loaded = loaded_after("from tidy_dvms import DVMS; DVMS().close()")
+    assert "polars" in loaded
+    assert not {"pandas", "duckdb", "sqlalchemy"} & set(loaded)
+
+
+def test_lazy_attributes_resolve():
+    sys.path.insert(0, str(SRC))
+    import tidy_dvms
+    import tidy_dvms.sinks as sinks
+    from tidy_dvms.client import DVMS
+    from tidy_dvms.sinks.parquet import ParquetSink
+
+    assert tidy_dvms.DVMS is DVMS
+    assert sinks.ParquetSink is ParquetSink
+    assert {"DVMS", "AsyncDVMS"} <= set(dir(tidy_dvms))
+    assert {"DuckDBSink", "SQLSink"} <= set(dir(sinks))
+    with pytest.raises(AttributeError, match="Missing"):
+        tidy_dvms.Missing
+    with pytest.raises(AttributeError, match="'tidy_dvms.sinks' has no attribute 'Missing'"):
+        sinks.Missing
@@ -0,0 +1,60 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.client import DVMS
+from test_client_lineups import LINEUPS_XML, make_client
+
+
+def test_match_bundle_downloads_each_sub_type_once_and_memoizes_outputs():
+    client = make_client()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    downloads = []
+    builds = []
+
+    def fake_download(opta_match_id, sub_type):
+        downloads.append(sub_type)
+        return {"optaId": opta_match_id} if sub_type == DVMS.SUBTYPE_METADATA else f"csv-{sub_type}"
+
+    def fake_build_splits(opta_match_id, metadata_raw, splits_csv):
+        builds.append((opta_match_id, metadata_raw["optaId"], splits_csv))
+        return ("players", "players_norm", "teams", "teams_norm")
+
+    client._download_sub_type = fake_download
+    client._build_splits = fake_build_splits
+    client._build_summary = lambda opta_match_id, metadata_raw, summary_csv: summary_csv
+
+    bundle = client.match(
+        "g12345",
+        competition="English Premier League",
+        season=2025,
+        creds={"username": "user@example.com", "password": "secret"},
+    )
+
+    assert bundle.players == "players"
+    assert bundle.teams == "teams"
+    assert bundle.splits(type="teams", model_form="normalized", as_pandas=False) == "teams_norm"
+    assert bundle.summary == f"csv-{DVMS.SUBTYPE_SUMMARY}"
+    assert builds == [("12345", "12345", f"csv-{DVMS.SUBTYPE_SPLITS}")]
+    assert sorted(downloads) == sorted(
+        [DVMS.SUBTYPE_METADATA, DVMS.SUBTYPE_SPLITS, DVMS.SUBTYPE_SUMMARY]
+    )
+
+
+def test_match_bundle_uses_prefetched_payloads():
+    client = make_client()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    client._download_sub_type = lambda *args: (_ for _ in ()).throw(AssertionError("no download"))
+
+    bundle = client.match(
+        12345,
+        competition="English Premier League",
+        season=2025,
+        creds={"username": "user@example.com", "password": "secret"},
+        payloads={DVMS.SUBTYPE_LINEUPS: LINEUPS_XML},
+    )
+
+    lineups = bundle.lineups
+    assert len(lineups) == 3
+    assert bundle.lineups is lineups
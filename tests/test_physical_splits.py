@@ -0,0 +1,174 @@
+from pathlib import Path
+import sys
+
+import pandas as pd
+import polars as pl
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.physical_splits.blocks import find_split_blocks, parse_split_blocks
+from tidy_dvms.physical_splits.transform_physical_splits import PhysicalSplit, transform_physical_splits_batch
+from tidy_dvms.transformers import get_halves
+
+METRICS = [
+    "Total Distance",
+    "Walking Distance",
+    "Jogging Distance",
+    "Low Speed Running Distance",
+    "High Speed Running Distance",
+    "Sprinting Distance",
+    "Walking Count",
+    "Jogging Count",
+    "Low Speed Running Count",
+    "High Speed Running Count",
+    "Sprinting Count",
+]
+
+
+def make_splits_rows(identities, match_id="12345", halves=(3, 2)):
+    """Physical splits CSV rows: 9 header rows, the 'Minute Splits' row, then one 12-row block per identity."""
+    minutes = []
+    for period, count in enumerate(halves):
+        if period:
+            minutes.append("")
+        start = 45 * period
+        minutes.extend(str(start + m + 1) for m in range(count))
+
+    rows = [
+        ["Physical Splits"],
+        ["Home FC v Away FC : 2025-08-16"],
+        [match_id],
+    ]
+    rows += [[f"info {i}"] for i in range(6)]
+    rows.append(["Minute Splits", *minutes])
+    for b, identity in enumerate(identities):
+        rows.append([identity])
+        for m, metric in enumerate(METRICS):
+            rows.append([metric, *("" if not h else f"{b}.{m}.{h}" for h in minutes)])
+    return rows
+
+
+def make_numeric_splits_rows(identities, **kwargs):
+    """Same layout as make_splits_rows, with numeric metric values (block * 100 + metric + minute / 1000)."""
+    rows = make_splits_rows(identities, **kwargs)
+    for row in rows[10:]:
+        row[1:] = [value and str(sum(int(p) * w for p, w in zip(value.split("."), (100, 1, 0.001)))) for value in row[1:]]
+    return rows
+
+
+def make_lineups(home, away, players=("1", "2")):
+    return pd.DataFrame(
+        {
+            "OptaId": list(players),
+            "ssiId": [f"ssi-{p}" for p in players],
+            "optaTeamId": [home, away],
+            "periods": [None, None],
+            "name": [f"Home Player {players[0]}", f"Away Player {players[1]}"],
+            "number": [9, 4],
+            "position": ["FW", "DF"],
+            "homeOptaId": [home, home],
+            "awayOptaId": [away, away],
+        }
+    )
+
+
+def make_fixtures():
+    return pd.DataFrame(
+        {
+            "fixtureId": ["fx-1", "fx-2"],
+            "OptaMatchId": ["12345", "67890"],
+            "OptaHomeTeamId": ["10", "30"],
+            "OptaAwayTeamId": ["20", "40"],
+            "homeTeamName": ["Home FC", "Third FC"],
+            "awayTeamName": ["Away FC", "Fourth FC"],
+        }
+    )
+
+
+def test_find_split_blocks_reads_ids_from_identity_rows():
+    rows = make_splits_rows(["Home FC (100)", "Player (A) (7)"])
+    rows = [row for row in rows if "Minute Splits" not in row]
+
+    assert find_split_blocks(rows) == [(9, "100"), (21, "7")]
+
+
+def per_block_frame(data_list, row_1, row_2, player_inx, file_name):
+    """The original per-block pandas transform, kept as the reference for parse_split_blocks."""
+    min_headers = data_list[9][1:]
+    data_list = [row for row in data_list if "Minute Splits" not in row]
+    fixture, match_date = data_list[1][0].split(" : ")
+    df = pd.DataFrame(data_list[row_1:row_2]).transpose()
+    df.columns = df.iloc[0]
+    df = df.iloc[1:]
+    df = df[df["Total Distance"] != ""]
+    df["Period"] = get_halves(min_headers)
+    df["Minute"] = [x for x in min_headers if x.strip()]
+    df["Player ID"] = data_list[player_inx][0].split("(")[1].replace(")", "")
+    df["Fixture ID"] = file_name
+    df["Fixture"] = fixture
+    df["Match Date"] = match_date
+    return df
+
+
+def test_parse_split_blocks_matches_per_block_reference():
+    identities = [f"Player {i} ({1000 + i})" for i in range(24)]
+    rows = make_splits_rows(identities)
+
+    expected = pd.concat(
+        per_block_frame(rows, 10 + 12 * i, 21 + 12 * i, 9 + 12 * i, "12345") for i in range(24)
+    ).reset_index(drop=True)
+    expected.columns = list(expected.columns)
+
+    table = parse_split_blocks(rows, "12345")
+
+    pd.testing.assert_frame_equal(table.to_pandas(), expected, check_dtype=False)
+
+
+def test_parse_split_blocks_handles_any_squad_size_and_extra_periods():
+    identities = [f"Player {i} ({i})" for i in range(37)]
+    table = parse_split_blocks(make_splits_rows(identities, halves=(2, 2, 1, 1)), 12345)
+
+    assert table.num_rows == 37 * 6
+    assert table.column_names == [*METRICS, "Period", "Minute", "Player ID", "Fixture ID", "Fixture", "Match Date"]
+    first = table.slice(0, 6).to_pydict()
+    assert first["Period"] == ["1", "1", "2", "2", "3", "4"]
+    assert first["Minute"] == ["1", "2", "46", "47", "91", "136"]
+    assert first["Total Distance"] == ["0.0.1", "0.0.2", "0.0.46", "0.0.47", "0.0.91", "0.0.136"]
+    assert set(table.column("Fixture ID").to_pylist()) == {"12345"}
+    assert table.column("Player ID").to_pylist()[-1] == "36"
+
+
+def test_parse_split_blocks_requires_blocks():
+    rows = make_splits_rows([])
+    with pytest.raises(ValueError):
+        parse_split_blocks(rows, "12345")
+
+
+def test_transform_physical_splits_splits_players_and_teams():
+    rows = make_numeric_splits_rows(
+        ["Home FC (10)", "Home Player (1)", "Away FC (20)", "Away Player (2)"],
+        halves=(2, 3),
+    )
+    rows[9][-1] = "47+1"
+    lineups, fixtures = make_lineups("10", "20"), make_fixtures()
+    split = PhysicalSplit(None, 2025, 8, "12345", lineups, fixtures)
+
+    players, players_normalized, teams, teams_normalized = split.transform_physical_splits(rows, "12345")
+
+    assert len(players) == len(players_normalized) == 2 * 5
+    assert sorted(set(players["PlayerName"])) == ["Away Player 2", "Home Player 1"]
+    assert sorted(set(players_normalized["optaTeamId"])) == ["10", "20"]
+    assert sorted(set(teams["TeamName"])) == ["Away FC", "Home FC"]
+    assert len(teams_normalized) == 2 * 5
+
+    assert players_normalized.schema["TotalDistance"] == pl.Float32
+    assert players_normalized.schema["SprintingCount"] == pl.Int16
+    assert players_normalized.schema["Minute"] == pl.Int16
+    assert players_normalized.schema["OptaMatchId"] == pl.Int64
+    home = players_normalized.filter(pl.col("OptaPlayerId") == "1")
+    assert home["Minute"].to_list() == [1, 2, 46, 47, 47]
+    assert home["AddedMinute"].to_list() == [0, 0, 0, 0, 1]
+    assert players_normalized.columns.index("AddedMinute") == players_normalized.columns.index("Minute") + 1
+    assert home["Period"].cast(pl.Utf8).to_list() == ["1", "1", "2", "2", "2"]
+    assert home["TotalDistance"].to_list() == pytest.approx([100.001, 100.002, 100.046, 100.047, 100.048])
@@ -0,0 +1,112 @@
+from pathlib import Path
+import sys
+
+import pandas as pd
+import polars as pl
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.physical_total.transform_physical_total import (
+    TOTAL_COLUMNS,
+    transform_physical_total,
+    transform_physical_total_batch,
+)
+
+HEADERS = ["ID", "Player", *TOTAL_COLUMNS]
+
+
+def make_summary_rows(players):
+    """Physical summary CSV rows: totals in rows 4/6/7, headers in row 9, one row per player after it."""
+    rows = [[""] * 5 for _ in range(10)]
+    rows[1] = ["Home FC v Away FC", "Match ID: 12345"]
+    rows[4] = ["Game Time", "", "97:10", "48:05", "49:05"]
+    rows[6] = ["Home EPT", "", "55:00", "27:30", "27:30"]
+    rows[7] = ["Away EPT", "", "54:00", "27:00", "27:00"]
+    rows[9] = HEADERS
+    for player_id, name in players:
+        rows.append([player_id, name, *(f"{i}.5" for i in range(len(TOTAL_COLUMNS)))])
+    return rows
+
+
+LINEUPS = pd.DataFrame(
+    {
+        "optaId": ["1", "2", "Unknown opta"],
+        "ssiId": ["ssi-1", "ssi-2", "ssi-3"],
+        "optaTeamId": ["10", "20", "20"],
+    }
+)
+FIXTURES = pd.DataFrame(
+    {
+        "fixtureId": ["fx-1", "fx-2"],
+        "optaMatchId": ["12345", "99999"],
+        "optaHomeTeamId": ["10", "30"],
+        "optaAwayTeamId": ["20", "40"],
+    }
+)
+
+
+def test_transform_physical_total_returns_polars_with_sides_and_totals():
+    rows = make_summary_rows([("2", "Away Player"), ("1", "Home Player"), ("Player", "Player"), ("7", "Not In Lineups")])
+
+    df = transform_physical_total(rows, FIXTURES, pl.from_pandas(LINEUPS), "12345")
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns[:3] == ["OptaMatchId", "OptaPlayerId", "OptaTeamId"]
+    assert df.columns[-6:] == ["EPTFirstHalf", "EPTSecondHalf", "EPTTotal", "FHTime", "SHTime", "TotalGameTime"]
+    assert df["OptaMatchId"].to_list() == [12345, 12345]
+    assert df["OptaPlayerId"].to_list() == ["1", "2"]
+    assert df["EPTTotal"].to_list() == [55.0, 54.0]
+    assert df["TotalGameTime"].to_list() == pytest.approx([97 + 10 / 60] * 2)
+    assert df["HighSpeedRunning"].to_list() == [5.5, 5.5]
+    assert df.schema["Distance"] == pl.Float32
+    assert df.schema["HighIntensityRuns"] == pl.Int16
+    assert df.schema["FHTime"] == pl.Float32
+
+
+def test_transform_physical_total_matches_unknown_opta_players_and_rejects_other_layouts():
+    rows = make_summary_rows([("ssi-3", "Unknown Player")])
+    rows[1] = ["Home FC v Away FC", "Match ID: 6a1b1c5e-2f0d-4d44-9a55-0f2c3b4d5e6f"]
+
+    df = transform_physical_total(rows, FIXTURES, LINEUPS, 12345)
+    assert df["OptaPlayerId"].to_list() == ["0"]
+
+    rows[9] = rows[9][:20]
+    with pytest.raises(ValueError, match="match 12345: header row has 20 columns, expected 24"):
+        transform_physical_total(rows, FIXTURES, LINEUPS, 12345)
+    with pytest.raises(ValueError, match="match 555: header row has 0 columns"):
+        transform_physical_total_batch(
+            [("12345", make_summary_rows([("1", "Home Player")]), LINEUPS), ("555", rows[:5], LINEUPS)],
+            FIXTURES,
+        )
+
+
+def test_transform_physical_total_skips_blank_and_short_rows():
+    rows = make_summary_rows([("1", "Home Player")]) + [[], [""], ["2"], ["2", "Away Player", "0.5"]]
+
+    df = transform_physical_total(rows, FIXTURES, LINEUPS, "12345")
+
+    assert df["OptaPlayerId"].to_list() == ["1", "2"]
+    assert df["Distance"].to_list() == [1.5, None]
+
+
+def test_transform_physical_total_batch_keeps_match_ids_and_per_match_totals():
+    first = make_summary_rows([("1", "Home Player"), ("2", "Away Player")])
+    second = make_summary_rows([("4", "Visitor")])
+    second[4] = ["Game Time", "", "95:00", "47:00", "48:00"]
+    fixtures = pd.concat(
+        [FIXTURES, pd.DataFrame({"fixtureId": ["fx-3"], "optaMatchId": ["555"], "optaHomeTeamId": ["30"], "optaAwayTeamId": ["40"]})]
+    )
+    lineups_second = pd.DataFrame({"optaId": ["4"], "ssiId": ["ssi-4"], "optaTeamId": ["40"]})
+
+    df = transform_physical_total_batch(
+        [("12345", first, LINEUPS), ("555", second, lineups_second)],
+        fixtures,
+    )
+
+    assert df.select("OptaMatchId", "OptaPlayerId", "TotalGameTime").rows() == [
+        (12345, "1", pytest.approx(97 + 10 / 60)),
+        (12345, "2", pytest.approx(97 + 10 / 60)),
+        (555, "4", 95.0),
+    ]
+    assert df["EPTTotal"].to_list() == [55.0, 54.0, 54.0]
@@ -0,0 +1,107 @@
+from pathlib import Path
+import sys
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.client import DVMS
+from tidy_dvms.sinks import ParquetSink
+
+
+def test_parquet_sink_writes_hive_partitions_and_replaces_them(tmp_path):
+    sink = ParquetSink(tmp_path, row_group_size=2)
+    table = pa.table({"OptaMatchId": [1, 1, 1], "Minute": [1, 2, 3]})
+
+    sink.write_match("8", 2025, "1", {"players_splits": table})
+
+    path = tmp_path / "players_splits" / "competition=8" / "season=2025" / "match_id=1" / "part-0.parquet"
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 2
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    sink.write_match("8", 2025, "1", {"players_splits": table.slice(0, 1)})
+    assert pq.read_table(path).num_rows == 1
+    assert [p.name for p in path.parent.iterdir()] == ["part-0.parquet"]
+
+    lake = pl.scan_parquet(str(tmp_path / "players_splits" / "**" / "*.parquet"), hive_partitioning=True).collect()
+    assert lake["match_id"].to_list() == [1]
+
+    sink.write_match("8", 2025, "1", {"players_splits": table.slice(0, 0)})
+    assert not path.exists()
+
+
+def make_export_client(
+    asset_ids: dict[str, str],
+    ready: dict[str, bool] | None = None,
+    contents: dict[str, str] | None = None,
+) -> DVMS:
+    client = DVMS()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    client._opta_competition_id = "8"
+    client.season_id = 2025
+    client._fixture_assets = [
+        {
+            "fixture_id": f"fixture-{match_id}",
+            "opta_match_id": match_id,
+            "opta_competition_id": "8",
+            "asset_id": f"{asset_id}-{sub_type}",
+            "sub_type": sub_type,
+            "ready": (ready or {}).get(match_id, True),
+        }
+        for match_id, asset_id in asset_ids.items()
+        for sub_type in (DVMS.SUBTYPE_METADATA, DVMS.SUBTYPE_SPLITS)
+    ]
+    client.fetched = []
+    client.built = []
+
+    def fake_fetch_many(opta_match_ids, **kwargs):
+        match_ids = list(opta_match_ids)
+        client.fetched.append(match_ids)
+        return {
+            m: {
+                "assets": {
+                    DVMS.SUBTYPE_METADATA: {"optaId": m},
+                    DVMS.SUBTYPE_SPLITS: (contents or {}).get(m, f"csv-{asset_ids[m]}"),
+                },
+                "errors": {},
+            }
+            for m in match_ids
+        }
+
+    def fake_build_splits_batch(payloads):
+        client.built.append(sorted(payloads))
+        frame = pl.DataFrame(
+            {
+                "OptaMatchId": [int(m) for m in payloads for _ in range(2)],
+                "Minute": [1, 2] * len(payloads),
+            }
+        )
+        return frame, frame, frame, frame.head(0)
+
+    client.fetch_many = fake_fetch_many
+    client._build_splits_batch = fake_build_splits_batch
+    return client
+
+
+def test_export_season_only_exports_new_or_changed_matches(tmp_path):
+    sink = ParquetSink(tmp_path)
+    client = make_export_client({"1": "a", "2": "b", "3": "c"}, ready={"3": False})
+
+    report = client.export_season(sink, outputs=["splits"])
+
+    assert report["exported"] == ["1", "2"]
+    assert report["not_ready"] == ["3"]
+    assert client.fetched == [["1", "2"]]
+    match_dir = tmp_path / "players_splits" / "competition=8" / "season=2025" / "match_id=2"
+    assert pq.read_table(match_dir / "part-0.parquet")["OptaMatchId"].to_pylist() == [2, 2]
+
+    # Same assets: nothing to do. Match 2 re-published: only match 2 is exported again.
+    rerun = make_export_client({"1": "a", "2": "b2", "3": "c"}, ready={"3": False})
+    report = rerun.export_season(ParquetSink(tmp_path), outputs=["splits"])
+
+    assert report["exported"] == ["2"]
+    assert report["unchanged"] == ["1"]
+    assert rerun.fetched == [["2"]]
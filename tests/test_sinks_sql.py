@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+import sys
+
+import pandas as pd
+import sqlalchemy as sa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.sinks import SQLSink
+from tidy_dvms.sinks.base import to_arrow, with_match_id
+from test_sinks_parquet import make_export_client
+from test_sinks_warehouse import splits_frame
+
+
+def test_sql_sink_creates_typed_tables_and_replaces_matches(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'dvms.sqlite'}")
+    sink = SQLSink(engine, batch_size=2)
+
+    assert sink.load("players_splits", splits_frame(1, 100.0)) == 3
+    sink.load("players_splits", splits_frame(2, 100.0))
+    sink.load("players_splits", splits_frame(1, 150.0))
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sa.text('SELECT "OptaMatchId", SUM("TotalDistance"), COUNT(*) FROM players_splits GROUP BY 1 ORDER BY 1')
+        ).all()
+        period = conn.execute(sa.text('SELECT DISTINCT "Period" FROM players_splits')).scalar_one()
+    assert rows == [(1, 450.0, 3), (2, 300.0, 3)]
+    assert period == "1"
+
+    columns = {c["name"]: c["type"] for c in sa.inspect(engine).get_columns("players_splits")}
+    assert isinstance(columns["Minute"], sa.SmallInteger)
+    assert isinstance(columns["OptaMatchId"], sa.BigInteger)
+    assert isinstance(columns["TotalDistance"], sa.Float)
+    assert [ix["column_names"] for ix in sa.inspect(engine).get_indexes("players_splits")] == [["OptaMatchId"]]
+
+
+def test_sql_sink_write_match_reuses_existing_tables(tmp_path):
+    url = f"sqlite:///{tmp_path / 'dvms.sqlite'}"
+    events = pd.DataFrame({"player_name": ["Alex Jones", None], "event_type_name": ["Pass", "Out"]})
+
+    SQLSink(url).write_match("8", 2025, "1", {"events": with_match_id(to_arrow(events), "1")})
+    sink = SQLSink(url)
+    sink.write_match("8", 2025, "1", {"events": with_match_id(to_arrow(events.head(1)), "1")})
+    sink.write_match("8", 2025, "2", {"events": with_match_id(to_arrow(events), "2")})
+
+    with sink.engine.connect() as conn:
+        rows = conn.execute(sa.text('SELECT "OptaMatchId", COUNT(*) FROM events GROUP BY 1 ORDER BY 1')).all()
+    assert rows == [(1, 1), (2, 2)]
+
+
+def test_export_season_into_sql_keeps_state_in_the_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'dvms.sqlite'}"
+    report = make_export_client({"1": "a", "2": "b"}).export_season(SQLSink(url), outputs=["splits"])
+    assert report["exported"] == ["1", "2"]
+
+    rerun = make_export_client({"1": "a", "2": "b2"})
+    report = rerun.export_season(SQLSink(url), outputs=["splits"])
+    assert report["exported"] == ["2"]
+    assert rerun.fetched == [["2"]]
+
+    with sa.create_engine(url).connect() as conn:
+        rows = conn.execute(sa.text("SELECT output, manifest_entry FROM _sync_state WHERE opta_match_id = '2'")).all()
+    assert [output for output, _ in rows] == ["splits"]
+    assert json.loads(rows[0][1])["assets"]
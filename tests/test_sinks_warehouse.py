@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+import sys
+
+import polars as pl
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tidy_dvms.schemas import PERIODS
+from tidy_dvms.sinks import DuckDBSink
+from test_sinks_parquet import make_export_client
+
+
+def splits_frame(match_id: int, distance: float) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "OptaMatchId": [match_id] * 3,
+            "OptaPlayerId": ["11", "11", "12"],
+            "Minute": pl.Series([1, 2, 1], dtype=pl.Int16),
+            "AddedMinute": pl.Series([0, 0, 0], dtype=pl.Int16),
+            "Period": pl.Series(["1", "1", "1"], dtype=PERIODS),
+            "TotalDistance": [distance] * 3,
+        }
+    )
+
+
+def test_duckdb_sink_upserts_are_idempotent(tmp_path):
+    with DuckDBSink(tmp_path / "dvms.duckdb") as sink:
+        sink.upsert("players_splits", splits_frame(1, 100.0))
+        sink.upsert("players_splits", splits_frame(2, 100.0))
+        sink.upsert("players_splits", splits_frame(1, 150.0))
+
+        stored = sink.pl(
+            "SELECT OptaMatchId, SUM(TotalDistance) AS d, COUNT(*) AS n FROM players_splits GROUP BY 1 ORDER BY 1"
+        )
+        assert stored.rows() == [(1, 450.0, 3), (2, 300.0, 3)]
+
+        with pytest.raises(ValueError, match="missing key column"):
+            sink.upsert("players_splits", splits_frame(1, 1.0).drop("Minute"))
+
+
+def test_duckdb_sink_write_match_replaces_the_whole_match(tmp_path):
+    with DuckDBSink(tmp_path / "dvms.duckdb") as sink:
+        sink.write_match("8", 2025, "1", {"players_splits": splits_frame(1, 100.0).to_arrow()})
+        sink.write_match("8", 2025, "2", {"players_splits": splits_frame(2, 100.0).to_arrow()})
+        sink.write_match("8", 2025, "1", {"players_splits": splits_frame(1, 100.0).head(1).to_arrow()})
+
+        assert sink.pl("SELECT OptaMatchId, COUNT(*) FROM players_splits GROUP BY 1 ORDER BY 1").rows() == [(1, 1), (2, 3)]
+
+
+def test_export_season_into_duckdb_keeps_state_in_the_warehouse(tmp_path):
+    path = tmp_path / "dvms.duckdb"
+    with DuckDBSink(path) as sink:
+        report = make_export_client({"1": "a", "2": "b"}).export_season(sink, outputs=["splits"])
+    assert report["exported"] == ["1", "2"]
+
+    with DuckDBSink(path) as sink:
+        rerun = make_export_client({"1": "a", "2": "b2"})
+        report = rerun.export_season(sink, outputs=["splits"])
+        assert report["exported"] == ["2"]
+        assert rerun.fetched == [["2"]]
+        assert sink.pl("SELECT COUNT(*) AS n FROM players_splits")["n"].item() == 4
+        entries = sink.pl("SELECT output, manifest_entry FROM _sync_state WHERE opta_match_id = '2'")
+        assert entries["output"].to_list() == ["splits"]
+        assert json.loads(entries["manifest_entry"].item())["assets"]
@@ -0,0 +1,92 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import tidy_dvms.sync as sync
+from tidy_dvms.client import DVMS
+from tidy_dvms.physical_total.transform_physical_total import transform_physical_total_batch
+from tidy_dvms.sinks import ParquetSink
+from tidy_dvms.sync import SyncManifest
+from test_physical_total import FIXTURES, LINEUPS, make_summary_rows
+from test_sinks_parquet import make_export_client
+
+
+def test_manifest_round_trips_and_explains_changes():
+    manifest = SyncManifest()
+    manifest.record("1", "splits", asset_ids={40: "a-40", 42: "a-42"}, content_hash="h1")
+
+    restored = SyncManifest.from_state(manifest.to_state())
+
+    assert restored.change("1", "splits", {40: "a-40", 42: "a-42"}) is None
+    assert restored.change("1", "splits", {40: "a-40", 42: "b-42"}) == sync.REPUBLISHED
+    assert restored.change("2", "splits", {40: "c-40", 42: "c-42"}) == sync.NEW
+    assert restored.is_identical("1", "splits", "h1")
+    # Entries that cannot be read are synced again.
+    assert SyncManifest.from_state({"1": {"splits": "40:a|42:b"}}).get("1", "splits") is None
+
+
+def test_republished_assets_with_identical_content_are_not_rewritten(tmp_path):
+    make_export_client({"1": "a", "2": "b"}).export_season(ParquetSink(tmp_path), outputs=["splits"])
+
+    # Both matches get new asset ids; only match 2's content actually changed.
+    rerun = make_export_client({"1": "a2", "2": "b2"}, contents={"1": "csv-a"})
+    report = rerun.export_season(ParquetSink(tmp_path), outputs=["splits"])
+
+    assert report["reasons"] == {"1": {"splits": "republished"}, "2": {"splits": "republished"}}
+    assert report["identical"] == ["1"]
+    assert report["exported"] == ["2"]
+    assert rerun.built == [["2"]]
+
+    # The manifest now points at the new asset ids, so nothing is left to do.
+    again = make_export_client({"1": "a2", "2": "b2"}, contents={"1": "csv-a"})
+    report = again.export_season(ParquetSink(tmp_path), outputs=["splits"])
+    assert report["unchanged"] == ["1", "2"]
+    assert again.fetched == []
+
+
+def test_transform_version_bump_rebuilds_every_output(tmp_path, monkeypatch):
+    make_export_client({"1": "a", "2": "b"}).export_season(ParquetSink(tmp_path), outputs=["splits"])
+    monkeypatch.setattr(sync, "TRANSFORM_VERSION", sync.TRANSFORM_VERSION + 1)
+
+    rerun = make_export_client({"1": "a", "2": "b"})
+    report = rerun.export_season(ParquetSink(tmp_path), outputs=["splits"])
+
+    assert report["exported"] == ["1", "2"]
+    assert report["reasons"]["1"] == {"splits": "transform_version"}
+    assert rerun.built == [["1", "2"]]
+    report = make_export_client({"1": "a", "2": "b"}).export_season(ParquetSink(tmp_path), outputs=["splits"])
+    assert report["unchanged"] == ["1", "2"]
+
+
+def test_unsupported_summary_files_fail_and_are_retried(tmp_path):
+    client = make_export_client({"1": "a", "2": "b"})
+    client._fixture_assets += [
+        {**asset, "asset_id": f"{asset['opta_match_id']}-{DVMS.SUBTYPE_SUMMARY}", "sub_type": DVMS.SUBTYPE_SUMMARY}
+        for asset in client._fixture_assets
+        if asset["sub_type"] == DVMS.SUBTYPE_SPLITS
+    ]
+    fetch_splits = client.fetch_many
+
+    def fake_fetch_many(opta_match_ids, **kwargs):
+        results = fetch_splits(opta_match_ids, **kwargs)
+        for match_id, result in results.items():
+            result["assets"][DVMS.SUBTYPE_SUMMARY] = f"summary-{match_id}"
+        return results
+
+    def fake_build_summary_batch(payloads):
+        files = {m: make_summary_rows([("1", "Home Player")]) for m in payloads}
+        if "2" in files:
+            files["2"][9] = files["2"][9][:20]
+        return transform_physical_total_batch([(m, rows, LINEUPS) for m, rows in files.items()], FIXTURES)
+
+    client.fetch_many = fake_fetch_many
+    client._build_summary_batch = fake_build_summary_batch
+
+    report = client.export_season(ParquetSink(tmp_path), outputs=["summary"])
+
+    assert report["exported"] == ["1"]
+    assert isinstance(report["failed"]["2"], ValueError)
+    rerun = client.export_season(ParquetSink(tmp_path), outputs=["summary"])
+    assert rerun["unchanged"] == ["1"]
+    assert rerun["reasons"] == {"2": {"summary": "new"}}
@@ -0,0 +1,183 @@
+from pathlib import Path
+import gzip
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pytest
+
+from tidy_dvms.client import DVMS
+from tidy_dvms.tracking import TRACKING_SCHEMA, iter_tracking_batches, iter_tracking_file, write_tracking_store
+
+
+def make_frames(n: int, period: int = 1) -> list[str]:
+    return [
+        json.dumps(
+            {
+                "period": period,
+                "frameIdx": i,
+                "gameClock": i / 25,
+                "wallClock": 1_700_000_000_000 + i * 40,
+                "live": True,
+                "lastTouch": "home",
+                "homePlayers": [{"playerId": "h1", "optaId": 11, "number": 9, "xyz": [1.0, 2.0, 0.0], "speed": 3.5}],
+                "awayPlayers": [{"playerId": "a1", "optaId": 21, "number": 1, "xyz": [-1.0, 0.5, 0.0], "speed": 0.2}],
+                "ball": {"xyz": [0.0, 0.0, 0.3], "speed": 10.0},
+            }
+        )
+        for i in range(n)
+    ]
+
+
+class FakeStreamResponse:
+    def __init__(self, body: bytes, piece: int = 7) -> None:
+        self.body = body
+        self.piece = piece
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        # Small uneven pieces, the first one a single byte, like a slow network read.
+        yield self.body[:1]
+        for start in range(1, len(self.body), self.piece):
+            yield self.body[start:start + self.piece]
+
+
+def test_tracking_batches_have_fixed_frame_counts():
+    batches = list(iter_tracking_batches(make_frames(7), batch_frames=3))
+
+    assert [b.num_rows for b in batches] == [9, 9, 3]
+    assert batches[0].schema == TRACKING_SCHEMA
+    first = batches[0].to_pylist()[0]
+    assert first["team"] == "home"
+    assert first["opta_player_id"] == "11"
+    assert first["x"] == 1.0
+    assert batches[0].to_pylist()[2]["team"] == "ball"
+
+
+def test_tracking_file_reads_gzip(tmp_path):
+    path = tmp_path / "tracking.jsonl.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("\n".join(make_frames(4)))
+
+    assert sum(b.num_rows for b in iter_tracking_file(path, batch_frames=2)) == 12
+
+
+def test_client_tracking_streams_sub_type_38(tmp_path):
+    client = DVMS()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    client._fixture_assets = [
+        {
+            "fixture_id": "fixture-1",
+            "opta_match_id": "12345",
+            "opta_competition_id": "8",
+            "asset_id": "tracking-1",
+            "sub_type": DVMS.SUBTYPE_TRACKING,
+            "ready": True,
+        }
+    ]
+    requested = []
+
+    def fake_get(url, *, stream=False):
+        requested.append((url, stream))
+        return FakeStreamResponse("\n".join(make_frames(5)).encode())
+
+    client._get = fake_get
+
+    streamed = list(client.tracking(opta_match_id="g12345", batch_frames=2))
+    on_disk = list(client.tracking(opta_match_id="12345", batch_frames=5, path=tmp_path / "t.jsonl"))
+
+    assert [b.num_rows for b in streamed] == [6, 6, 3]
+    assert [b.num_rows for b in on_disk] == [15]
+    assert requested[0] == (f"{DVMS.BASE_URL}/dvms/8/fixtures/fixture-1/download/tracking-1", True)
+
+
+def test_gzipped_tracking_reads_the_same_streamed_and_from_disk(tmp_path):
+    # Two gzip members, as produced by appending to a .jsonl.gz file.
+    frames = make_frames(6)
+    body = gzip.compress("\n".join(frames[:4]).encode() + b"\n") + gzip.compress("\n".join(frames[4:]).encode())
+    client = DVMS()
+    client._ensure_fixtures_loaded = lambda **kwargs: None
+    client._fixture_assets = [
+        {
+            "fixture_id": "fixture-1",
+            "opta_match_id": "12345",
+            "opta_competition_id": "8",
+            "asset_id": "tracking-1",
+            "sub_type": DVMS.SUBTYPE_TRACKING,
+            "ready": True,
+        }
+    ]
+    client._get = lambda url, *, stream=False: FakeStreamResponse(body)
+
+    streamed = list(client.tracking(opta_match_id="12345", batch_frames=4))
+    on_disk = list(client.tracking(opta_match_id="12345", batch_frames=4, path=tmp_path / "t.jsonl.gz"))
+
+    assert [b.num_rows for b in streamed] == [b.num_rows for b in on_disk] == [12, 6]
+    assert streamed[1].column("frame_idx").to_pylist()[-1] == 5
+
+
+def test_tracking_store_window_reads_by_period_and_clock(tmp_path):
+    from tidy_dvms.tracking import TrackingStore, write_tracking_store
+
+    # One frame every 10 seconds for 5 minutes in each half.
+    lines = [
+        json.dumps({"period": period, "frameIdx": i, "gameClock": i * 10.0, "ball": {"xyz": [0, 0, 0]}})
+        for period in (1, 2)
+        for i in range(30)
+    ]
+    path = write_tracking_store(iter_tracking_batches(lines, batch_frames=7), tmp_path / "t.arrow")
+
+    with TrackingStore(path) as store:
+        window = store.window(period=2, start="1:30", end="3:00")
+
+        assert store.periods() == [1, 2]
+        assert store.read_all().num_rows == 60
+        assert window.column("game_clock").to_pylist() == [90.0 + 10 * i for i in range(9)]
+        assert set(window.column("period").to_pylist()) == {2}
+        assert store.row_ranges(2, 90, 180) == [(36, 6), (42, 6)]
+
+
+def test_tracking_store_rebuilds_incomplete_stores_and_writes_atomically(tmp_path):
+    from tidy_dvms.tracking import is_complete_tracking_store
+
+    path = tmp_path / "t.arrow"
+    lines = make_frames(4)
+    client = DVMS()
+    built = []
+
+    def fake_tracking(**kwargs):
+        built.append(kwargs["opta_match_id"])
+        return iter_tracking_batches(lines, batch_frames=2)
+
+    client.tracking = fake_tracking
+
+    # A store left without its index (interrupted download) is rebuilt, then reused.
+    path.write_bytes(b"truncated")
+    client.tracking_store(opta_match_id="1", path=path).close()
+    assert is_complete_tracking_store(path)
+    client.tracking_store(opta_match_id="1", path=path).close()
+    assert built == ["1"]
+
+    # An index written for another file does not validate this one.
+    path.write_bytes(path.read_bytes()[:-10])
+    assert not is_complete_tracking_store(path)
+    with client.tracking_store(opta_match_id="1", path=path) as store:
+        assert store.read_all().num_rows == 12
+    assert built == ["1", "1"]
+
+    # A download failing half way leaves the previous store and no temp files behind.
+    def failing_batches():
+        yield from iter_tracking_batches(lines[:2])
+        raise RuntimeError("connection reset")
+
+    size = path.stat().st_size
+    with pytest.raises(RuntimeError, match="connection reset"):
+        write_tracking_store(failing_batches(), path)
+    assert path.stat().st_size == size and is_complete_tracking_store(path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["t.arrow", "t.arrow.index.json"]